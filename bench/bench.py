@@ -0,0 +1,208 @@
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import statistics
+import subprocess
+
+# Benchmark for both graders on synthetic cohorts (bench/corpus.py).
+#
+#   python bench/bench.py                         # 10, 100 and 1000 students
+#   python bench/bench.py --json before.json
+#   python bench/bench.py --json after.json --compare before.json
+#   python bench/bench.py --cds 20                # JVM start-up per student, needs a JDK
+#
+# Two measurements per (module, size):
+#   - end-to-end: the grader script itself, as a subprocess, without cache
+#     or per-student report (students/second, startup included)
+#   - phases: grade_student's work split into discovery (folder index and
+#     file lookup), I/O (reading sources) and rules (keyword scan, lexing and rubric
+#     evaluation), from the profiler's phase table, in-process
+#
+# --cds runs the Main of N students of each module (as --run does, one JVM
+# each) with and without the class-data sharing archive (grading/cds.py,
+# built into <corpus-dir>/build first) and reports what the archive saves per
+# student.
+#
+# Every number is the median of --repeat runs. Results carry the commit
+# they were measured on; --compare prints the relative change per metric.
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from corpus import CORPUS_VERSION, generate
+from grading import profile
+from grading.cli import find_student_folders, load_module
+from grading.execute import find_main_class
+from grading.index import open_index
+
+SCRIPTS = {"modul2": "grade.py", "modul1": "grade_modul1_v2.py"}
+DEFAULT_SIZES = [10, 100, 1000]
+METRICS = ("e2e_s", "students_per_s", "discovery_s", "io_s", "rules_s")
+RULE_PHASES = ("scan", "lex", "checks", "scoring")
+
+
+def git_state():
+    def git(*args):
+        proc = subprocess.run(["git", "-C", REPO_ROOT] + list(args), stdout=subprocess.PIPE,
+                              stderr=subprocess.DEVNULL, text=True)
+        return proc.stdout.strip() if proc.returncode == 0 else None
+    status = git("status", "--porcelain", "--untracked-files=no")
+    return {"commit": git("rev-parse", "--short", "HEAD"), "dirty": bool(status)}
+
+def end_to_end(module, root, jobs):
+    cmd = [sys.executable, os.path.join(REPO_ROOT, SCRIPTS[module]), root, "--no-cache", "--no-report", "-j", str(jobs)]
+    start = time.perf_counter()
+    subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+    return time.perf_counter() - start
+
+def phases(module, root):
+    # Seconds spent in discovery, I/O and rules over the whole cohort, read
+    # off the --profile phase table (grading/profile.py)
+    grader = load_module(module)
+    profiler = profile.enable()
+    for student in find_student_folders(root):
+        path = os.path.join(root, student)
+        with profile.phase("discovery"):
+            index = open_index(path)
+        grader.evaluate_student(path, index)
+    phases = {name: total for name, (count, total, worst) in profiler.rows("phases")}
+    return {
+        "discovery_s": phases.get("discovery", 0.0),
+        "io_s": phases.get("read", 0.0),
+        "rules_s": sum(phases.get(name, 0.0) for name in RULE_PHASES),
+    }
+
+def run(args):
+    results = []
+    for module in args.modules:
+        for size in args.sizes:
+            root = os.path.join(args.corpus_dir, f"{module}-{size}")
+            generate(root, module, size, args.seed)
+            row = {"module": module, "students": size}
+            if not args.no_e2e:
+                e2e = statistics.median(end_to_end(module, root, args.jobs) for _ in range(args.repeat))
+                row["e2e_s"] = e2e
+                row["students_per_s"] = size / e2e
+            samples = [phases(module, root) for _ in range(args.repeat)]
+            for key in ("discovery_s", "io_s", "rules_s"):
+                row[key] = statistics.median(s[key] for s in samples)
+            results.append(row)
+            print_row(row)
+    return results
+
+def cds_startup(module, root, students, repeat, build_dir):
+    # Median seconds of one student's Main JVM with and without the archive,
+    # alternating per run; None when the archive could not be built
+    from grading import cds
+    from grading.execute import MainStage
+    from grading.junit import collect_sources, student_id
+    for label, path, message, seconds in cds.setup(build_dir, [module]):
+        if path is None:
+            print(f"[!] {label}: {message}")
+    grader = load_module(module)
+    stage = MainStage([], grader.MAIN_INPUT, build_dir)
+    stage.prepare()
+    shared = stage.share
+    if not shared:
+        return None
+    paths = [os.path.join(root, student) for student in find_student_folders(root)[:students]]
+    submissions = collect_sources(paths, grader.find_source_root, build_dir)
+    compiled = stage.compile_cache.compile_all(submissions)
+    runs = []
+    for path, sources in submissions:
+        classes, error = compiled[path]
+        main_class = None if error else find_main_class(sources)
+        if main_class is not None:
+            runs.append((student_id(path), classes, main_class))
+    if not runs:
+        return None
+    timings = {"off": [], "on": []}
+    for _ in range(repeat):
+        for sid, classes, main_class in runs:
+            for key, flags in (("off", []), ("on", shared)):
+                stage.share = flags
+                timings[key].append(stage.run_one(sid, classes, main_class).seconds)
+    off, on = statistics.median(timings["off"]), statistics.median(timings["on"])
+    return {"module": module, "students": len(runs), "without_s": off, "with_s": on, "saved_ms": (off - on) * 1000}
+
+def run_cds(args):
+    from grading.junit import java_available
+    if not java_available():
+        print("\n[!] java/javac tidak ditemukan, pengukuran CDS dilewati.")
+        return []
+    print(f"\nStart-up JVM Main per mahasiswa (median dari {args.repeat}x):")
+    print("  ".join([f"{'module':<7}", f"{'n':>6}", f"{'tanpa arsip':>12}", f"{'dengan arsip':>12}", f"{'hemat':>14}"]))
+    rows = []
+    build_dir = os.path.abspath(os.path.join(args.corpus_dir, "build"))
+    for module in args.modules:
+        root = os.path.join(args.corpus_dir, f"{module}-{args.cds}")
+        generate(root, module, args.cds, args.seed)
+        row = cds_startup(module, root, args.cds, args.repeat, build_dir)
+        if row is None:
+            print(f"{module:<7}  arsip CDS atau Main tidak tersedia")
+            continue
+        rows.append(row)
+        print("  ".join([f"{module:<7}", f"{row['students']:>6}", f"{row['without_s'] * 1000:>10.0f}ms",
+                         f"{row['with_s'] * 1000:>10.0f}ms",
+                         f"{row['saved_ms']:>6.0f}ms ({row['saved_ms'] / (row['without_s'] * 1000) * 100:.0f}%)"]))
+    return rows
+
+def print_row(row, base=None):
+    cells = [f"{row['module']:<7}", f"{row['students']:>6}"]
+    for key in METRICS:
+        value = row.get(key)
+        cell = "-" if value is None else (f"{value:.1f}" if key == "students_per_s" else f"{value:.3f}")
+        if base is not None and value is not None and base.get(key):
+            cell += f" ({(value - base[key]) / base[key] * 100:+.0f}%)"
+        cells.append(f"{cell:>18}")
+    print("  ".join(cells))
+
+def print_header():
+    print("  ".join([f"{'module':<7}", f"{'n':>6}"] + [f"{key:>18}" for key in METRICS]))
+
+def compare(results, baseline_path):
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    meta = baseline["meta"]
+    if meta.get("corpus_version") != CORPUS_VERSION:
+        print(f"[!] {baseline_path} diukur dengan corpus versi lain, hasil tidak sebanding.")
+    base = {(r["module"], r["students"]): r for r in baseline["results"]}
+    print(f"\nDibandingkan dengan {meta.get('commit')}{' (dirty)' if meta.get('dirty') else ''}:")
+    print_header()
+    for row in results:
+        print_row(row, base.get((row["module"], row["students"])))
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark grade.py dan grade_modul1_v2.py pada cohort sintetis")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Jumlah mahasiswa per cohort")
+    parser.add_argument("--modules", nargs="+", choices=sorted(SCRIPTS), default=["modul2", "modul1"])
+    parser.add_argument("--repeat", type=int, default=3, help="Jumlah pengulangan (median yang dilaporkan)")
+    parser.add_argument("--seed", type=int, default=0, help="Seed generator corpus")
+    parser.add_argument("--jobs", type=int, default=1, help="--jobs untuk run end-to-end")
+    parser.add_argument("--corpus-dir", default=".bench_corpus", help="Lokasi cohort sintetis")
+    parser.add_argument("--no-e2e", action="store_true", help="Lewati run end-to-end (hanya ukur fase)")
+    parser.add_argument("--json", help="Simpan hasil ke file JSON")
+    parser.add_argument("--compare", help="File JSON hasil run sebelumnya untuk dibandingkan")
+    parser.add_argument("--cds", type=int, metavar="N", help="Ukur start-up JVM Main per mahasiswa dengan dan tanpa arsip CDS (N mahasiswa)")
+    args = parser.parse_args()
+
+    meta = dict(git_state(), corpus_version=CORPUS_VERSION, seed=args.seed, repeat=args.repeat, jobs=args.jobs,
+                python=platform.python_version(), platform=platform.platform(), cpus=os.cpu_count())
+    print(f"Commit {meta['commit']}{' (dirty)' if meta['dirty'] else ''}, Python {meta['python']}, {meta['cpus']} CPU")
+    print_header()
+    results = run(args)
+    report = {"meta": meta, "results": results}
+    if args.cds:
+        report["cds"] = run_cds(args)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    if args.compare:
+        compare(results, args.compare)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,331 @@
+import os
+import json
+import random
+import shutil
+
+# Synthetic cohorts for the benchmark (bench/bench.py).
+#
+# Every student gets one of the layouts the discovery code has to handle,
+# round-robin, and a random subset of the rubric features, so the rules take
+# different paths. Generation is deterministic for a given (module, size,
+# seed, CORPUS_VERSION): results from different commits are measured on
+# byte-identical cohorts. Bump CORPUS_VERSION whenever the output changes.
+
+CORPUS_VERSION = 1
+MANIFEST = "corpus.json"
+
+LAYOUTS = (
+    "src_model",      # src/Model/*.java + src/Main.java
+    "no_src",         # Model/*.java + Main.java at the root of the folder
+    "nested_ide",     # NetBeansProjects/<proj>/src/... plus .idea, .git, out/, build/
+    "single_file",    # everything in one Main.java
+    "indonesian",     # Indonesian names (modul1: Kendaraan/Pelanggan/JenisKendaraan)
+    "large",          # thousands of extra lines per file
+    "non_utf8",       # windows-1252 encoded sources
+)
+
+FIRST_NAMES = ["Budi", "Siti", "Agus", "Dewi", "Rizky", "Putri", "Andi", "Ayu", "Fajar", "Nur", "Eko", "Intan"]
+
+# Modul 2: Player & Score
+
+PLAYER = """{package}import java.util.UUID;
+import java.time.LocalDateTime;
+
+// {tag}
+public class Player{implements} {{
+    private UUID playerId;
+    private String {username};
+    private LocalDateTime createdAt;
+{numeric}
+    public Player(String {username}) {{
+        this.playerId = {uuid};
+        this.{username} = {username};
+        this.createdAt = {now};
+    }}
+{methods}{filler}}}
+"""
+
+PLAYER_NUMERIC = """    private int highScore = 0;
+    private int totalCoins;
+    private double totalDistance;
+"""
+
+PLAYER_METHODS = {
+    "update": """
+    public void updateHighScore(int newScore) {{
+        if (newScore > highScore) {{
+            highScore = newScore;
+        }}
+    }}
+""",
+    "coins": """
+    public void addCoins(int coins) {{
+        totalCoins += coins;
+    }}
+""",
+    "distance": """
+    public void addDistance(double d) {{
+        totalDistance = totalDistance + d;
+    }}
+""",
+    "show": """
+    @Override
+    public void showDetail() {{
+        System.out.println("{label}: " + {username});
+    }}
+""",
+}
+
+SCORE = """{package}import java.util.UUID;
+
+// {tag}
+public class Score{implements} {{
+    private UUID scoreId;
+    private UUID playerId;
+    private int value;
+    private int coinsCollected;
+
+    public Score(UUID playerId, int value, int coinsCollected) {{
+        this.scoreId = UUID.randomUUID();
+        this.playerId = playerId;
+        this.value = value;
+        this.coinsCollected = coinsCollected;
+    }}
+
+    public void showDetail() {{
+        System.out.println("Score " + value);
+    }}
+{filler}}}
+"""
+
+SHOWDETAIL = """{package}
+// {tag}
+public interface ShowDetail {{
+    void showDetail();
+}}
+"""
+
+MAIN2 = """{imports}
+// {tag}
+public class Main {{
+    public static void main(String[] args) {{
+        Player p1 = new Player("{first}");
+        Player p2 = new Player("{second}");
+        Score s1 = new Score(p1.getClass() == null ? null : java.util.UUID.randomUUID(), 100, 5);
+{calls}    }}
+{filler}}}
+"""
+
+# Modul 1: Vehicle & Customer
+
+VEHICLE_TYPE = """{package}
+// {tag}
+public enum {vt} {{
+    {constants}
+}}
+"""
+
+VEHICLE = """{package}
+// {tag}
+public class {vehicle} {{
+{fields}
+    public {vehicle}(String {brand}, int {year}, {vt} {type}, double {price}) {{
+        this.{brand} = {brand};
+        this.{year} = {year};
+    }}
+
+    public double getPrice() {{
+        return {price};
+    }}
+{show}{filler}}}
+"""
+
+CUSTOMER = """{package}
+// {tag}
+public class {customer} {{
+    private String {name};
+    private {vehicle} {vfield};
+
+    public {customer}(String {name}, {vehicle} {vfield}) {{
+        this.{name} = {name};
+        this.{vfield} = {vfield};
+    }}
+{total}
+    public void showDetail() {{
+        System.out.println("{label}: " + {name});
+    }}
+{filler}}}
+"""
+
+MAIN1 = """{imports}
+// {tag}
+public class Main {{
+    public static void main(String[] args) {{
+        {vehicle} v = new {vehicle}("Toyota", 2020, {vt}.{first_constant}, 250000000.0);
+        {customer} c = new {customer}("{first}", v);
+{calls}    }}
+{filler}}}
+"""
+
+FILLER_METHOD = """
+    // Helper {n}: catatan panjang supaya file besar, tidak dinilai.
+    /* {{ "block": {n} }} */
+    private int helper{n}(int x) {{
+        int total = 0;
+        for (int i = 0; i < x; i++) {{
+            total += i * {n};
+        }}
+        return total;
+    }}
+"""
+
+
+def _filler(layout, rng):
+    if layout != "large":
+        return ""
+    return "".join(FILLER_METHOD.format(n=n) for n in range(rng.randint(300, 600)))
+
+def _maybe(rng, p=0.8):
+    return rng.random() < p
+
+
+def modul2_files(student, layout, rng):
+    indo = layout == "indonesian"
+    package = "package Model;\n" if _maybe(rng, 0.85) else ""
+    username = "namaPengguna" if indo else "username"
+    tag = f"{student} ({layout})"
+    methods = "".join(body for name, body in PLAYER_METHODS.items() if _maybe(rng))
+    player = PLAYER.format(
+        package=package, tag=tag, username=username,
+        implements=" implements ShowDetail" if _maybe(rng) else "",
+        numeric=PLAYER_NUMERIC if _maybe(rng) else "",
+        uuid="UUID.randomUUID()" if _maybe(rng) else "null",
+        now="LocalDateTime.now()" if _maybe(rng) else "null",
+        methods=methods.format(username=username, label="Pemain" if indo else "Player"),
+        filler=_filler(layout, rng),
+    )
+    score = SCORE.format(package=package, tag=tag, implements=" implements ShowDetail" if _maybe(rng) else "",
+                         filler=_filler(layout, rng))
+    showdetail = SHOWDETAIL.format(package=package, tag=tag)
+    calls = ""
+    for call in ("p1.updateHighScore(500);", "p1.addCoins(10);", "p1.showDetail();", "s1.showDetail();"):
+        if _maybe(rng):
+            calls += "        " + call + "\n"
+    first, second = rng.sample(FIRST_NAMES, 2)
+
+    if layout == "single_file":
+        # Non-public classes in front of Main, package-less
+        body = "\n".join(
+            src.replace("public class", "class").replace("public interface", "interface").replace("package Model;\n", "")
+            for src in (showdetail, player, score))
+        body = "import java.util.UUID;\nimport java.time.LocalDateTime;\n" + body.replace("import java.util.UUID;\n", "").replace("import java.time.LocalDateTime;\n", "")
+        main = MAIN2.format(imports="", tag=tag, first=first, second=second, calls=calls, filler="")
+        return {"Main.java": body + "\n" + main}
+
+    main = MAIN2.format(imports="import Model.*;\n" if package else "", tag=tag, first=first, second=second,
+                        calls=calls, filler=_filler(layout, rng))
+    model = {"Player.java": player, "Score.java": score, "ShowDetail.java": showdetail}
+    return _place(layout, model, main, rng)
+
+def modul1_files(student, layout, rng):
+    indo = layout == "indonesian" or (layout != "single_file" and _maybe(rng, 0.2))
+    names = {
+        "vehicle": "Kendaraan" if indo else "Vehicle",
+        "vt": "JenisKendaraan" if indo else "VehicleType",
+        "customer": "Pelanggan" if indo else rng.choice(["Customer", "Customer", "Costumer"]),
+        "brand": "merk" if indo else "brand",
+        "year": "tahun" if indo else "year",
+        "type": "jenis" if indo else "type",
+        "price": "harga" if indo else "price",
+        "name": "nama" if indo else "name",
+        "vfield": "kendaraan" if indo else "vehicle",
+    }
+    package = "package Model;\n" if _maybe(rng, 0.6) else ""
+    tag = f"{student} ({layout})"
+    constants = ["MOBIL", "MOTOR", "TRUK"] if indo else ["CAR", "MOTORCYCLE", "TRUCK"]
+    constants = [c for c in constants if _maybe(rng, 0.9)] or constants[:1]
+    fields = [f"    private String {names['brand']};", f"    private int {names['year']};",
+              f"    private {names['vt']} {names['type']};", f"    private double {names['price']};"]
+    fields = [f for f in fields if _maybe(rng, 0.85)]
+    label = "Pelanggan" if indo else "Customer"
+    vt = VEHICLE_TYPE.format(package=package, tag=tag, vt=names["vt"], constants=", ".join(constants))
+    vehicle = VEHICLE.format(package=package, tag=tag, fields="\n".join(fields), filler=_filler(layout, rng),
+                             show="\n    public void showDetail() {\n        System.out.println(\"Detail\");\n    }\n" if _maybe(rng) else "",
+                             **names)
+    total = ""
+    if _maybe(rng):
+        total = f"\n    public double getTotalPrice() {{\n        return {names['vfield']}.getPrice();\n    }}\n"
+    customer = CUSTOMER.format(package=package, tag=tag, total=total, label=label, filler=_filler(layout, rng), **names)
+    calls = "        c.showDetail();\n" if _maybe(rng) else ""
+    first = rng.choice(FIRST_NAMES)
+
+    if layout == "single_file":
+        body = "\n".join(src.replace("public enum", "enum").replace("public class", "class").replace(package, "")
+                         for src in (vt, vehicle, customer))
+        main = MAIN1.format(imports="", tag=tag, first=first, first_constant=constants[0], calls=calls, filler="", **names)
+        return {"Main.java": body + "\n" + main}
+
+    main = MAIN1.format(imports="import Model.*;\n" if package else "", tag=tag, first=first,
+                        first_constant=constants[0], calls=calls, filler=_filler(layout, rng), **names)
+    model = {names["vt"] + ".java": vt, names["vehicle"] + ".java": vehicle, names["customer"] + ".java": customer}
+    return _place(layout, model, main, rng)
+
+def _place(layout, model, main, rng):
+    # Relative path -> content for one submission
+    if layout == "no_src":
+        files = {os.path.join("Model", name): src for name, src in model.items()}
+        files["Main.java"] = main
+        return files
+    base = "src"
+    files = {}
+    if layout == "nested_ide":
+        project = rng.choice(["TugasModul", "Praktikum", "ProjectOOP"]) + str(rng.randint(1, 9))
+        base = os.path.join("NetBeansProjects", project, "src")
+        root = os.path.join("NetBeansProjects", project)
+        files[os.path.join(root, ".idea", "workspace.xml")] = "<project version=\"4\"/>\n" * 50
+        files[os.path.join(root, "nbproject", "project.properties")] = "src.dir=src\n"
+        for k in range(rng.randint(5, 20)):
+            files[os.path.join(root, ".git", "objects", f"{k:02x}", f"{rng.getrandbits(64):016x}")] = "x" * 200
+        for name in model:
+            files[os.path.join(root, "out", "production", project, "Model", name[:-5] + ".class")] = b"\xca\xfe\xba\xbe" + bytes(400)
+        files[os.path.join(root, "build", "classes", "Main.class")] = b"\xca\xfe\xba\xbe" + bytes(400)
+    folder = "Model" if rng.random() < 0.7 else "model"
+    for name, src in model.items():
+        files[os.path.join(base, folder, name)] = src
+    files[os.path.join(base, "Main.java")] = main
+    return files
+
+
+def _write(path, content, encoding):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    if isinstance(content, str):
+        content = content.encode(encoding, "replace")
+    with open(path, "wb") as f:
+        f.write(content)
+
+def generate(root, module, size, seed=0):
+    # Writes <root>/<student>/... for `size` students and returns the manifest.
+    # An existing corpus with the same manifest is reused as-is.
+    manifest = {"version": CORPUS_VERSION, "module": module, "size": size, "seed": seed}
+    try:
+        with open(os.path.join(root, MANIFEST), "r", encoding="utf-8") as f:
+            if json.load(f) == manifest:
+                return manifest
+    except (OSError, ValueError):
+        pass
+    shutil.rmtree(root, ignore_errors=True)
+    os.makedirs(root)
+    make = modul2_files if module == "modul2" else modul1_files
+    for i in range(size):
+        layout = LAYOUTS[i % len(LAYOUTS)]
+        student = f"{i:05d}_{FIRST_NAMES[i % len(FIRST_NAMES)]}_{layout}"
+        rng = random.Random(f"{seed}:{module}:{i}")
+        encoding = "cp1252" if layout == "non_utf8" else "utf-8"
+        for rel, content in make(student, layout, rng).items():
+            if encoding != "utf-8" and isinstance(content, str):
+                # Accented text that is not valid UTF-8 once encoded
+                content = content.replace("// " + student, "// " + student + " - café, déjà vu")
+            _write(os.path.join(root, student, rel), content, encoding)
+    with open(os.path.join(root, MANIFEST), "w", encoding="utf-8") as f:
+        json.dump(manifest, f)
+    return manifest
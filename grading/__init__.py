@@ -0,0 +1 @@
+# Shared helpers for the grading scripts (grade.py, grade_modul1_v2.py).
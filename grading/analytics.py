@@ -0,0 +1,282 @@
+import os
+import sys
+import argparse
+
+from grading.checkpoint import read_records
+from grading.cli import available_modules, load_module
+from grading.store import DEFAULT_DB, ResultStore, StoreError
+
+try:
+    import numpy as np
+except ImportError:        # optional: only this command needs it
+    np = None
+
+# Cohort statistics over the per-criterion points of graded runs:
+#
+#   python -m grading.analytics                          # newest run of every cohort folder in grades.sqlite
+#   python -m grading.analytics --module modul2 --run 3 --run 5
+#   python -m grading.analytics nilai-2024.jsonl .grade_checkpoint/*.jsonl
+#
+# Results come from the --db database or from --format jsonl / checkpoint
+# files. Every module becomes one matrix: a row per student, a column per
+# criterion (NaN where it wasn't scored, i.e. an optional section that didn't
+# run), plus a vector of totals and the group (class) of each row. A group is
+# the folder a run graded (one class or semester), or the file the records
+# came from. Every statistic is computed
+# with whole-matrix numpy operations, never a Python loop over students:
+#
+#   criteria   share of students that got any / the best points per criterion
+#   histogram  of the total scores
+#   groups     count, mean, median, spread and pass rate per group, and the
+#              criterion where the group lags the whole cohort most
+#   outliers   totals far from their group's median (robust z-score over the
+#              median absolute deviation, so outliers don't hide themselves)
+
+PASS_SCORE = 60
+OUTLIER_Z = 3.5
+
+
+class Cohort:
+    # One module's results in columns
+    def __init__(self, module, table, required=None):
+        # table: (group label, student) -> (score or None, {criterion: points})
+        # required: criterion keys every graded student is scored on
+        self.module = module
+        keys = list(table)
+        self.labels = list(dict.fromkeys(label for label, _ in keys))
+        index = {label: i for i, label in enumerate(self.labels)}
+        self.students = [student for _, student in keys]
+        self.group = np.array([index[label] for label, _ in keys], dtype=np.intp)
+        self.totals = np.array([np.nan if score is None else score for score, _ in table.values()], dtype=float)
+        # Columns in order of first appearance, which is rubric order
+        columns = {}
+        rows, cols, values = [], [], []
+        for row, (_, criteria) in enumerate(table.values()):
+            for key, points in criteria.items():
+                rows.append(row)
+                cols.append(columns.setdefault(key, len(columns)))
+                values.append(points)
+        self.criteria = list(columns)
+        self.points = np.full((len(keys), len(columns)), np.nan)
+        self.points[rows, cols] = values
+        if required:
+            # Results stored before criteria of missing files were recorded
+            # lack them; for a graded student that is 0 points, not "not
+            # scored". Only optional sections (JUnit) keep NaN.
+            fill = np.array([key in required for key in self.criteria], dtype=bool)
+            graded = ~np.isnan(self.totals)
+            self.points[np.isnan(self.points) & fill & graded[:, None]] = 0
+
+    def __len__(self):
+        return len(self.students)
+
+
+def store_rows(path, runs=None, module=None):
+    # (module, group, student, score, criteria) of stored runs. Without runs:
+    # the newest run of every (module, folder, shard), so a class graded
+    # again (or rescored) counts once.
+    store = ResultStore(path, readonly=True)
+    try:
+        if not runs:
+            newest = {}
+            for run, run_module, _, root, shard, *_ in store.runs(module):
+                newest[run_module, root, shard] = run
+            runs = sorted(newest.values())
+        for run in runs:
+            info = store.run_info(run)
+            if module and info["module"] != module:
+                continue
+            label = os.path.basename(os.path.normpath(info["root"])) if info["root"] else f"run {run}"
+            points = {}
+            for student, key, value in store.criterion_points(run):
+                points.setdefault(student, {})[key] = value
+            for student, (score, _) in store.scores(run).items():
+                yield info["module"], label, student, score, points.get(student, {})
+    finally:
+        store.close()
+
+def file_rows(paths, module=None):
+    for path in paths:
+        header, records = read_records(path)
+        label = os.path.splitext(os.path.basename(path))[0]
+        for record in records:
+            record_module = record.get("module") or (header or {}).get("module")
+            if module and record_module != module:
+                continue
+            yield record_module, label, record["student"], record.get("score"), record.get("criteria") or {}
+
+def build(rows):
+    # module -> Cohort. A student listed twice in one group keeps the last row.
+    tables = {}
+    for module, label, student, score, criteria in rows:
+        tables.setdefault(module, {})[label, student] = (score, criteria)
+    return {module: Cohort(module, table, required_criteria(module))
+            for module, table in sorted(tables.items(), key=lambda item: str(item[0]))}
+
+def required_criteria(module):
+    # The module's Rubric.required_criteria, None for an unknown module
+    if module not in available_modules():
+        return None
+    return load_module(module).RUBRIC.required_criteria
+
+def _group_median(group, values, count):
+    # Median of values per group: one sort by (group, value), then the middle
+    # element(s) of every group's slice
+    order = np.lexsort((values, group))
+    ordered = values[order]
+    sizes = np.bincount(group, minlength=count)
+    starts = np.cumsum(sizes) - sizes
+    median = np.full(count, np.nan)
+    has = sizes > 0
+    low = starts[has] + (sizes[has] - 1) // 2
+    high = starts[has] + sizes[has] // 2
+    median[has] = (ordered[low] + ordered[high]) / 2
+    return median
+
+def criterion_rates(cohort):
+    # Per criterion: students scored, share with any points, share with the
+    # best points anyone got, and those best points
+    points = cohort.points
+    scored = (~np.isnan(points)).sum(axis=0)
+    best = np.nanmax(points, axis=0) if len(cohort) else np.zeros(len(cohort.criteria))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        got = (points > 0).sum(axis=0) / scored
+        full = (points >= best).sum(axis=0) / scored
+    return scored, got, full, best
+
+def group_stats(cohort):
+    # Per group: graded students, errors, mean, median, standard deviation and
+    # pass rate of the totals
+    count = len(cohort.labels)
+    ok = ~np.isnan(cohort.totals)
+    group, totals = cohort.group[ok], cohort.totals[ok]
+    n = np.bincount(group, minlength=count)
+    errors = np.bincount(cohort.group[~ok], minlength=count)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.bincount(group, totals, count) / n
+        spread = np.sqrt(np.maximum(np.bincount(group, totals * totals, count) / n - mean * mean, 0))
+        passed = np.bincount(group, totals >= PASS_SCORE, count) / n
+    return n, errors, mean, _group_median(group, totals, count), spread, passed
+
+def group_gaps(cohort, got):
+    # Per group: the criterion whose any-points rate lags the cohort's most,
+    # and by how much (negative share), via a group x student indicator matrix
+    count = len(cohort.labels)
+    member = np.zeros((count, len(cohort)))
+    member[cohort.group, np.arange(len(cohort))] = 1
+    valid = ~np.isnan(cohort.points)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        rates = (member @ (cohort.points > 0)) / (member @ valid)
+    gap = rates - got
+    worst = np.where(np.isnan(gap), np.inf, gap).argmin(axis=1) if cohort.criteria else np.zeros(count, dtype=np.intp)
+    return worst, gap[np.arange(count), worst] if cohort.criteria else np.full(count, np.nan)
+
+def outliers(cohort, threshold=OUTLIER_Z):
+    # (row, robust z) of totals more than threshold from their group's
+    # median, most extreme first
+    count = len(cohort.labels)
+    ok = np.flatnonzero(~np.isnan(cohort.totals))
+    group, totals = cohort.group[ok], cohort.totals[ok]
+    median = _group_median(group, totals, count)[group]
+    deviation = np.abs(totals - median)
+    mad = _group_median(group, deviation, count)
+    # A group where most students share one score has MAD 0; fall back to the
+    # mean absolute deviation (scaled to match a normal distribution's MAD)
+    sizes = np.bincount(group, minlength=count)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean_dev = np.bincount(group, deviation, count) / sizes * 1.2533 * 0.6745
+        scale = np.where(mad > 0, mad, mean_dev)[group]
+        z = np.where(scale > 0, 0.6745 * (totals - median) / scale, 0)
+    # Too few students for a meaningful median
+    z[sizes[group] < 5] = 0
+    flagged = np.flatnonzero(np.abs(z) > threshold)
+    flagged = flagged[np.argsort(-np.abs(z[flagged]), kind="stable")]
+    return ok[flagged], z[flagged]
+
+def _percent(share):
+    return "-" if np.isnan(share) else f"{share * 100:5.1f}%"
+
+def report(cohort, bins=10, top=10, threshold=OUTLIER_Z):
+    totals = cohort.totals[~np.isnan(cohort.totals)]
+    print(f"== {cohort.module}: {len(cohort)} mahasiswa, {len(cohort.labels)} kelompok, {len(cohort.criteria)} kriteria ==")
+    if totals.size:
+        print(f"Nilai: rata-rata {totals.mean():.2f}, median {np.median(totals):.2f}, simpangan {totals.std():.2f}, "
+              f"lulus (>= {PASS_SCORE}) {_percent((totals >= PASS_SCORE).mean()).strip()}, "
+              f"error {len(cohort) - totals.size}")
+
+        print("\nHistogram nilai:")
+        counts, edges = np.histogram(totals, bins=bins, range=(0, 100))
+        width = 40 / max(counts.max(), 1)
+        for n, low, high in zip(counts, edges, edges[1:]):
+            print(f"  {low:5.1f}-{high:5.1f} | {'#' * int(round(n * width)):<40} {n}")
+
+    scored, got, full, best = criterion_rates(cohort)
+    if cohort.criteria:
+        print("\nKriteria (yang paling sering tidak dapat poin lebih dulu):")
+        # Criteria nobody got points for (info lines, stages that didn't run) last
+        for col in np.lexsort((-scored, np.nan_to_num(got, nan=2.0), best <= 0)):
+            if best[col] <= 0:
+                print(f"  {cohort.criteria[col]:<32} tidak ada yang dapat poin ({scored[col]} dinilai)")
+                continue
+            missed = int(scored[col] - round(got[col] * scored[col]))
+            print(f"  {cohort.criteria[col]:<32} {_percent(got[col])} dapat poin, {_percent(full[col])} penuh "
+                  f"(maks {best[col]:g}), {missed}/{scored[col]} tidak dapat")
+
+    if len(cohort.labels) > 1:
+        n, errors, mean, median, spread, passed = group_stats(cohort)
+        worst, gap = group_gaps(cohort, got)
+        width = max(len("kelompok"), *(len(label) for label in cohort.labels))
+        print("\nPer kelompok:")
+        print(f"  {'kelompok':<{width}}  {'n':>5} {'error':>5} {'rata2':>6} {'median':>6} {'simp.':>6} {'lulus':>6}  paling tertinggal")
+        for i, label in enumerate(cohort.labels):
+            lag = ""
+            if not np.isnan(gap[i]) and gap[i] < 0:
+                lag = f"{cohort.criteria[worst[i]]} ({gap[i] * 100:+.1f} poin persen)"
+            print(f"  {label:<{width}}  {n[i]:>5} {errors[i]:>5} {mean[i]:>6.2f} {median[i]:>6.2f} {spread[i]:>6.2f} "
+                  f"{_percent(passed[i])}  {lag}")
+
+    rows, z = outliers(cohort, threshold)
+    print(f"\nOutlier (|z| > {threshold:g} terhadap median kelompoknya): {len(rows)}")
+    for row, score in zip(rows[:top], z[:top]):
+        print(f"  {cohort.students[row]} ({cohort.labels[cohort.group[row]]}): {cohort.totals[row]:.2f}, z {score:+.1f}")
+    if len(rows) > top:
+        print(f"  ... {len(rows) - top} lainnya (--top)")
+    print()
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m grading.analytics",
+                                     description="Statistik kelas dari hasil penilaian (butuh numpy)")
+    parser.add_argument("files", nargs="*", help="File --format jsonl atau checkpoint (default: --db)")
+    parser.add_argument("--db", default=DEFAULT_DB, help=f"Database hasil (default: {DEFAULT_DB})")
+    parser.add_argument("--module", help="Hanya modul ini")
+    parser.add_argument("--run", type=int, action="append", help="ID run (boleh berulang; default: run terbaru tiap folder)")
+    parser.add_argument("--bins", type=int, default=10, help="Jumlah kelas histogram (default: 10)")
+    parser.add_argument("--top", type=int, default=10, help="Outlier yang dicetak (default: 10)")
+    parser.add_argument("--outlier-z", type=float, default=OUTLIER_Z, help=f"Batas robust z-score outlier (default: {OUTLIER_Z})")
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if np is None:
+        print("Error: analytics butuh numpy (pip install numpy).")
+        return 1
+    try:
+        if args.files:
+            cohorts = build(file_rows(args.files, args.module))
+        elif not os.path.exists(args.db):
+            print(f"Error: {args.db} belum ada. Nilai dulu dengan --db, atau beri file jsonl.")
+            return 1
+        else:
+            cohorts = build(store_rows(args.db, args.run, args.module))
+    except (StoreError, OSError) as e:
+        print(f"Error: {e}")
+        return 1
+    if not cohorts:
+        print("Tidak ada hasil untuk dianalisis.")
+    for cohort in cohorts.values():
+        report(cohort, args.bins, args.top, args.outlier_z)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
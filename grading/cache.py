@@ -0,0 +1,101 @@
+import os
+import json
+import hashlib
+import tempfile
+
+from grading.rubric import ScoreResult
+
+DEFAULT_CACHE_DIR = ".grade_cache"
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+def submission_key(index, rubric, extra_facts=None):
+    # Hash of everything discovery and the rubric can see: the folder layout,
+    # every .java file (path + content), the rubric fingerprint and any
+    # outcomes produced outside the static checks (JUnit results).
+    h = hashlib.sha256()
+    h.update(f"{rubric.name}:{rubric.fingerprint}\0".encode())
+    if extra_facts:
+        h.update(json.dumps(extra_facts, sort_keys=True).encode())
+    root = index.root
+    for path in index.dirs():
+        h.update(b"d" + os.path.relpath(path, root).encode("utf-8", "surrogateescape") + b"\0")
+    for path in index.files(suffix=".java"):
+        h.update(b"f" + os.path.relpath(path, root).encode("utf-8", "surrogateescape") + b"\0")
+        try:
+            h.update(hashlib.sha256(index.read_bytes(path)).digest())
+        except OSError:
+            h.update(b"unreadable")
+    return h.hexdigest()
+
+
+class ResultCache:
+    # On-disk cache of graded results, one small JSON file per submission key.
+    # Only holds a directory path, so it can be shipped to pool workers.
+    # Entries are touched on every hit; prune() drops the least recently used
+    # ones once the directory grows past max_bytes.
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], key + ".json")
+
+    def get(self, key):
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        if "outcomes" not in data:
+            # Written before outcomes were kept; can't be rescored
+            return None
+        return ScoreResult(data["total"], data["details"], data["sections"], data["criteria"], data["outcomes"])
+
+    def put(self, key, result):
+        path = self._path(key)
+        data = {
+            "total": result.total,
+            "details": result.details,
+            "sections": result.sections,
+            "criteria": result.criteria,
+            "outcomes": result.outcomes,
+        }
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write then rename, so parallel workers never see half a file
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp, path)
+        except OSError:
+            pass
+
+    def prune(self):
+        entries = []
+        total = 0
+        for root, dirs, files in os.walk(self.directory):
+            for name in files:
+                path = os.path.join(root, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, path))
+                total += st.st_size
+        if total <= self.max_bytes:
+            return 0
+        removed = 0
+        for mtime, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        return removed
@@ -0,0 +1,188 @@
+import os
+import re
+import sys
+import glob
+import time
+import hashlib
+import zipfile
+import argparse
+import subprocess
+
+# Class-data sharing (AppCDS) archives for the JVMs the grader starts. A JVM
+# started from an archive maps the already parsed and verified classes of the
+# JUnit platform, javac or the JDK instead of loading them from the jars,
+# which is most of its start-up. Built once per machine and JDK:
+#
+#   python -m grading.cds                  # after installing a JDK or pulling new Java sources
+#
+# One archive per kind of launch, in <build_dir>/cds/:
+#   runner-<TestClass>  BatchRunner: JUnit platform and the grading test
+#   compiler            BatchCompiler: the in-process javac
+#   main                a student's Main (--run), one JVM per student: the
+#                       JDK classes a typical Main uses, from a training run of
+#                       java/CdsTrainer.java
+# Each is dumped (-XX:ArchiveClassesAtExit, JDK 13+) at the end of a
+# training run with the same class path as the real launches. The JVM only
+# accepts jars there, so the runner classes are packed into runner.jar and a
+# student run puts trainer.jar in front of its own classes folder.
+#
+# An archive's file name carries a hash of `java -version` and of the files
+# it was built from, so a new JDK, jar or grading test leaves the launches
+# without an archive (a normal start-up) until the next setup. The stages
+# pick up whatever archive exists: share_flags() is [] when there is none.
+
+CDS_DIR = "cds"
+MIN_JAVA = 13
+TRAINER_SOURCE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "java", "CdsTrainer.java")
+TRAINER_CLASS = "CdsTrainer"
+TRAINER_INPUT = "Budi\nSiti\nAndi\n"
+
+_version = None
+
+
+def java_version():
+    # `java -version` output, "" without java
+    global _version
+    if _version is None:
+        try:
+            proc = subprocess.run(["java", "-version"], stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+                                  stderr=subprocess.STDOUT, text=True, errors="replace")
+            _version = proc.stdout
+        except OSError:
+            _version = ""
+    return _version
+
+def java_major():
+    m = re.search(r'version "(\d+)(?:\.(\d+))?', java_version())
+    if m is None:
+        return 0
+    # "1.8.0_392" is Java 8
+    return int(m.group(2) or 0) if m.group(1) == "1" else int(m.group(1))
+
+def pack_jar(classes_dir, jar_path):
+    # The .class files of classes_dir as a jar, rewritten only when a class is
+    # newer: the JVM checks the jar's mtime against the archive
+    classes = sorted(name for name in os.listdir(classes_dir) if name.endswith(".class"))
+    if os.path.exists(jar_path) and all(
+            os.path.getmtime(os.path.join(classes_dir, name)) <= os.path.getmtime(jar_path) for name in classes):
+        return jar_path
+    tmp = jar_path + f".tmp-{os.getpid()}"
+    with zipfile.ZipFile(tmp, "w", zipfile.ZIP_DEFLATED) as jar:
+        for name in classes:
+            jar.write(os.path.join(classes_dir, name), name)
+    os.replace(tmp, jar_path)
+    return jar_path
+
+def runner_jar(runner_dir):
+    # BatchRunner/BatchCompiler classes as <build_dir>/runner.jar
+    return pack_jar(runner_dir, runner_dir + ".jar")
+
+def archive_path(build_dir, name, files):
+    h = hashlib.sha256(java_version().encode())
+    for path in files:
+        st = os.stat(path)
+        h.update(f"{os.path.abspath(path)}\0{st.st_size}\0{st.st_mtime_ns}\0".encode("utf-8", "surrogateescape"))
+    return os.path.join(build_dir, CDS_DIR, f"{name}-{h.hexdigest()[:16]}.jsa")
+
+def share_flags(build_dir, name, files):
+    # JVM options that start from the archive built for these files, [] if
+    # there is none
+    if java_major() < MIN_JAVA:
+        return []
+    try:
+        path = archive_path(build_dir, name, files)
+    except OSError:
+        return []
+    if not os.path.exists(path):
+        return []
+    # Should the JVM still reject the archive, it starts normally; its warning
+    # goes to stderr instead of into the result stream on stdout
+    return [f"-XX:SharedArchiveFile={path}", "-Xshare:auto", "-Xlog:disable", "-Xlog:all=warning:stderr"]
+
+def dump_flags(build_dir, name, files):
+    # (archive path, JVM options) for a training run that writes the archive
+    # at exit. Archives of the same kind built for older files are removed.
+    path = archive_path(build_dir, name, files)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    for old in glob.glob(os.path.join(os.path.dirname(path), glob.escape(name) + "-*.jsa")):
+        os.remove(old)
+    return path, [f"-XX:ArchiveClassesAtExit={path}"]
+
+def base_archive():
+    # Whether the JDK has its default archive (lib/server/classes.jsa). The
+    # archives here are dumped on top of it; runtimes made with jlink often
+    # come without one.
+    try:
+        proc = subprocess.run(["java", "-Xshare:on", "-version"], stdin=subprocess.DEVNULL,
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    except OSError:
+        return False
+    return proc.returncode == 0
+
+def training_run(cmd, path, stdin_text, cwd=None):
+    # Runs a training command; returns the archive it wrote
+    proc = subprocess.run(cmd, input=stdin_text, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                          text=True, errors="replace", cwd=cwd)
+    lines = [line for line in proc.stderr.splitlines() if line.strip()]
+    if not os.path.exists(path):
+        # JDK 17 reports a missing base archive on stdout and doesn't start
+        if not base_archive():
+            raise RuntimeError("JDK ini tidak punya arsip CDS dasar (lib/server/classes.jsa). "
+                               "Buat dulu dengan `java -Xshare:dump` (butuh hak tulis ke folder JDK).")
+        raise RuntimeError(f"arsip tidak terbentuk (exit code {proc.returncode})" + (f": {lines[-1].strip()}" if lines else ""))
+    if proc.returncode != 0:
+        # The JVM still dumps at exit, but only the classes loaded before the
+        # failure: no better than starting without an archive
+        os.remove(path)
+        raise RuntimeError(f"training run gagal (exit code {proc.returncode})" + (f": {lines[-1].strip()}" if lines else ""))
+    return path
+
+def setup(build_dir, module_names):
+    # Builds every archive; yields (label, archive path or None, message, seconds)
+    from grading.cli import load_module
+    from grading.execute import MainStage
+    from grading.junit import REPO_ROOT, JUnitStage
+    stages = []
+    for name in module_names:
+        grader = load_module(name)
+        stages.append((f"JUnit {grader.JUNIT_CLASS}", JUnitStage(os.path.join(REPO_ROOT, grader.JUNIT_SOURCE),
+                                                                 grader.JUNIT_CLASS, list(grader.JUNIT_TESTS), build_dir)))
+    stages.append(("BatchCompiler", stages[0][1].compile_cache if stages else None))
+    stages.append(("Main (--run)", MainStage([], TRAINER_INPUT, build_dir)))
+    for label, stage in stages:
+        if stage is None:
+            continue
+        start = time.perf_counter()
+        try:
+            path, message = stage.build_archive(), ""
+        except (RuntimeError, OSError) as e:
+            path, message = None, str(e)
+        yield label, path, message, time.perf_counter() - start
+
+def main(argv=None):
+    from grading.cli import available_modules
+    from grading.junit import DEFAULT_BUILD_DIR, java_available
+    parser = argparse.ArgumentParser(prog="python -m grading.cds",
+                                     description="Bangun arsip class-data sharing (AppCDS) untuk JVM JUnit, compile, dan --run")
+    parser.add_argument("--module", nargs="+", choices=available_modules(), default=available_modules(),
+                        help="Modul yang test JUnit-nya diarsipkan (default: semua)")
+    parser.add_argument("--build-dir", default=DEFAULT_BUILD_DIR, help=f"Folder build (default: {DEFAULT_BUILD_DIR})")
+    args = parser.parse_args(argv)
+    if not java_available():
+        print("Error: java/javac tidak ditemukan.")
+        return 1
+    if java_major() < MIN_JAVA:
+        print(f"Error: arsip CDS butuh JDK {MIN_JAVA} atau lebih baru (terpasang: {java_major()}).")
+        return 1
+    failed = 0
+    for label, path, message, seconds in setup(os.path.abspath(args.build_dir), args.module):
+        if path is None:
+            failed += 1
+            print(f"[X] {label}: {message}")
+        else:
+            print(f"[OK] {label}: {path} ({os.path.getsize(path) / 1e6:.1f} MB, {seconds:.1f} detik)")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,177 @@
+import os
+import json
+import zlib
+import argparse
+
+from grading.output import JsonlWriter
+from grading.rubric import ScoreResult
+
+# Sharded, resumable cohort runs.
+#
+#   python grade.py .. --shard 1/3          # on machine 1, 2 and 3
+#   python grade.py --merge .grade_checkpoint/*.jsonl --format csv --output nilai.csv
+#
+# --shard i/N keeps the students whose folder name hashes to shard i. The hash
+# only depends on the name, so every machine agrees on the split even if
+# their folder listings differ (a late submission lands in exactly one shard).
+#
+# A checkpoint is an append-only JSONL file: one header line naming the
+# module, rubric fingerprint, shard and dynamic stages, then one record per
+# graded student in the --format jsonl layout plus its raw outcomes, flushed
+# as soon as the student is graded. A rerun with the same checkpoint skips
+# every student that already has a record without error; a torn last line
+# from a crash is ignored. The last record of a student wins, also when merging.
+
+CHECKPOINT_DIR = ".grade_checkpoint"
+FORMAT_VERSION = 1
+
+
+class CheckpointError(Exception):
+    pass
+
+
+def parse_shard(text):
+    try:
+        index, count = (int(part) for part in text.split("/"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"format shard harus i/N, bukan {text!r}")
+    if not 1 <= index <= count:
+        raise argparse.ArgumentTypeError(f"shard {text} tidak valid, i harus 1..N")
+    return index, count
+
+def shard_of(student, count):
+    # 1-based shard of a student folder name
+    return zlib.crc32(student.encode("utf-8", "surrogateescape")) % count + 1
+
+def select_shard(students, shard):
+    index, count = shard
+    return [student for student in students if shard_of(student, count) == index]
+
+def default_path(module, shard):
+    name = module if shard is None else f"{module}-shard{shard[0]}of{shard[1]}"
+    return os.path.join(CHECKPOINT_DIR, name + ".jsonl")
+
+def read_records(path):
+    # (header or None, [records]) of a checkpoint or a --format jsonl file
+    header = None
+    records = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if not isinstance(record, dict):
+                continue
+            if "checkpoint" in record:
+                header = header or record
+            elif "student" in record:
+                records.append(record)
+    return header, records
+
+def record_result(record):
+    if record.get("score") is None:
+        return None
+    return ScoreResult(record["score"], record.get("details") or [], record.get("sections") or {}, record.get("criteria") or {},
+                       record.get("outcomes"))
+
+
+class Checkpoint:
+    def __init__(self, path, rubric, shard=None, stages=()):
+        self.path = path
+        self.rubric = rubric
+        self.header = {
+            "checkpoint": FORMAT_VERSION,
+            "module": rubric.name,
+            "rubric": rubric.fingerprint,
+            "shard": None if shard is None else f"{shard[0]}/{shard[1]}",
+            "stages": sorted(stages),
+        }
+        self.stream = None
+        self.writer = None
+
+    def resume(self):
+        # student -> record of everything graded without error so far
+        if not os.path.exists(self.path):
+            return {}
+        header, records = read_records(self.path)
+        if header is not None:
+            for field in ("checkpoint", "module", "rubric", "shard", "stages"):
+                if header.get(field) != self.header[field]:
+                    raise CheckpointError(
+                        f"{self.path} dibuat dengan {field} {header.get(field)!r}, run ini {self.header[field]!r}. "
+                        "Hapus file tersebut atau pakai --checkpoint lain.")
+        done = {}
+        for record in records:
+            if record.get("error") is None and record.get("score") is not None:
+                done[record["student"]] = record
+            else:
+                done.pop(record["student"], None)
+        return done
+
+    def open(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        fresh = not os.path.exists(self.path) or os.path.getsize(self.path) == 0
+        self.stream = open(self.path, "a", encoding="utf-8")
+        if not fresh:
+            # A crash can leave half a line behind; start on a line of our own
+            with open(self.path, "rb") as f:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    self.stream.write("\n")
+        if fresh:
+            self.stream.write(json.dumps(self.header) + "\n")
+        self.stream.flush()
+        self.writer = JsonlWriter(self.stream, self.rubric, outcomes=True)
+        return self
+
+    def write(self, student, path, result, error=None):
+        self.writer.write(student, path, result, error)
+
+    def flush(self):
+        self.writer.flush()
+
+    def close(self):
+        if self.stream is not None:
+            self.stream.close()
+
+
+def merge(paths):
+    # Combines checkpoint files. Returns (module or None, student -> record,
+    # notes about inconsistencies worth printing).
+    notes = []
+    merged = {}
+    modules = set()
+    rubrics = set()
+    shards = {}
+    for path in paths:
+        try:
+            header, records = read_records(path)
+        except OSError as e:
+            notes.append(f"[!] {path} tidak bisa dibaca: {e}")
+            continue
+        if header is not None:
+            modules.add(header.get("module"))
+            rubrics.add(header.get("rubric"))
+            if header.get("shard"):
+                index, count = header["shard"].split("/")
+                shards.setdefault(int(count), set()).add(int(index))
+        for record in records:
+            modules.add(record.get("module"))
+            previous = merged.get(record["student"])
+            if previous is not None and previous.get("_file") != path:
+                notes.append(f"[!] {record['student']} ada di {previous['_file']} dan {path}, dipakai yang terakhir.")
+            merged[record["student"]] = dict(record, _file=path)
+    modules.discard(None)
+    if len(modules) > 1:
+        notes.append(f"[!] Checkpoint berisi modul berbeda: {', '.join(sorted(modules))}")
+    if len(rubrics - {None}) > 1:
+        notes.append("[!] Checkpoint dibuat dengan versi rubrik berbeda, nilai mungkin tidak sebanding.")
+    for count, indexes in sorted(shards.items()):
+        missing = sorted(set(range(1, count + 1)) - indexes)
+        if missing:
+            notes.append(f"[!] Shard belum lengkap: {', '.join(f'{i}/{count}' for i in missing)} tidak ada.")
+    for record in merged.values():
+        del record["_file"]
+    module = modules.pop() if len(modules) == 1 else None
+    return module, dict(sorted(merged.items())), notes
@@ -0,0 +1,518 @@
+import os
+import sys
+import time
+import argparse
+import importlib
+import functools
+
+from grading import modules, profile
+from grading.cache import DEFAULT_CACHE_DIR, ResultCache, submission_key
+from grading.checkpoint import CHECKPOINT_DIR, Checkpoint, CheckpointError, default_path, parse_shard, record_result, select_shard
+from grading.index import TIME_BUDGET, open_index
+from grading.output import FORMATS, TeeWriter, open_writer
+from grading.runner import grade_many
+from grading.similarity import DEFAULT_THRESHOLD, FingerprintStore, cohort_clusters, print_clusters
+from grading.stream import ScoreBoard, chunked, iter_student_folders
+from grading.zipsource import zip_listdir
+
+# One command line for every Modul: discovery, caching, parallel grading,
+# reports and LMS output live here, the module-specific part (where the files
+# are, which rubric scores them) in grading/modules/<name>.py. A module is
+# imported only once it is selected, so adding modules doesn't slow startup.
+#
+#   python grade.py .. --module modul1
+#
+# A grading module provides RUBRIC, JUNIT_SOURCE, JUNIT_CLASS, JUNIT_TESTS,
+# OUTPUT_CHECKS, MAIN_INPUT, TITLE, PASS_NOTE,
+# find_source_root(student_path, index),
+# read_inputs(student_path, index, extra_facts) -> (contents, facts) and
+# evaluate_student(student_path, index, extra_facts).
+
+DEFAULT_MODULE = "modul2"
+# Seconds one Main may run (--run-timeout, grading/execute.py)
+RUN_TIMEOUT = 5.0
+# Requests waiting for a worker before --serve answers 503 (grading/server.py)
+SERVE_QUEUE = 16
+
+
+def available_modules():
+    # File names only: listing the package doesn't import any module
+    folder = os.path.dirname(modules.__file__)
+    return sorted(name[:-3] for name in os.listdir(folder) if name.endswith(".py") and not name.startswith("_"))
+
+def load_module(name):
+    return importlib.import_module(f"grading.modules.{name}")
+
+def find_student_folders(root_dir):
+    listing = zip_listdir(root_dir)
+    if listing is not None:
+        folders = listing[0]
+    else:
+        folders = [d for d in os.listdir(root_dir) if os.path.isdir(os.path.join(root_dir, d))]
+    return sorted(d for d in folders if d != "GradingSystem" and not d.startswith("."))
+
+def is_single_project(root_dir, listing=None):
+    # root_dir is one student's project if it has src/ or .java files of its own
+    if listing is not None:
+        dirs, files = listing
+    else:
+        entries = os.listdir(root_dir)
+        dirs = [e for e in entries if os.path.isdir(os.path.join(root_dir, e))]
+        files = [e for e in entries if e not in dirs]
+    return "src" in dirs or any(f.endswith(".java") for f in files)
+
+class Loaded:
+    # One student after the I/O half of grading, waiting for the rubric
+    __slots__ = ("index", "key", "result", "inputs", "seconds")
+
+    def __init__(self, index, key, result, inputs, seconds):
+        self.index = index
+        self.key = key            # result cache key, None without cache
+        self.result = result      # cached result, or None
+        self.inputs = inputs      # (contents, facts) for the rubric on a miss
+        self.seconds = seconds
+
+
+def load_student(student_path, module, cache=None, extra_facts=None):
+    # The file system half of grading: folder walk, cache lookup and, on a
+    # miss, locating and reading the sources. Safe to run in a thread.
+    grader = load_module(module)
+    start = time.perf_counter()
+
+    # One pass over the submission; every lookup is answered from this index
+    with profile.phase("discovery"):
+        index = open_index(student_path)
+
+    # Unchanged submissions reuse their previous result
+    key = result = inputs = None
+    if cache is not None:
+        with profile.phase("cache"):
+            key = submission_key(index, grader.RUBRIC, extra_facts)
+            result = cache.get(key)
+    if result is None:
+        inputs = grader.read_inputs(student_path, index, extra_facts)
+    return Loaded(index, key, result, inputs, time.perf_counter() - start)
+
+def finish_student(student_path, loaded, module, cache=None, report=True):
+    # The CPU half: rubric evaluation, cache store and the report
+    grader = load_module(module)
+    start = time.perf_counter()
+    if report:
+        print(f"Grading {os.path.basename(student_path)}...")
+    index, result = loaded.index, loaded.result
+    if result is None:
+        contents, facts = loaded.inputs
+        # The sources are only needed by the rubric; let them go with it
+        loaded.inputs = None
+        # Folders or files the traversal policy cut off (grading/index.py)
+        facts["notes"] = list(index.notes)
+        # The checks get the same time budget as the walk; a pathological
+        # file can't hold up the cohort either
+        result = grader.RUBRIC.grade(contents, facts, deadline=time.monotonic() + TIME_BUDGET)
+        # A walk or checks cut short by the time budget depend on machine load
+        if cache is not None and not index.timed_out and not result.outcomes.get("timed_out"):
+            with profile.phase("cache"):
+                cache.put(loaded.key, result)
+    if report:
+        print_report(student_path, result, grader.PASS_NOTE)
+    profiler = profile.active()
+    if profiler is not None:
+        profiler.add("students", os.path.basename(student_path), loaded.seconds + time.perf_counter() - start)
+    return result
+
+def grade_student(student_path, module, cache=None, extra_facts=None, report=True):
+    # module is a name, not the module object, so the call can be shipped to
+    # pool workers; each worker imports the module once. extra_facts: the
+    # student's outcomes of the JUnit/run stages (--junit, --run), if they ran
+    loaded = load_student(student_path, module, cache, extra_facts)
+    return finish_student(student_path, loaded, module, cache, report)
+
+def format_report(student_path, result, pass_note=None):
+    total_score, details = result.total, result.details
+
+    lines = ["\n" + "="*40, f"REPORT FOR: {os.path.basename(student_path)}", "="*40]
+    lines.extend(details)
+    lines.append("-" * 40)
+    lines.append(f"TOTAL SCORE: {total_score:.2f} / 100")
+    if pass_note and total_score >= 60:
+        lines.append(pass_note)
+    lines.append("="*40 + "\n")
+    return "\n".join(lines)
+
+def print_report(student_path, result, pass_note=None):
+    print(format_report(student_path, result, pass_note))
+
+def print_summary(results):
+    print("\nFinal Scores Summary:")
+    for student, score in results.items():
+        if score is None:
+            print(f"{student}: ERROR")
+        else:
+            print(f"{student}: {score:.2f}")
+
+def run_dynamic(grader, paths, args):
+    # Stages that compile and run student code: the JUnit suite for all of
+    # them in one JVM (--junit) and every Main in the sandbox (--run).
+    # Returns student_path -> raw outcome facts, or None.
+    if not (args.junit or args.run) or not paths:
+        return None
+    from grading.execute import MainStage
+    from grading.junit import DEFAULT_BUILD_DIR, REPO_ROOT, JUnitStage, collect_sources, java_available
+    if not java_available():
+        print("[!] java/javac tidak ditemukan, tahap JUnit/run dilewati.")
+        return None
+    with profile.phase("java sources"):
+        submissions = collect_sources(paths, grader.find_source_root, os.path.abspath(DEFAULT_BUILD_DIR))
+    dynamic = {path: {} for path in paths}
+    if args.junit:
+        stage = JUnitStage(os.path.join(REPO_ROOT, grader.JUNIT_SOURCE), grader.JUNIT_CLASS, list(grader.JUNIT_TESTS))
+        print(f"Menjalankan {grader.JUNIT_CLASS} untuk {len(paths)} mahasiswa...")
+        for path, facts in stage.grade_all(submissions).items():
+            dynamic[path].update(facts)
+    if args.run:
+        stage = MainStage(grader.OUTPUT_CHECKS, grader.MAIN_INPUT, jobs=args.jobs, timeout=args.run_timeout)
+        if stage.sandbox is None:
+            print("[!] Sandbox tidak tersedia (butuh bwrap atau JDK < 24), Main tidak dijalankan.")
+        else:
+            for path, facts in stage.grade_all(submissions).items():
+                dynamic[path].update(facts)
+    return dynamic
+
+def grade_paths(paths, dynamic, args, cache=None):
+    # (path, result, output, error) per student, in order, through the
+    # pipeline or the process pool
+    if args.pipeline:
+        # Overlapped walks and reads on one process (grading/pipeline.py)
+        from grading.pipeline import grade_pipelined
+        def load(path):
+            return load_student(path, args.module, cache, (dynamic or {}).get(path))
+        finish = functools.partial(finish_student, module=args.module, cache=cache, report=not args.no_report)
+        return grade_pipelined(load, finish, paths, args.pipeline)
+    grade_fn = functools.partial(grade_student, module=args.module, cache=cache, report=not args.no_report)
+    # Each task carries only its own student's stage outcomes, not the cohort's
+    return grade_many(grade_fn, paths, args.jobs, lambda path: {"extra_facts": (dynamic or {}).get(path)})
+
+def record_graded(graded, writer, record):
+    # Reports and writes every graded student, record(student, total or None)
+    for path, result, output, error in graded:
+        student = os.path.basename(path)
+        if output:
+            sys.stdout.write(output)
+        if error:
+            print(f"[X] Grading {student} gagal: {error}\n")
+        if writer is not None:
+            writer.write(student, path, result, error)
+        record(student, None if result is None else result.total)
+
+def grade_cohort(root_dir, students, args, cache=None, writer=None):
+    grader = load_module(args.module)
+    results = {}
+    paths = [os.path.join(root_dir, student) for student in students]
+    dynamic = run_dynamic(grader, paths, args)
+    record_graded(grade_paths(paths, dynamic, args, cache), writer, results.__setitem__)
+    if writer is not None:
+        writer.flush()
+    if cache is not None:
+        cache.prune()
+    return results
+
+def stream_cohort(root_dir, students, args, cache=None, writer=None, scores=None):
+    # --stream (grading/stream.py): students is a generator, each one graded
+    # as it is found; returns a ScoreBoard
+    grader = load_module(args.module)
+    scores = ScoreBoard() if scores is None else scores
+    paths = (os.path.join(root_dir, student) for student in students)
+    if args.junit or args.run:
+        for chunk in chunked(paths):
+            record_graded(grade_paths(chunk, run_dynamic(grader, chunk, args), args, cache), writer, scores.add)
+            if writer is not None:
+                writer.flush()
+    else:
+        record_graded(grade_paths(paths, None, args, cache), writer, scores.add)
+    if writer is not None:
+        writer.flush()
+    if cache is not None:
+        cache.prune()
+    return scores
+
+def watch_cohort(root_dir, results, args, cache=None, writer=None):
+    # Live scoreboard: regrade only the student folders that changed
+    from grading.watch import watch
+
+    def regrade(changed):
+        live = find_student_folders(root_dir)
+        live = set(select_shard(live, args.shard) if args.shard else live)
+        for student in changed:
+            if student not in live:
+                results.pop(student, None)
+        results.update(grade_cohort(root_dir, [s for s in changed if s in live], args, cache, writer))
+        print_summary(dict(sorted(results.items())))
+        if args.similarity:
+            report_similarity(root_dir, sorted(live), args)
+
+    watch(root_dir, regrade)
+
+def report_similarity(root_dir, students, args):
+    # Near-duplicate clusters, next to the summary (grading/similarity.py)
+    store = None if args.no_cache else FingerprintStore(os.path.join(args.cache_dir, "minhash"))
+    paths = [os.path.join(root_dir, student) for student in students]
+    clusters = cohort_clusters(paths, args.similarity_threshold, store, args.jobs)
+    print_clusters(clusters, args.similarity_threshold)
+
+def merge_checkpoints(args):
+    # --merge: one summary (and --format output) from the shards' checkpoints
+    from grading.checkpoint import merge
+    module, records, notes = merge(args.merge)
+    for note in notes:
+        print(note)
+    print(f"Digabung {len(records)} mahasiswa dari {len(args.merge)} file.")
+    rubric = load_module(module or args.module).RUBRIC
+    writer = None
+    if args.format:
+        writer, stream = open_writer(args.format, args.output, rubric)
+        if stream is sys.stdout:
+            sys.stdout = sys.stderr
+    if args.db:
+        from grading.store import StoreError
+        try:
+            writer = TeeWriter(writer, open_store(rubric, None, args))
+        except StoreError as e:
+            print(f"Error: {e}")
+            return
+    if writer is not None:
+        for student, record in records.items():
+            writer.write(student, record.get("path"), record_result(record), record.get("error"))
+        writer.flush()
+    print_summary({student: record.get("score") for student, record in records.items()})
+
+def rescore_run(args):
+    # --rescore: scores, reports and summary of a stored run recomputed from
+    # its raw outcomes with the rubric as it is now (weights, points, bonus
+    # rule). No submission is read; the result is stored as a new run.
+    from grading.store import DEFAULT_DB, ResultStore, StoreError
+    grader = load_module(args.module)
+    rubric = grader.RUBRIC
+    path = DEFAULT_DB if args.db in (None, True) else args.db
+    if not os.path.exists(path):
+        print(f"Error: {path} belum ada. Nilai dulu dengan --db.")
+        return
+    try:
+        store = ResultStore(path)
+        run = args.rescore or store.latest_run(rubric.name)
+        if run is None:
+            raise StoreError(f"Belum ada run {rubric.name} di {path}.")
+        info = store.run_info(run)
+        if info["module"] != rubric.name:
+            raise StoreError(f"Run {run} adalah {info['module']}, bukan {rubric.name} (pilih dengan --module).")
+        if info["checks"] is None:
+            raise StoreError(f"Run {run} dibuat sebelum outcome disimpan di database. Nilai ulang tanpa --rescore.")
+        if info["checks"] != rubric.checks_fingerprint:
+            raise StoreError(f"Check {rubric.name} sudah berubah sejak run {run}, outcome tersimpan tidak berlaku lagi. "
+                             "Nilai ulang tanpa --rescore.")
+        stored = store.outcomes(run)
+    except StoreError as e:
+        print(f"Error: {e}")
+        return
+
+    start = time.perf_counter()
+    writer = None
+    if args.format:
+        writer, stream = open_writer(args.format, args.output, rubric)
+        if stream is sys.stdout:
+            sys.stdout = sys.stderr
+    shard = parse_shard(info["shard"]) if info["shard"] else None
+    stages = [stage for stage in info["stages"].split(",") if stage]
+    writer = TeeWriter(writer, store.start_run(rubric, info["root"], shard, stages))
+    results = {}
+    for student, (student_path, error, outcomes) in stored.items():
+        result = None
+        if outcomes is not None:
+            result = rubric.score(outcomes)
+            result.outcomes = outcomes
+            if not args.no_report:
+                print_report(student_path or student, result, grader.PASS_NOTE)
+        elif error is None:
+            error = "outcome tidak tersimpan di run ini, nilai ulang tanpa --rescore"
+        writer.write(student, student_path, result, error)
+        results[student] = None if result is None else result.total
+    writer.flush()
+    print(f"Rescore run {run}: {len(stored)} mahasiswa dalam {(time.perf_counter() - start) * 1000:.0f} ms, tanpa membaca file.")
+    print_summary(results)
+
+def stream_main(root_dir, grader, args, cache=None, writer=None):
+    # The cohort part of main() for --stream: no folder list, no results dict
+    try:
+        checkpoint, done = open_checkpoint(grader, None, args)
+    except CheckpointError as e:
+        print(f"Error: {e}")
+        return
+    scores = ScoreBoard()
+    for student, record in done.items():
+        scores.add(student, record["score"])
+        if writer is not None:
+            writer.write(student, record.get("path"), record_result(record), record.get("error"))
+    done = set(done)
+    writer = TeeWriter(writer, checkpoint) if checkpoint is not None else writer
+    students = (s for s in iter_student_folders(root_dir, args.shard) if s not in done)
+    stream_cohort(root_dir, students, args, cache, writer, scores)
+    print(f"Dinilai {len(scores)} mahasiswa (mode stream).")
+    print_summary(scores)
+
+def open_checkpoint(grader, students, args):
+    # (checkpoint or None, student -> record of the students already graded)
+    path = args.checkpoint or (default_path(args.module, args.shard) if args.shard else None)
+    if path is None:
+        return None, {}
+    stages = [stage for stage in ("junit", "run") if getattr(args, stage)]
+    checkpoint = Checkpoint(path, grader.RUBRIC, args.shard, stages)
+    done = checkpoint.resume()
+    if students is None:
+        # --stream: the remaining students aren't known up front
+        print(f"Checkpoint {path}: {len(done)} mahasiswa sudah dinilai.")
+    else:
+        wanted = set(students)
+        done = {student: record for student, record in done.items() if student in wanted}
+        print(f"Checkpoint {path}: {len(done)} mahasiswa sudah dinilai, {len(students) - len(done)} tersisa.")
+    return checkpoint.open(), done
+
+def open_store(rubric, root_dir, args):
+    # Writer for a new run in the results database (--db)
+    from grading.store import DEFAULT_DB, ResultStore
+    path = DEFAULT_DB if args.db is True else args.db
+    stages = [stage for stage in ("junit", "run") if getattr(args, stage)]
+    return ResultStore(path).start_run(rubric, root_dir, args.shard, stages)
+
+def report_profile(profiler, args):
+    if profiler is None:
+        return
+    profiler.report()
+    if args.profile_json:
+        profiler.dump(args.profile_json)
+        print(f"\nProfil disimpan ke {args.profile_json}")
+
+def build_parser(default_module=DEFAULT_MODULE):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("root_dir", nargs="?", default="..", help="Folder berisi folder-folder mahasiswa")
+    parser.add_argument("-m", "--module", choices=available_modules(), default=default_module, help=f"Modul yang dinilai (default: {default_module})")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="Jumlah proses paralel (0 = semua core)")
+    parser.add_argument("--pipeline", type=int, metavar="N", help="Baca folder dan file N mahasiswa sekaligus sambil menilai (untuk folder di share jaringan); menggantikan --jobs")
+    parser.add_argument("--no-cache", action="store_true", help="Nilai ulang semua mahasiswa, abaikan cache hasil")
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR, help="Lokasi cache hasil penilaian")
+    parser.add_argument("--junit", action="store_true", help="Compile dan jalankan test JUnit untuk semua mahasiswa (butuh JDK)")
+    parser.add_argument("--run", action="store_true", help="Compile dan jalankan Main tiap mahasiswa di sandbox, lalu cek output-nya (butuh JDK)")
+    parser.add_argument("--run-timeout", type=float, default=RUN_TIMEOUT, help=f"Batas waktu satu run Main dalam detik (default: {RUN_TIMEOUT:g})")
+    parser.add_argument("--format", choices=FORMATS, help="Tulis hasil per mahasiswa (jsonl/csv) segera setelah dinilai")
+    parser.add_argument("--output", default="-", help="File tujuan untuk --format (default: stdout)")
+    parser.add_argument("--stream", action="store_true", help="Untuk cohort sangat besar: nilai folder satu per satu sambil dibaca dari disk (tanpa diurutkan), memori tetap walau cohort bertambah")
+    parser.add_argument("--shard", type=parse_shard, metavar="i/N", help="Nilai hanya bagian ke-i dari N (untuk dibagi ke beberapa mesin)")
+    parser.add_argument("--checkpoint", metavar="FILE", help=f"File checkpoint untuk melanjutkan run yang terhenti (default dengan --shard: {CHECKPOINT_DIR}/<modul>-shard<i>of<N>.jsonl)")
+    parser.add_argument("--db", nargs="?", const=True, metavar="FILE", help="Simpan semua hasil ke database SQLite (default: grades.sqlite) untuk query dengan python -m grading.query")
+    parser.add_argument("--rescore", nargs="?", type=int, const=0, metavar="RUN", help="Hitung ulang nilai run terakhir (atau run RUN) di --db dari outcome tersimpan dengan bobot/poin rubrik saat ini, tanpa membaca file")
+    parser.add_argument("--merge", nargs="+", metavar="FILE", help="Gabungkan checkpoint/output jsonl beberapa shard menjadi satu ringkasan, tanpa menilai")
+    parser.add_argument("--serve", metavar="ADDR", help="Jalankan server penilaian di host:port atau path Unix socket (lihat grading/server.py); --jobs = jumlah worker")
+    parser.add_argument("--queue", type=int, default=SERVE_QUEUE, help=f"Panjang antrian --serve sebelum request ditolak dengan 503 (default: {SERVE_QUEUE})")
+    parser.add_argument("--no-report", action="store_true", help="Jangan cetak laporan per mahasiswa")
+    parser.add_argument("--watch", action="store_true", help="Tetap berjalan dan nilai ulang mahasiswa yang file .java-nya berubah")
+    parser.add_argument("--similarity", action="store_true", help="Cari submission yang mirip (MinHash/LSH) dan cetak klasternya setelah ringkasan nilai")
+    parser.add_argument("--similarity-threshold", type=float, default=DEFAULT_THRESHOLD, help=f"Kemiripan minimal untuk masuk satu klaster (default: {DEFAULT_THRESHOLD})")
+    parser.add_argument("--profile", action="store_true", help="Ukur waktu per fase, rule, dan mahasiswa, lalu cetak yang paling lambat")
+    parser.add_argument("--profile-json", help="Simpan hasil --profile ke file JSON")
+    return parser
+
+def main(argv=None, default_module=DEFAULT_MODULE):
+    args = build_parser(default_module).parse_args(argv)
+    root_dir = args.root_dir
+    if args.merge:
+        merge_checkpoints(args)
+        return
+    if args.rescore is not None:
+        rescore_run(args)
+        return
+    if args.serve:
+        from grading.server import serve
+        serve(args)
+        return
+    grader = load_module(args.module)
+    profiler = profile.enable() if args.profile or args.profile_json else None
+    cache = None if args.no_cache else ResultCache(args.cache_dir)
+
+    writer = None
+    if args.format:
+        writer, stream = open_writer(args.format, args.output, grader.RUBRIC)
+        if stream is sys.stdout:
+            # Records own stdout; the human-readable text moves to stderr
+            sys.stdout = sys.stderr
+
+    # A .zip download (or a folder inside one) is graded straight from the archive
+    listing = zip_listdir(root_dir)
+    if listing is None and not os.path.exists(root_dir):
+        print(f"Error: The specified path does not exist: {root_dir}")
+        return
+    if args.pipeline and args.jobs != 1:
+        print("[!] --pipeline berjalan dalam satu proses, --jobs diabaikan.")
+    if listing is not None and args.watch:
+        print("[!] --watch tidak didukung untuk input zip, diabaikan.")
+        args.watch = False
+    if args.stream and (args.watch or args.similarity):
+        # Both need the whole cohort in memory
+        print("[!] --watch dan --similarity tidak didukung dengan --stream, diabaikan.")
+        args.watch = args.similarity = False
+
+    if args.db:
+        from grading.store import StoreError
+        try:
+            writer = TeeWriter(writer, open_store(grader.RUBRIC, root_dir, args))
+        except StoreError as e:
+            print(f"Error: {e}")
+            return
+
+    if is_single_project(root_dir, listing):
+        print(f"Detected single student project at {root_dir}")
+        def grade_single(changed=None):
+            dynamic = run_dynamic(grader, [root_dir], args)
+            result = grade_student(root_dir, args.module, cache=cache, extra_facts=(dynamic or {}).get(root_dir),
+                                   report=not args.no_report)
+            if writer is not None:
+                writer.write(os.path.basename(root_dir), root_dir, result)
+                writer.flush()
+            print_summary({os.path.basename(root_dir): result.total})
+            return result
+
+        grade_single()
+        report_profile(profiler, args)
+        if args.watch:
+            from grading.watch import watch
+            watch(root_dir, grade_single)
+        return
+
+    if args.stream:
+        stream_main(root_dir, grader, args, cache, writer)
+        report_profile(profiler, args)
+        return
+
+    with profile.phase("discovery: cohort"):
+        students = find_student_folders(root_dir)
+    print(f"Found {len(students)} student folders.")
+    if args.shard:
+        students = select_shard(students, args.shard)
+        print(f"Shard {args.shard[0]}/{args.shard[1]}: {len(students)} mahasiswa.")
+
+    try:
+        checkpoint, done = open_checkpoint(grader, students, args)
+    except CheckpointError as e:
+        print(f"Error: {e}")
+        return
+    if writer is not None:
+        # --format output and the run in the database cover the resumed students too
+        for student, record in done.items():
+            writer.write(student, record.get("path"), record_result(record), record.get("error"))
+    writer = TeeWriter(writer, checkpoint) if checkpoint is not None else writer
+
+    graded = grade_cohort(root_dir, [s for s in students if s not in done], args, cache, writer)
+    results = {student: done[student]["score"] if student in done else graded[student] for student in students}
+    print_summary(results)
+    if args.similarity:
+        report_similarity(root_dir, students, args)
+    report_profile(profiler, args)
+    if args.watch:
+        watch_cohort(root_dir, results, args, cache, writer)
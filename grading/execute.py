@@ -0,0 +1,301 @@
+import os
+import re
+import time
+import shutil
+import signal
+import threading
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+from grading import profile
+from grading.cds import (CDS_DIR, TRAINER_CLASS, TRAINER_SOURCE, dump_flags, java_major, pack_jar, runner_jar,
+                         share_flags, training_run)
+from grading.javac import CompileCache
+from grading.junit import DEFAULT_BUILD_DIR, JAVA_DIR, student_id
+from grading.lexer import lex
+from grading.runner import resolve_jobs
+
+# Execution stage (--run): every submission's Main is compiled (same class
+# cache as the JUnit stage, grading/javac.py) and run once, and its stdout is
+# matched against the module's OUTPUT_CHECKS. The outcomes are raw facts for
+# the Main criteria, next to the static checks.
+#
+# Each run gets a fresh scratch directory (working dir, user.home and tmpdir)
+# and these limits:
+#   - wall clock: the whole process group is killed after `timeout` seconds
+#   - CPU: `ulimit -t`, so a busy loop dies even if the machine is loaded
+#   - memory: JVM heap and metaspace caps
+#   - files: `ulimit -f` caps the size of anything written, and writes outside
+#     the scratch directory are refused by bwrap (read-only bind of /) or, when
+#     bwrap is unavailable, by a Java security policy (JDK < 24)
+#   - output: stdout/stderr are captured up to MAX_OUTPUT bytes; a program
+#     printing more is stopped
+# stdin is the module's MAIN_INPUT followed by end-of-file, so a Scanner
+# waiting for more input fails at once instead of blocking the batch.
+#
+# Runs are independent JVMs, at most `jobs` at a time. After
+# `python -m grading.cds` each starts from a class-data sharing archive of the
+# JDK classes a typical Main uses (grading/cds.py), with trainer.jar in front
+# of the student's classes on the class path.
+
+DEFAULT_TIMEOUT = 5.0
+DEFAULT_CPU_SECONDS = 5
+DEFAULT_MEMORY_MB = 128
+MAX_OUTPUT = 64 * 1024
+MAX_WRITE_BYTES = 16 * 1024 * 1024
+MAIN_METHOD = re.compile(r'\bstatic\b.*\bvoid\s+main\s*\(')
+PACKAGE = re.compile(r'^\s*package\s+([\w.]+)\s*;', re.MULTILINE)
+
+_sandbox = None
+
+
+def sandbox_kind():
+    # "bwrap", "policy" or None when writes can't be confined on this machine
+    global _sandbox
+    if _sandbox is None:
+        _sandbox = ""
+        if shutil.which("bwrap"):
+            probe = subprocess.run(["bwrap", "--ro-bind", "/", "/", "--dev", "/dev", "true"],
+                                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            if probe.returncode == 0:
+                _sandbox = "bwrap"
+        # The security manager can't be enabled any more from JDK 24 on
+        if not _sandbox and java_major() < 24:
+            _sandbox = "policy"
+    return _sandbox or None
+
+def find_main_class(sources):
+    # Fully qualified name of the class declaring main(), preferring Main.java
+    found = []
+    for path in sources:
+        try:
+            with open(path, "r", encoding="utf-8", errors="ignore") as f:
+                source = lex(f.read())
+        except OSError:
+            continue
+        if any(MAIN_METHOD.search(method) for method in source.methods):
+            package = PACKAGE.search(source.code)
+            name = os.path.splitext(os.path.basename(path))[0]
+            found.append((name != "Main", package.group(1) + "." + name if package else name))
+    return min(found)[1] if found else None
+
+def _policy(scratch):
+    path = scratch.replace("\\", "\\\\")
+    return (
+        "grant {\n"
+        '    permission java.io.FilePermission "<<ALL FILES>>", "read";\n'
+        f'    permission java.io.FilePermission "{path}", "read,write,delete";\n'
+        f'    permission java.io.FilePermission "{path}${{/}}-", "read,write,delete";\n'
+        '    permission java.util.PropertyPermission "*", "read";\n'
+        '    permission java.lang.RuntimePermission "exitVM.*";\n'
+        "};\n"
+    )
+
+def _feed(stream, data):
+    try:
+        stream.write(data)
+        stream.close()
+    except (BrokenPipeError, OSError):
+        pass
+
+def _kill(proc):
+    try:
+        if hasattr(os, "killpg"):
+            os.killpg(proc.pid, signal.SIGKILL)
+        else:
+            proc.kill()
+    except OSError:
+        pass
+
+def _drain(stream, chunks, proc, flooded):
+    # Keeps the first MAX_OUTPUT bytes; a program printing more is stopped
+    size = 0
+    for chunk in iter(lambda: stream.read(8192), b""):
+        if size < MAX_OUTPUT:
+            chunks.append(chunk[:MAX_OUTPUT - size])
+        size += len(chunk)
+        if size > MAX_OUTPUT and not flooded.is_set():
+            flooded.set()
+            _kill(proc)
+
+
+class RunResult:
+    __slots__ = ("status", "message", "stdout", "seconds")
+
+    def __init__(self, status, message, stdout="", seconds=0.0):
+        self.status = status      # ok, error, timeout, cpu, output, compile, no-main
+        self.message = message    # one line for the report
+        self.stdout = stdout
+        self.seconds = seconds
+
+
+def run_facts(result, output_checks):
+    # Raw outcomes for the rubric: run_ok, run_msg and one bool per output check.
+    # Output printed before a crash still counts.
+    facts = {"run_ran": True, "run_ok": result.status == "ok", "run_msg": result.message}
+    for name, regex in output_checks.items():
+        facts[name] = regex.search(result.stdout) is not None
+    return facts
+
+
+class MainStage:
+    def __init__(self, output_checks, stdin_text="", build_dir=DEFAULT_BUILD_DIR, jobs=1,
+                 timeout=DEFAULT_TIMEOUT, cpu_seconds=DEFAULT_CPU_SECONDS, memory_mb=DEFAULT_MEMORY_MB):
+        self.output_checks = output_checks
+        self.stdin_text = stdin_text
+        self.build_dir = os.path.abspath(build_dir)
+        self.jobs = resolve_jobs(jobs)
+        self.timeout = timeout
+        self.cpu_seconds = cpu_seconds
+        self.memory_mb = memory_mb
+        self.runner_dir = os.path.join(self.build_dir, "runner")
+        self.scratch_root = os.path.join(self.build_dir, "run")
+        self.compile_cache = CompileCache(self.build_dir, self.runner_dir)
+        self.trainer_jar = os.path.join(self.build_dir, CDS_DIR, "trainer.jar")
+        self.share = []
+        self.sandbox = sandbox_kind()
+
+    def prepare(self):
+        # The batch compiler is shared with the JUnit stage
+        compiled = os.path.join(self.runner_dir, "BatchCompiler.class")
+        source = os.path.join(JAVA_DIR, "BatchCompiler.java")
+        if not (os.path.exists(compiled) and os.path.getmtime(source) <= os.path.getmtime(compiled)):
+            os.makedirs(self.runner_dir, exist_ok=True)
+            proc = subprocess.run(["javac", "-nowarn", "-d", self.runner_dir, source],
+                                  stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, errors="replace")
+            if proc.returncode != 0:
+                raise RuntimeError(f"Gagal compile BatchCompiler.java:\n{proc.stdout}")
+        self.compile_cache.use_jar(runner_jar(self.runner_dir))
+        self.share = share_flags(self.build_dir, "main", [self.trainer_jar])
+
+    def _options(self, scratch):
+        return [f"-Xmx{self.memory_mb}m", "-XX:MaxMetaspaceSize=64m", "-XX:+UseSerialGC",
+                "-XX:TieredStopAtLevel=1", "-XX:-UsePerfData", "-Dfile.encoding=UTF-8",
+                f"-Djava.io.tmpdir={scratch}", f"-Duser.home={scratch}"]
+
+    def _command(self, scratch, classes, main_class):
+        cmd = ["java"] + self.share + self._options(scratch)
+        if self.sandbox == "policy":
+            policy = scratch + ".policy"
+            with open(policy, "w", encoding="utf-8") as f:
+                f.write(_policy(scratch))
+            cmd += ["-Djava.security.manager", f"-Djava.security.policy=={policy}"]
+        # The archive was built with trainer.jar as the class path; the JVM
+        # only uses it when that is still the start of the class path
+        classpath = [self.trainer_jar, classes] if self.share else [classes]
+        cmd += ["-cp", os.pathsep.join(classpath), main_class]
+        if self.sandbox == "bwrap":
+            cmd = ["bwrap", "--ro-bind", "/", "/", "--dev", "/dev", "--proc", "/proc", "--bind", scratch, scratch,
+                   "--unshare-all", "--die-with-parent", "--chdir", scratch] + cmd
+        if os.name == "posix":
+            # One resource per ulimit call for dash; -f counts 512-byte blocks
+            limits = f"ulimit -c 0 && ulimit -t {self.cpu_seconds} && ulimit -f {MAX_WRITE_BYTES // 512}"
+            cmd = ["sh", "-c", limits + ' && exec "$@"', "sh"] + cmd
+        return cmd
+
+    def build_archive(self):
+        # Training run for the class-data sharing archive (grading/cds.py):
+        # CdsTrainer stands in for a student's Main, with the same JVM options
+        self.prepare()
+        classes = os.path.join(self.build_dir, CDS_DIR, "trainer")
+        compiled = os.path.join(classes, TRAINER_CLASS + ".class")
+        if not (os.path.exists(compiled) and os.path.getmtime(TRAINER_SOURCE) <= os.path.getmtime(compiled)):
+            os.makedirs(classes, exist_ok=True)
+            proc = subprocess.run(["javac", "-nowarn", "-d", classes, TRAINER_SOURCE],
+                                  stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, errors="replace")
+            if proc.returncode != 0:
+                raise RuntimeError(f"Gagal compile CdsTrainer.java:\n{proc.stdout}")
+        pack_jar(classes, self.trainer_jar)
+        path, flags = dump_flags(self.build_dir, "main", [self.trainer_jar])
+        scratch = os.path.join(self.scratch_root, "cds")
+        shutil.rmtree(scratch, ignore_errors=True)
+        os.makedirs(scratch)
+        try:
+            cmd = ["java"] + flags + self._options(scratch) + ["-cp", self.trainer_jar, TRAINER_CLASS]
+            return training_run(cmd, path, self.stdin_text, cwd=scratch)
+        finally:
+            shutil.rmtree(scratch, ignore_errors=True)
+
+    def _env(self, scratch):
+        env = {"PATH": os.environ.get("PATH", ""), "HOME": scratch, "TMPDIR": scratch, "LANG": "C.UTF-8"}
+        if "JAVA_HOME" in os.environ:
+            env["JAVA_HOME"] = os.environ["JAVA_HOME"]
+        return env
+
+    def run_one(self, sid, classes, main_class):
+        scratch = os.path.join(self.scratch_root, sid)
+        shutil.rmtree(scratch, ignore_errors=True)
+        os.makedirs(scratch)
+        start = time.monotonic()
+        try:
+            proc = subprocess.Popen(self._command(scratch, classes, main_class), cwd=scratch, env=self._env(scratch),
+                                    stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                    start_new_session=True)
+        except OSError as e:
+            return RunResult("error", f"JVM gagal dijalankan: {e}")
+        stdout, stderr = [], []
+        flooded = threading.Event()
+        threads = [
+            threading.Thread(target=_feed, args=(proc.stdin, self.stdin_text.encode("utf-8")), daemon=True),
+            threading.Thread(target=_drain, args=(proc.stdout, stdout, proc, flooded), daemon=True),
+            threading.Thread(target=_drain, args=(proc.stderr, stderr, proc, flooded), daemon=True),
+        ]
+        for thread in threads:
+            thread.start()
+        timed_out = False
+        try:
+            proc.wait(timeout=self.timeout)
+        except subprocess.TimeoutExpired:
+            timed_out = True
+            _kill(proc)
+            proc.wait()
+        for thread in threads:
+            thread.join()
+        seconds = time.monotonic() - start
+        shutil.rmtree(scratch, ignore_errors=True)
+        if self.sandbox == "policy":
+            try:
+                os.remove(scratch + ".policy")
+            except OSError:
+                pass
+
+        output = b"".join(stdout).decode("utf-8", "replace")
+        if timed_out:
+            return RunResult("timeout", f"dihentikan setelah {self.timeout:g} detik (infinite loop atau menunggu input?)", output, seconds)
+        if flooded.is_set():
+            return RunResult("output", f"output lebih dari {MAX_OUTPUT // 1024} KB, dihentikan", output, seconds)
+        # ulimit -t signals SIGXCPU, then SIGKILL at the hard limit
+        if os.name == "posix" and proc.returncode in (-signal.SIGXCPU, -signal.SIGKILL):
+            return RunResult("cpu", f"melebihi batas CPU {self.cpu_seconds} detik", output, seconds)
+        if proc.returncode != 0:
+            # First line of the exception, skipping JVM warnings
+            lines = [l for l in b"".join(stderr).decode("utf-8", "replace").splitlines()
+                     if l.strip() and not l.startswith("WARNING")]
+            return RunResult("error", f"exit code {proc.returncode}" + (f": {lines[0][:200]}" if lines else ""), output, seconds)
+        return RunResult("ok", "selesai", output, seconds)
+
+    def grade_all(self, submissions):
+        # submissions: list of (student_path, [source files]).
+        # Returns student_path -> raw outcome facts for the rubric.
+        self.prepare()
+        facts = {}
+        runs = []
+        with profile.phase("run compile"):
+            compiled = self.compile_cache.compile_all(submissions)
+        for student_path, sources in submissions:
+            classes, error = compiled[student_path]
+            main_class = None if error else find_main_class(sources)
+            if error:
+                facts[student_path] = run_facts(RunResult("compile", error), self.output_checks)
+            elif main_class is None:
+                facts[student_path] = run_facts(RunResult("no-main", "method main tidak ditemukan"), self.output_checks)
+            else:
+                runs.append((student_path, classes, main_class))
+
+        print(f"Menjalankan Main untuk {len(runs)} mahasiswa ({self.jobs} sekaligus)...")
+        with profile.phase("run main"):
+            with ThreadPoolExecutor(max_workers=self.jobs) as pool:
+                results = pool.map(lambda run: self.run_one(student_id(run[0]), run[1], run[2]), runs)
+                for (student_path, _, _), result in zip(runs, results):
+                    facts[student_path] = run_facts(result, self.output_checks)
+        return facts
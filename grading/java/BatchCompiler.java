@@ -0,0 +1,102 @@
+import java.io.BufferedReader;
+import java.io.File;
+import java.io.InputStreamReader;
+import java.io.PrintStream;
+import java.io.FileDescriptor;
+import java.io.FileOutputStream;
+import java.nio.charset.StandardCharsets;
+import java.util.ArrayList;
+import java.util.Arrays;
+import java.util.List;
+import java.util.Locale;
+
+import javax.tools.Diagnostic;
+import javax.tools.DiagnosticCollector;
+import javax.tools.JavaCompiler;
+import javax.tools.JavaFileObject;
+import javax.tools.StandardJavaFileManager;
+import javax.tools.ToolProvider;
+
+// Compiles many student submissions with one JVM and one in-process javac,
+// instead of spawning a javac process per student. Each submission still gets
+// its own output directory, so identical class names (Model.Player) never
+// collide between students.
+//
+// Usage: java -cp <runner-dir> BatchCompiler
+// stdin:  one "<key>\t<out-dir>\t<encoding>\t<source>\t<source>..." line per submission
+// stdout: one JSON object per submission: {"key":..., "ok":true|false, "message":...}
+public class BatchCompiler {
+
+    public static void main(String[] args) throws Exception {
+        PrintStream out = new PrintStream(new FileOutputStream(FileDescriptor.out), true, "UTF-8");
+        JavaCompiler compiler = ToolProvider.getSystemJavaCompiler();
+        if (compiler == null) {
+            System.err.println("No system Java compiler (running on a JRE?)");
+            System.exit(2);
+        }
+
+        BufferedReader in = new BufferedReader(new InputStreamReader(System.in, StandardCharsets.UTF_8));
+        String line;
+        while ((line = in.readLine()) != null) {
+            if (line.isEmpty()) {
+                continue;
+            }
+            String[] parts = line.split("\t");
+            String key = parts[0];
+            String outDir = parts[1];
+            String encoding = parts[2];
+            List<File> sources = new ArrayList<>();
+            for (String path : Arrays.copyOfRange(parts, 3, parts.length)) {
+                sources.add(new File(path));
+            }
+            new File(outDir).mkdirs();
+
+            // Fresh file manager per submission: -d/-cp are applied to it
+            StandardJavaFileManager files = compiler.getStandardFileManager(null, Locale.ROOT, StandardCharsets.UTF_8);
+            DiagnosticCollector<JavaFileObject> diagnostics = new DiagnosticCollector<>();
+            List<String> options = Arrays.asList("-nowarn", "-proc:none", "-encoding", encoding,
+                    "-d", outDir, "-cp", outDir);
+            boolean ok;
+            String message = "";
+            try {
+                ok = compiler.getTask(null, files, diagnostics, options, null,
+                        files.getJavaFileObjectsFromFiles(sources)).call();
+            } catch (RuntimeException e) {
+                ok = false;
+                message = String.valueOf(e.getMessage());
+            }
+            if (!ok && message.isEmpty()) {
+                for (Diagnostic<? extends JavaFileObject> d : diagnostics.getDiagnostics()) {
+                    if (d.getKind() == Diagnostic.Kind.ERROR) {
+                        String source = d.getSource() != null ? d.getSource().getName() : "";
+                        message = source + ":" + d.getLineNumber() + ": error: " + d.getMessage(Locale.ROOT);
+                        break;
+                    }
+                }
+            }
+            files.close();
+            out.println("{\"key\":" + quote(key) + ",\"ok\":" + ok + ",\"message\":" + quote(message) + "}");
+        }
+    }
+
+    private static String quote(String s) {
+        StringBuilder sb = new StringBuilder("\"");
+        for (int i = 0; i < s.length(); i++) {
+            char c = s.charAt(i);
+            switch (c) {
+                case '"': sb.append("\\\""); break;
+                case '\\': sb.append("\\\\"); break;
+                case '\n': sb.append("\\n"); break;
+                case '\r': sb.append("\\r"); break;
+                case '\t': sb.append("\\t"); break;
+                default:
+                    if (c < 0x20) {
+                        sb.append(String.format("\\u%04x", (int) c));
+                    } else {
+                        sb.append(c);
+                    }
+            }
+        }
+        return sb.append('"').toString();
+    }
+}
@@ -0,0 +1,175 @@
+import java.io.BufferedReader;
+import java.io.FileDescriptor;
+import java.io.FileOutputStream;
+import java.io.InputStreamReader;
+import java.io.OutputStream;
+import java.io.PrintStream;
+import java.net.URL;
+import java.net.URLClassLoader;
+import java.nio.charset.StandardCharsets;
+import java.nio.file.Paths;
+import java.util.concurrent.ExecutionException;
+import java.util.concurrent.ExecutorService;
+import java.util.concurrent.Executors;
+import java.util.concurrent.Future;
+import java.util.concurrent.TimeUnit;
+import java.util.concurrent.TimeoutException;
+
+import org.junit.platform.engine.TestExecutionResult;
+import org.junit.platform.engine.TestSource;
+import org.junit.platform.engine.support.descriptor.MethodSource;
+import org.junit.platform.launcher.Launcher;
+import org.junit.platform.launcher.LauncherDiscoveryRequest;
+import org.junit.platform.launcher.TestExecutionListener;
+import org.junit.platform.launcher.TestIdentifier;
+import org.junit.platform.launcher.core.LauncherFactory;
+
+import static org.junit.platform.engine.discovery.DiscoverySelectors.selectClass;
+import static org.junit.platform.launcher.core.LauncherDiscoveryRequestBuilder.request;
+
+// Runs one JUnit test class (GradingTest / GradingTestModul1) against many
+// student submissions inside a single JVM, so the JVM and the JUnit platform
+// are started once per batch instead of once per student.
+//
+// Usage: java -cp <junit-jar>:<runner-dir> BatchRunner <test-classes-dir> <TestClass> <timeout-ms>
+// stdin:  one "<student-id>\t<student-classes-dir>" line per student
+// stdout: one JSON object per line (start / test / timeout / error / done)
+//
+// Every student gets a fresh URLClassLoader holding only their classes and
+// the test class, so Class.forName("Model.Player") inside the test resolves
+// to that student's code and nothing leaks between students. The JUnit
+// platform itself is shared through the parent loader.
+public class BatchRunner {
+
+    private static PrintStream out;
+
+    public static void main(String[] args) throws Exception {
+        URL testClasses = Paths.get(args[0]).toUri().toURL();
+        String testClassName = args[1];
+        long timeoutMs = Long.parseLong(args[2]);
+
+        // Keep our own handle on stdout; student code printing (showDetail)
+        // must not corrupt the result stream.
+        out = new PrintStream(new FileOutputStream(FileDescriptor.out), true, "UTF-8");
+        PrintStream sink = new PrintStream(OutputStream.nullOutputStream());
+        System.setOut(sink);
+        System.setErr(sink);
+
+        BufferedReader in = new BufferedReader(new InputStreamReader(System.in, StandardCharsets.UTF_8));
+        String line;
+        while ((line = in.readLine()) != null) {
+            if (line.isEmpty()) {
+                continue;
+            }
+            String[] parts = line.split("\t", 2);
+            String student = parts[0];
+            emit("start", student, null, null, null);
+            try {
+                runStudent(student, Paths.get(parts[1]).toUri().toURL(), testClasses, testClassName, timeoutMs);
+            } catch (Throwable t) {
+                emit("error", student, null, null, describe(t));
+            }
+            emit("done", student, null, null, null);
+        }
+    }
+
+    private static void runStudent(String student, URL classes, URL testClasses, String testClassName,
+                                   long timeoutMs) throws Exception {
+        URLClassLoader loader = new URLClassLoader(new URL[] {classes, testClasses},
+                BatchRunner.class.getClassLoader());
+        ExecutorService executor = Executors.newSingleThreadExecutor(r -> {
+            Thread t = new Thread(r, "student-" + student);
+            t.setDaemon(true);
+            t.setContextClassLoader(loader);
+            return t;
+        });
+        try {
+            Class<?> testClass = loader.loadClass(testClassName);
+            LauncherDiscoveryRequest discovery = request().selectors(selectClass(testClass)).build();
+            Launcher launcher = LauncherFactory.create();
+            Future<?> run = executor.submit(() -> launcher.execute(discovery, new Collector(student)));
+            try {
+                run.get(timeoutMs, TimeUnit.MILLISECONDS);
+            } catch (TimeoutException e) {
+                // Infinite loop or blocking read in student code: the thread
+                // can't be stopped. The grader replaces this JVM after the
+                // "done" event (grading/junit.py), so it doesn't slow down
+                // the students after this one.
+                run.cancel(true);
+                emit("timeout", student, null, null, "timeout after " + timeoutMs + " ms");
+            } catch (ExecutionException e) {
+                emit("error", student, null, null, describe(e.getCause()));
+            }
+        } finally {
+            executor.shutdownNow();
+            loader.close();
+        }
+    }
+
+    private static class Collector implements TestExecutionListener {
+        private final String student;
+
+        Collector(String student) {
+            this.student = student;
+        }
+
+        @Override
+        public void executionFinished(TestIdentifier id, TestExecutionResult result) {
+            if (!id.isTest()) {
+                return;
+            }
+            String name = id.getDisplayName();
+            TestSource source = id.getSource().orElse(null);
+            if (source instanceof MethodSource) {
+                name = ((MethodSource) source).getMethodName();
+            }
+            String message = result.getThrowable().map(BatchRunner::describe).orElse("");
+            emit("test", student, name, result.getStatus().toString(), message);
+        }
+    }
+
+    private static String describe(Throwable t) {
+        if (t == null) {
+            return "";
+        }
+        return t.getMessage() != null ? t.getMessage() : t.toString();
+    }
+
+    private static synchronized void emit(String event, String student, String test, String status, String message) {
+        StringBuilder sb = new StringBuilder();
+        sb.append("{\"event\":").append(quote(event));
+        sb.append(",\"student\":").append(quote(student));
+        if (test != null) {
+            sb.append(",\"test\":").append(quote(test));
+        }
+        if (status != null) {
+            sb.append(",\"status\":").append(quote(status));
+        }
+        if (message != null) {
+            sb.append(",\"message\":").append(quote(message));
+        }
+        sb.append('}');
+        out.println(sb);
+    }
+
+    private static String quote(String s) {
+        StringBuilder sb = new StringBuilder("\"");
+        for (int i = 0; i < s.length(); i++) {
+            char c = s.charAt(i);
+            switch (c) {
+                case '"': sb.append("\\\""); break;
+                case '\\': sb.append("\\\\"); break;
+                case '\n': sb.append("\\n"); break;
+                case '\r': sb.append("\\r"); break;
+                case '\t': sb.append("\\t"); break;
+                default:
+                    if (c < 0x20) {
+                        sb.append(String.format("\\u%04x", (int) c));
+                    } else {
+                        sb.append(c);
+                    }
+            }
+        }
+        return sb.append('"').toString();
+    }
+}
@@ -0,0 +1,81 @@
+import java.time.LocalDateTime;
+import java.time.format.DateTimeFormatter;
+import java.util.ArrayList;
+import java.util.HashMap;
+import java.util.List;
+import java.util.Map;
+import java.util.Scanner;
+import java.util.UUID;
+import java.util.stream.Collectors;
+
+// Training run for the class-data sharing archive of student Main runs
+// (grading/cds.py): does what a typical Modul 1 / Modul 2 Main does, so the
+// JDK classes behind it (Scanner, UUID, LocalDateTime, string concatenation,
+// collections, lambdas, formatting) are loaded once and archived.
+public class CdsTrainer {
+
+    enum Kind { CAR, MOTORCYCLE, TRUCK }
+
+    interface Detail {
+        void showDetail();
+
+        default String label() {
+            return getClass().getSimpleName();
+        }
+    }
+
+    static class Item implements Detail {
+        private final UUID id = UUID.randomUUID();
+        private final LocalDateTime createdAt = LocalDateTime.now();
+        private final String name;
+        private final Kind kind;
+        private int score;
+        private double price;
+
+        Item(String name, Kind kind, double price) {
+            this.name = name;
+            this.kind = kind;
+            this.price = price;
+        }
+
+        void update(int value) {
+            if (value > score) {
+                score = value;
+            }
+            price += value * 1.5;
+        }
+
+        @Override
+        public void showDetail() {
+            System.out.println(label() + " " + id + " " + name + " (" + kind + ") score=" + score);
+            System.out.printf("Harga: %.2f, dibuat %s%n", price, createdAt.format(DateTimeFormatter.ISO_LOCAL_DATE_TIME));
+        }
+    }
+
+    public static void main(String[] args) {
+        Scanner scanner = new Scanner(System.in);
+        List<Item> items = new ArrayList<>();
+        Map<Kind, Integer> counts = new HashMap<>();
+        int i = 0;
+        while (scanner.hasNextLine()) {
+            String line = scanner.nextLine().trim();
+            if (line.isEmpty()) {
+                continue;
+            }
+            Kind kind = Kind.values()[i++ % Kind.values().length];
+            items.add(new Item(line, kind, Double.parseDouble("100.0")));
+            counts.merge(kind, 1, Integer::sum);
+        }
+        try {
+            Integer.parseInt("bukan angka");
+        } catch (NumberFormatException e) {
+            System.out.println("Input tidak valid: " + e.getMessage());
+        }
+        for (Item item : items) {
+            item.update(item.name.length() * 10);
+            item.showDetail();
+        }
+        String names = items.stream().map(item -> item.name.toUpperCase()).sorted().collect(Collectors.joining(", "));
+        System.out.println(String.format("%d item: %s %s", items.size(), names, counts));
+    }
+}
@@ -0,0 +1,220 @@
+import os
+import json
+import shutil
+import hashlib
+import threading
+import subprocess
+
+from grading.cds import CDS_DIR, TRAINER_SOURCE, dump_flags, share_flags, training_run
+
+# Compiled-class cache for student submissions.
+#
+# Class files live in <build_dir>/classes/<key>/ where key hashes the javac
+# version and the submission's source set (relative paths + contents). A
+# submission that did not change since the last run reuses its classes; all
+# the ones that did are compiled together by one BatchCompiler JVM
+# (java/BatchCompiler.java) instead of one javac process each. Identical
+# submissions share one entry. A submission is compiled as UTF-8, or as
+# windows-1252 when one of its files isn't valid UTF-8 (source_encoding).
+#
+# The grading server (grading/server.py) compiles one submission per request;
+# there the BatchCompiler JVM is kept running between requests (warm, a
+# grading.junit.WarmProcess) instead of started for every batch.
+
+DEFAULT_MAX_ENTRIES = 4000
+MARKER = ".compiled.json"
+COMPILE_OPTIONS = ["-nowarn", "-proc:none"]
+# -encoding for a submission with a file that isn't valid UTF-8: what Windows
+# editors save, and what the static grader still reads (grading/index.py)
+FALLBACK_ENCODING = "windows-1252"
+
+_javac_version = None
+
+
+def javac_version():
+    global _javac_version
+    if _javac_version is None:
+        proc = subprocess.run(["javac", "-version"], stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+        _javac_version = proc.stdout.strip()
+    return _javac_version
+
+def source_key(sources):
+    h = hashlib.sha256()
+    h.update(javac_version().encode())
+    h.update(repr(COMPILE_OPTIONS).encode())
+    if sources:
+        base = os.path.commonpath([os.path.dirname(s) for s in sources])
+        for path in sorted(sources, key=lambda s: os.path.relpath(s, base)):
+            h.update(os.path.relpath(path, base).encode("utf-8", "surrogateescape") + b"\0")
+            try:
+                with open(path, "rb") as f:
+                    h.update(hashlib.sha256(f.read()).digest())
+            except OSError:
+                h.update(b"unreadable")
+    return h.hexdigest()[:32]
+
+def source_encoding(sources):
+    for path in sources:
+        try:
+            with open(path, "rb") as f:
+                f.read().decode("utf-8")
+        except UnicodeDecodeError:
+            return FALLBACK_ENCODING
+        except OSError:
+            continue
+    return "UTF-8"
+
+def _feed(stream, data):
+    try:
+        stream.write(data)
+        stream.close()
+    except (BrokenPipeError, OSError):
+        pass
+
+
+class CompileCache:
+    def __init__(self, build_dir, runner_dir, max_entries=DEFAULT_MAX_ENTRIES):
+        self.build_dir = build_dir
+        self.root = os.path.join(build_dir, "classes")
+        self.runner_dir = runner_dir
+        self.max_entries = max_entries
+        self.classpath = [runner_dir]
+        self.share = []
+        self.warm = None
+
+    def use_jar(self, jar):
+        # The runner classes packed into a jar, which a class-data sharing
+        # archive can be built for (grading/cds.py)
+        self.classpath = [jar]
+        self.share = share_flags(self.build_dir, "compiler", self.classpath)
+
+    def command(self, flags):
+        return ["java"] + flags + ["-cp", os.pathsep.join(self.classpath), "BatchCompiler"]
+
+    def launch(self):
+        return subprocess.Popen(self.command(self.share),
+                                stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                                text=True, encoding="utf-8")
+
+    def build_archive(self):
+        # Training run for the class-data sharing archive (grading/cds.py):
+        # compiles CdsTrainer.java. Needs use_jar() first (the stages'
+        # prepare()).
+        if not self.classpath[0].endswith(".jar"):
+            raise RuntimeError("runner.jar belum dibuat")
+        path, flags = dump_flags(self.build_dir, "compiler", self.classpath)
+        out = os.path.join(self.build_dir, CDS_DIR, "compiler-train")
+        shutil.rmtree(out, ignore_errors=True)
+        return training_run(self.command(flags), path, "\t".join(["cds", out, "UTF-8", TRAINER_SOURCE]) + "\n")
+
+    def _entry(self, key):
+        return os.path.join(self.root, key)
+
+    def lookup(self, key):
+        # (classes_dir, error) for a cached compile, None on a miss
+        marker = os.path.join(self._entry(key), MARKER)
+        try:
+            with open(marker, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            os.utime(marker)
+        except (OSError, ValueError):
+            return None
+        if data["ok"]:
+            return self._entry(key), None
+        return None, data["message"]
+
+    def _store(self, key, tmp_dir, ok, message):
+        with open(os.path.join(tmp_dir, MARKER), "w", encoding="utf-8") as f:
+            json.dump({"ok": ok, "message": message}, f)
+        entry = self._entry(key)
+        shutil.rmtree(entry, ignore_errors=True)
+        try:
+            os.replace(tmp_dir, entry)
+        except OSError:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    def _compile_batch(self, jobs):
+        # jobs: key -> (tmp_dir, encoding, sources). One JVM compiles all of
+        # them. Returns key -> (ok, message); empty if the batch compiler
+        # can't run.
+        manifest = "".join("\t".join([key, tmp, encoding] + list(sources)) + "\n"
+                           for key, (tmp, encoding, sources) in jobs.items())
+        if self.warm is not None:
+            waiting = set(jobs)
+            events, _ = self.warm.exchange(manifest, lambda event: waiting.discard(event.get("key")) or not waiting)
+            return {event["key"]: (event["ok"], event.get("message", "")) for event in events if "key" in event}
+        try:
+            proc = self.launch()
+        except OSError:
+            return {}
+        writer = threading.Thread(target=_feed, args=(proc.stdin, manifest), daemon=True)
+        writer.start()
+        results = {}
+        for line in proc.stdout:
+            try:
+                event = json.loads(line)
+            except ValueError:
+                continue
+            results[event["key"]] = (event["ok"], event.get("message", ""))
+        proc.wait()
+        writer.join()
+        return results
+
+    def _compile_one(self, tmp, encoding, sources):
+        # Fallback when the batch compiler is unavailable
+        cmd = ["javac"] + COMPILE_OPTIONS + ["-encoding", encoding, "-d", tmp, "-cp", tmp] + list(sources)
+        proc = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, errors="replace")
+        if proc.returncode == 0:
+            return True, ""
+        errors = [l for l in proc.stdout.splitlines() if "error" in l]
+        return False, errors[0] if errors else proc.stdout.strip()[:200]
+
+    def compile_all(self, submissions):
+        # submissions: list of (student_path, [sources]).
+        # Returns student_path -> (classes_dir, error message or None).
+        results = {}
+        keys = {}
+        jobs = {}
+        for student_path, sources in submissions:
+            if not sources:
+                results[student_path] = (None, "tidak ada file .java")
+                continue
+            key = source_key(sources)
+            keys[student_path] = key
+            if key not in jobs and self.lookup(key) is None:
+                # Server threads compile concurrently in one process
+                tmp = self._entry(key) + f".tmp-{os.getpid()}-{threading.get_ident()}"
+                shutil.rmtree(tmp, ignore_errors=True)
+                os.makedirs(tmp)
+                jobs[key] = (tmp, source_encoding(sources), sources)
+
+        if jobs:
+            print(f"Compile {len(jobs)} submission (cache: {len(keys) - len(jobs)} dipakai ulang)...")
+            compiled = self._compile_batch(jobs)
+            for key, (tmp, encoding, sources) in jobs.items():
+                ok, message = compiled.get(key) or self._compile_one(tmp, encoding, sources)
+                self._store(key, tmp, ok, "" if ok else "compile error: " + message)
+
+        for student_path, key in keys.items():
+            classes, error = self.lookup(key) or (None, "compile error")
+            results[student_path] = (classes, error)
+        self.prune()
+        return results
+
+    def prune(self):
+        try:
+            names = os.listdir(self.root)
+        except OSError:
+            return 0
+        entries = []
+        for name in names:
+            marker = os.path.join(self.root, name, MARKER)
+            try:
+                entries.append((os.stat(marker).st_mtime, name))
+            except OSError:
+                continue
+        removed = 0
+        for mtime, name in sorted(entries)[:max(0, len(entries) - self.max_entries)]:
+            shutil.rmtree(os.path.join(self.root, name), ignore_errors=True)
+            removed += 1
+        return removed
@@ -0,0 +1,308 @@
+import os
+import re
+import json
+import shutil
+import hashlib
+import threading
+import subprocess
+
+from grading import profile
+from grading.cds import CDS_DIR, dump_flags, runner_jar, share_flags, training_run
+from grading.index import open_index
+from grading.javac import CompileCache
+
+# Dynamic testing stage: compile every submission, then run the JUnit
+# grading suite (GradingTest.java / GradingTestModul1.java) for the whole
+# cohort inside one long-lived JVM (see java/BatchRunner.java). Compiled
+# classes are cached per source set (grading/javac.py).
+#
+# The grading server (grading/server.py) grades one submission per request;
+# there each worker keeps its BatchCompiler and BatchRunner JVMs running
+# between requests (WarmProcess), so a request pays neither JVM startup nor
+# class loading of JUnit and the grading test.
+#
+# After `python -m grading.cds`, every BatchRunner and BatchCompiler JVM
+# starts from a class-data sharing archive of the JUnit platform, the grading
+# test and javac (grading/cds.py).
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+JUNIT_JAR = os.path.join(REPO_ROOT, "lib", "junit-platform-console-standalone-1.9.2.jar")
+JAVA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "java")
+TEST_DIRS = {"test", "tests"}
+RUNNER_SOURCES = [os.path.join(JAVA_DIR, "BatchRunner.java"), os.path.join(JAVA_DIR, "BatchCompiler.java")]
+DEFAULT_BUILD_DIR = ".grade_build"
+DEFAULT_TIMEOUT = 10.0
+
+
+def java_available():
+    return bool(shutil.which("java") and shutil.which("javac"))
+
+def student_id(student_path):
+    # Stable, filesystem-safe id for a student folder
+    name = re.sub(r"[^\w.-]", "_", os.path.basename(os.path.normpath(student_path)))
+    digest = hashlib.sha1(os.path.abspath(student_path).encode("utf-8", "surrogateescape")).hexdigest()[:8]
+    return f"{name}-{digest}"
+
+def _feed(stream, data):
+    try:
+        stream.write(data)
+        stream.close()
+    except (BrokenPipeError, OSError):
+        pass
+
+def test_facts(tests, results, error=None):
+    # Raw outcomes for the rubric: junit_<method> (passed?) and junit_msg_<method>
+    facts = {"junit_ran": True}
+    for method in tests:
+        status, message = results.get(method, ("MISSING", error or "test tidak dijalankan"))
+        facts["junit_" + method] = status == "SUCCESSFUL"
+        lines = (message or status).splitlines()
+        facts["junit_msg_" + method] = lines[0] if lines else ""
+    return facts
+
+
+class WarmProcess:
+    # A line-oriented helper JVM (BatchRunner, BatchCompiler) kept running
+    # between requests. Started on first use and again after it died.
+    def __init__(self, launch):
+        self.launch = launch
+        self.proc = None
+
+    def start(self):
+        if self.proc is None or self.proc.poll() is not None:
+            self.proc = self.launch()
+
+    def exchange(self, lines, last):
+        # Sends request lines, returns (events, alive): the JSON events up to
+        # the one for which last(event) is true. alive is False if the JVM
+        # exited first; it is replaced on the next exchange.
+        try:
+            self.start()
+            self.proc.stdin.write(lines)
+            self.proc.stdin.flush()
+        except OSError:
+            self.close()
+            return [], False
+        events = []
+        for line in self.proc.stdout:
+            try:
+                event = json.loads(line)
+            except ValueError:
+                continue
+            events.append(event)
+            if last(event):
+                return events, True
+        self.close()
+        return events, False
+
+    def close(self):
+        if self.proc is not None:
+            self.proc.kill()
+            self.proc.wait()
+            self.proc = None
+
+
+class JUnitStage:
+    def __init__(self, test_source, test_class, tests, build_dir=DEFAULT_BUILD_DIR, timeout=DEFAULT_TIMEOUT):
+        self.test_source = test_source
+        self.test_class = test_class
+        self.tests = tests
+        self.build_dir = os.path.abspath(build_dir)
+        self.timeout = timeout
+        self.runner_dir = os.path.join(self.build_dir, "runner")
+        self.test_dir = os.path.join(self.build_dir, "tests", test_class)
+        self.runner_jar = self.runner_dir + ".jar"
+        self.compile_cache = CompileCache(self.build_dir, self.runner_dir)
+        self.share = []
+        self.warm = None
+
+    def _javac(self, out_dir, sources, classpath):
+        os.makedirs(out_dir, exist_ok=True)
+        cmd = ["javac", "-nowarn", "-proc:none", "-encoding", "UTF-8", "-d", out_dir, "-cp", classpath] + list(sources)
+        return subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, errors="replace")
+
+    def prepare(self):
+        # Runner, batch compiler and grading test are only rebuilt when their
+        # sources are newer than the compiled classes
+        for out_dir, sources, main_class in (
+                (self.runner_dir, RUNNER_SOURCES, "BatchRunner"),
+                (self.test_dir, [self.test_source], self.test_class)):
+            compiled = os.path.join(out_dir, main_class + ".class")
+            if os.path.exists(compiled) and all(os.path.getmtime(s) <= os.path.getmtime(compiled) for s in sources):
+                continue
+            proc = self._javac(out_dir, sources, JUNIT_JAR)
+            if proc.returncode != 0:
+                names = ", ".join(os.path.basename(s) for s in sources)
+                raise RuntimeError(f"Gagal compile {names}:\n{proc.stdout}")
+        self.runner_jar = runner_jar(self.runner_dir)
+        self.compile_cache.use_jar(self.runner_jar)
+        self.share = share_flags(self.build_dir, "runner-" + self.test_class, self._archived())
+
+    def _archived(self):
+        # Files the class-data sharing archive is built from
+        return [JUNIT_JAR, self.runner_jar, os.path.join(self.test_dir, self.test_class + ".class")]
+
+    def _command(self, flags):
+        classpath = os.pathsep.join([JUNIT_JAR, self.runner_jar])
+        return ["java"] + flags + ["-XX:TieredStopAtLevel=1", "-cp", classpath, "BatchRunner",
+                                   self.test_dir, self.test_class, str(int(self.timeout * 1000))]
+
+    def _launch(self):
+        return subprocess.Popen(self._command(self.share), stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                stderr=subprocess.DEVNULL, text=True, encoding="utf-8")
+
+    def build_archive(self):
+        # Training run for the class-data sharing archive (grading/cds.py): an
+        # empty submission through the whole suite loads the JUnit platform
+        # and the test class
+        self.prepare()
+        path, flags = dump_flags(self.build_dir, "runner-" + self.test_class, self._archived())
+        empty = os.path.join(self.build_dir, CDS_DIR, "empty")
+        os.makedirs(empty, exist_ok=True)
+        return training_run(self._command(flags), path, f"cds\t{empty}\n")
+
+    def _record(self, event, results):
+        # Adds one BatchRunner event to results; returns its kind
+        sid = event.get("student")
+        kind = event.get("event")
+        if kind == "start":
+            results[sid] = {}
+        elif kind == "test":
+            results[sid][event["test"]] = (event["status"], event.get("message", ""))
+        elif kind in ("timeout", "error"):
+            for method in self.tests:
+                results[sid].setdefault(method, ("FAILED", event.get("message", kind)))
+        return kind
+
+    def run(self, batch):
+        # batch: list of (sid, classes_dir). Returns sid -> {method: (status, message)}.
+        # If student code kills the JVM (System.exit, crash), that student is
+        # marked as crashed and a new JVM picks up the rest of the batch. The
+        # same after a timeout: the abandoned test thread would keep running
+        # next to every later student.
+        results = {}
+        pending = list(batch)
+        while pending:
+            proc = self._launch()
+            manifest = "".join(f"{sid}\t{classes}\n" for sid, classes in pending)
+            # Feed the manifest from a thread so a large cohort can't deadlock
+            # on full stdin/stdout pipes
+            writer = threading.Thread(target=_feed, args=(proc.stdin, manifest), daemon=True)
+            writer.start()
+            current = None
+            finished = set()
+            timed_out = False
+            for line in proc.stdout:
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    continue
+                kind = self._record(event, results)
+                if kind == "start":
+                    current = event.get("student")
+                elif kind == "timeout":
+                    timed_out = True
+                elif kind == "done":
+                    finished.add(event.get("student"))
+                    current = None
+                    if timed_out:
+                        break
+            if timed_out:
+                proc.kill()
+            proc.wait()
+            proc.stdout.close()
+            writer.join()
+            if current is not None:
+                for method in self.tests:
+                    results[current].setdefault(method, ("FAILED", "JVM berhenti saat menjalankan test (System.exit?)"))
+                finished.add(current)
+            remaining = [item for item in pending if item[0] not in finished]
+            if len(remaining) == len(pending):
+                # JVM failed before doing anything; don't loop forever
+                for sid, _ in remaining:
+                    results[sid] = {m: ("FAILED", "JVM gagal dijalankan") for m in self.tests}
+                break
+            pending = remaining
+        return results
+
+    def grade_all(self, submissions):
+        # submissions: list of (student_path, [source files]).
+        # Returns student_path -> raw outcome facts for the rubric.
+        self.prepare()
+        facts = {}
+        batch = []
+        sids = {}
+        with profile.phase("junit compile"):
+            compiled = self.compile_cache.compile_all(submissions)
+        for student_path, sources in submissions:
+            sid = student_id(student_path)
+            classes, error = compiled[student_path]
+            if error:
+                facts[student_path] = test_facts(self.tests, {}, error)
+            else:
+                sids[sid] = student_path
+                batch.append((sid, classes))
+        with profile.phase("junit run"):
+            outcomes = self.run(batch)
+        for sid, tests in outcomes.items():
+            facts[sids[sid]] = test_facts(self.tests, tests)
+        return facts
+
+    def start_warm(self):
+        # Warm mode: compiler and runner JVMs stay up between grade_one calls
+        if self.warm is None:
+            self.prepare()
+            self.warm = WarmProcess(self._launch)
+            self.compile_cache.warm = WarmProcess(self.compile_cache.launch)
+        self.warm.start()
+        self.compile_cache.warm.start()
+
+    def grade_one(self, student_path, sources):
+        # Raw outcome facts of one submission, on the warm JVMs
+        self.start_warm()
+        with profile.phase("junit compile"):
+            classes, error = self.compile_cache.compile_all([(student_path, sources)])[student_path]
+        if error:
+            return test_facts(self.tests, {}, error)
+        sid = student_id(student_path)
+        results = {sid: {}}
+        with profile.phase("junit run"):
+            events, alive = self.warm.exchange(f"{sid}\t{classes}\n", lambda event: event.get("event") == "done")
+        for event in events:
+            self._record(event, results)
+        if not alive:
+            message = "JVM berhenti saat menjalankan test (System.exit?)" if events else "JVM gagal dijalankan"
+            for method in self.tests:
+                results[sid].setdefault(method, ("FAILED", message))
+        elif any(event.get("event") == "timeout" for event in events):
+            # The timed-out test thread can't be stopped and would keep
+            # running inside the JVM; start a clean one for the next request
+            self.warm.close()
+        return test_facts(self.tests, results[sid])
+
+    def close(self):
+        for process in (self.warm, self.compile_cache.warm):
+            if process is not None:
+                process.close()
+
+
+def is_test_source(path, root):
+    # The student's own unit tests (FooTest.java, test/...): they need test
+    # libraries the grader doesn't put on the class path, and one that
+    # doesn't compile would fail the whole submission
+    parts = os.path.relpath(path, root).split(os.sep)
+    return "Test" in parts[-1] or any(part.lower() in TEST_DIRS for part in parts[:-1])
+
+def collect_sources(student_paths, find_source_root, build_dir=DEFAULT_BUILD_DIR):
+    # (student_path, [.java files under the detected source root]) per student,
+    # without the student's own tests. Submissions read from a zip get their
+    # sources written under build_dir.
+    submissions = []
+    for student_path in student_paths:
+        index = open_index(student_path)
+        root = find_source_root(student_path, index)
+        scratch = os.path.join(build_dir, "sources", student_id(student_path))
+        paths = [path for path in index.files(suffix=".java", under=root) if not is_test_source(path, root)]
+        sources = index.local_files(paths, scratch)
+        submissions.append((student_path, sources))
+    return submissions
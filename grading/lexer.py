@@ -0,0 +1,476 @@
+import re
+import bisect
+import functools
+
+# One lexing pass per .java file, shared by every check of a rubric.
+#
+# lex() drops comments and empties string/char literals in one regex scan,
+# so commented-out code and text inside println(...) can't satisfy a check.
+# The remaining code is tokenized and the tokens are read once to index the
+# declarations: types, fields, methods, constructors and call sites, each
+# rendered as a short normalized line of code that a Check regex can query
+# (see Check.scope in grading/rubric.py):
+#
+#   types         "public class Player implements ShowDetail"
+#   fields        "private int highScore = 0;"   (one per declarator)
+#   methods       "public void addCoins(int coins)"   ("...();" when abstract)
+#   constructors  "public Score(int value) { this.value = value; }"
+#   calls         "UUID.randomUUID(", "System.out.println(", "new Player("
+#
+# The parser is forgiving: unbalanced braces or half-written members never
+# raise, they just end up indexed less precisely.
+#
+# Only member-level code is tokenized. Method bodies, initializer blocks and
+# other non-type braces are located by a regex scan and kept as one "{}"
+# token, and call sites are found by a regex over the whole code, so a large
+# file costs little more than the regex checks it replaces.
+
+# Comments and literals, matched left to right in one scan so that "//"
+# inside a string or a quote inside a comment is handled correctly
+STRIP = re.compile(r'''
+    //[^\n]*
+  | /\*[\s\S]*?(?:\*/|\Z)
+  | """[\s\S]*?(?:"""|\Z)
+  | "(?:[^"\\\n]|\\.)*"?
+  | '(?:[^'\\\n]|\\.)*'?
+''', re.VERBOSE)
+TOKEN = re.compile(r'[^\W\d][\w$]*|\$[\w$]*|\d[\w.]*|\S')
+# Scanned separately and combined in Python: plain literal searches are
+# several times faster than one alternation over every character
+BRACE = re.compile(r'[{}]')
+MEMBER_KEYWORD = re.compile(r'(?:public|protected|private|static)\b')
+TYPE_KEYWORD = re.compile(r'(?:class|interface|enum|record)\b')
+RECORD_TAIL = re.compile(r'\s+[\w$]+\s*[(<]')
+IMPORT = re.compile(r'\s*(?:package|import)\b')
+PAREN = re.compile(r'\(')
+NEW = re.compile(r'new\b')
+NEW_TYPE = re.compile(r'(?:\s*(?:\.|[^\W\d][\w$]*|\$[\w$]*))+')
+BRACKETS = re.compile(r'[()\[\]{}]')
+DECLARATION_TAIL = re.compile(r'\s*(?:\{|throws\b)')
+ARRAY_TAIL = re.compile(r'\s*\[')
+
+MODIFIERS = {
+    "public", "protected", "private", "static", "final", "abstract", "native",
+    "synchronized", "transient", "volatile", "strictfp", "default", "sealed",
+}
+# Can't start a statement inside a method body, only a new member
+MEMBER_START = {"public", "protected", "private", "static"}
+TYPE_KEYWORDS = {"class", "interface", "enum", "record"}
+NOT_CALLS = {
+    "if", "for", "while", "switch", "catch", "synchronized", "return", "throw",
+    "new", "else", "do", "try", "case", "assert", "instanceof",
+}
+CLOSING = {"(": ")", "[": "]", "{": "}"}
+
+
+class JavaSource:
+    __slots__ = ("code", "types", "fields", "methods", "constructors", "calls")
+
+    def __init__(self, code):
+        self.code = code            # source without comments, literals emptied
+        self.types = []
+        self.fields = []
+        self.methods = []
+        self.constructors = []
+        self.calls = []
+
+
+class _Parser:
+    def __init__(self, source, toks):
+        self.src = source
+        self.code = source.code
+        self.toks = toks            # (text, start, end), offsets into code
+        self.n = len(toks)
+        self.decl_names = set()     # code offsets of declared method and enum constant names
+
+    def text(self, i):
+        return self.toks[i][0] if i < self.n else ""
+
+    def render(self, a, b):
+        # Normalized code for tokens a..b-1
+        if a >= b:
+            return ""
+        return " ".join(self.code[self.toks[a][1]:self.toks[b - 1][2]].split())
+
+    def skip_group(self, i):
+        # i is at an opening bracket; returns the index after its match
+        stack = []
+        while i < self.n:
+            t = self.toks[i][0]
+            if t in CLOSING:
+                stack.append(CLOSING[t])
+            elif stack and t == stack[-1]:
+                stack.pop()
+                if not stack:
+                    return i + 1
+            elif t in (")", "]", "}") and t not in stack:
+                # Unbalanced closer: give up on this group here
+                return i
+            i += 1
+        return i
+
+    def skip_annotations(self, i):
+        while self.text(i) == "@" and self.text(i + 1) != "interface":
+            i += 2
+            while self.text(i) == "." and i + 1 < self.n:
+                i += 2
+            if self.text(i) == "(":
+                i = self.skip_group(i)
+        return i
+
+    def parse(self):
+        i = 0
+        while i < self.n:
+            i = self.statement(i)
+
+    def statement(self, i):
+        # One member declaration inside a type body. Top-level statements go
+        # through here too, so members are still indexed when the class
+        # header is missing or the braces don't line up.
+        i = self.skip_annotations(i)
+        start = i
+        if self.text(i) in ("package", "import"):
+            while i < self.n and self.toks[i][0] != ";":
+                i += 1
+            return i + 1
+        while i < self.n:
+            t = self.toks[i][0]
+            if t == ";":
+                if start < i:
+                    self.field(start, i)
+                return i + 1
+            if t == "}":
+                return i if start < i else i + 1
+            if t in TYPE_KEYWORDS and self.text(i - 1) != "." and (t != "record" or self.text(i + 2) in ("(", "<")):
+                return self.type_decl(start, i)
+            if t == "@":
+                j = self.skip_annotations(i)
+                i = j if j > i else i + 1
+                continue
+            if t == "(":
+                return self.method(start, i)
+            if t == "=":
+                return self.field_with_init(start, i)
+            if t == "{}":
+                # Initializer block
+                return i + 1
+            if t == "{":
+                return self.skip_group(i)
+            if t == "[":
+                i = self.skip_group(i)
+                continue
+            i += 1
+        return i
+
+    def type_decl(self, start, kw):
+        i = kw + 1
+        while i < self.n and self.toks[i][0] not in ("{", ";", "{}"):
+            i = self.skip_group(i) if self.toks[i][0] in ("(", "[") else i + 1
+        self.src.types.append(self.render(start, i))
+        if self.text(i) != "{":
+            return i + 1
+        i += 1
+        if self.toks[kw][0] == "enum":
+            i = self.enum_constants(i)
+        while i < self.n and self.toks[i][0] != "}":
+            i = self.statement(i)
+        return i + 1
+
+    def enum_constants(self, i):
+        while i < self.n:
+            t = self.toks[i][0]
+            if t == ";":
+                return i + 1
+            if t == "}" or t in MEMBER_START or t in TYPE_KEYWORDS:
+                return i
+            if t == "(" and i > 0 and _is_ident(self.toks[i - 1][0]):
+                # CAR("Mobil", 4): constructor arguments, not a call
+                self.decl_names.add(self.toks[i - 1][1])
+            i = self.skip_group(i) if t in CLOSING else i + 1
+        return i
+
+    def member_head(self, start, end):
+        # Modifiers before a member name, and where the rest begins
+        i = start
+        mods = []
+        while i < end and self.toks[i][0] in MODIFIERS:
+            mods.append(self.toks[i][0])
+            i += 1
+        return mods, i
+
+    def method(self, start, paren):
+        name_at = paren - 1
+        close = self.skip_group(paren)
+        i = close
+        while i < self.n and self.toks[i][0] not in ("{}", "{", ";", "}"):
+            i += 1
+        body = self.text(i) in ("{}", "{")
+        if name_at < start or not _is_ident(self.toks[name_at][0]) or self.toks[name_at][0] in NOT_CALLS \
+                or self.text(name_at - 1) in (".", "new"):
+            # A call or control statement outside any method body (broken code)
+            if body:
+                return i + 1 if self.text(i) == "{}" else self.skip_group(i)
+            return i + 1 if self.text(i) == ";" else i
+        self.decl_names.add(self.toks[name_at][1])
+        mods, rest = self.member_head(start, name_at)
+        # No return type before the name: a constructor
+        is_constructor = rest >= name_at
+        signature = self.render(start, close)
+        if body:
+            end = i + 1 if self.text(i) == "{}" else self.skip_group(i)
+            if is_constructor:
+                self.src.constructors.append(signature + " " + self.render(i, end))
+            else:
+                self.src.methods.append(signature)
+            return end
+        if not is_constructor:
+            self.src.methods.append(signature + ";")
+        return i + 1 if self.text(i) == ";" else i
+
+    def declarators(self, start, end):
+        # Split "int a = 1, b;" into type part and one token range per name
+        mods, i = self.member_head(start, end)
+        type_start = i
+        depth = 0
+        while i < end:
+            t = self.toks[i][0]
+            if t == "<":
+                depth += 1
+            elif t == ">":
+                depth -= 1
+            elif depth <= 0 and t not in (".", "[", "]", "?", "&") and i > type_start \
+                    and self.toks[i - 1][0] not in (".", "<", ",", "?", "&", "extends", "super"):
+                break
+            i += 1
+        ranges = []
+        first = i
+        j = i
+        while j < end:
+            t = self.toks[j][0]
+            if t in CLOSING:
+                j = self.skip_group(j)
+                continue
+            if t == ",":
+                ranges.append((first, j))
+                first = j + 1
+            j += 1
+        ranges.append((first, end))
+        prefix = " ".join(mods + [self.render(type_start, i)]) if type_start < i else " ".join(mods)
+        return prefix, ranges
+
+    def field(self, start, end):
+        prefix, ranges = self.declarators(start, end)
+        for a, b in ranges:
+            if a < b:
+                self.src.fields.append(f"{prefix} {self.render(a, b)};".strip())
+
+    def field_with_init(self, start, eq):
+        # Skip the initializer (may hold braces, lambdas, anonymous classes)
+        i = eq
+        while i < self.n:
+            t = self.toks[i][0]
+            if t == ";":
+                break
+            if t == "}":
+                break
+            i = self.skip_group(i) if t in CLOSING else i + 1
+        self.field(start, i)
+        return i + 1 if self.text(i) == ";" else i
+
+
+def _blocks(code):
+    # (start, end) of every outermost brace block that is not a type body.
+    # A method body missing its closing brace ends where the next member
+    # obviously starts: "public ...", "private ..." after ; { or } directly
+    # in the body, where no statement can start that way. Deeper down it
+    # belongs to an anonymous or local class. Blocks in a field initializer
+    # (array values, lambdas, anonymous classes) never end early.
+    braces = [m.start() for m in BRACE.finditer(code)]
+    members = [m.start() for m in MEMBER_KEYWORD.finditer(code)
+               if _word_start(code, m.start()) and _previous_char(code, m.start()) in (";", "{", "}")]
+    types = [m.start() for m in TYPE_KEYWORD.finditer(code)
+             if _word_start(code, m.start()) and code[m.start() - 1:m.start()] != "."
+             and (m.group() != "record" or RECORD_TAIL.match(code, m.end()))]
+    spans = []
+    last = 0                # end of the last brace or block outside a block
+    type_from = 0           # a type keyword after this (and no ";" after the
+                            # keyword) makes the next "{" a type body
+    i = 0
+    while i < len(braces):
+        start = braces[i]
+        if code[start] == "}":
+            last = start + 1
+            i += 1
+            continue
+        head = code[max(last, code.rfind(";", last, start) + 1):start]
+        if IMPORT.match(head):
+            # Not a block: the statement runs to its ";" (see _Parser.statement)
+            i += 1
+            continue
+        k = bisect.bisect_left(types, start) - 1
+        if k >= 0 and types[k] >= type_from and code.find(";", types[k], start) < 0:
+            last = type_from = start + 1
+            i += 1
+            continue
+        eq = head.find("=")
+        paren = head.find("(")
+        k = bisect.bisect_right(members, start) if eq < 0 or 0 <= paren < eq else len(members)
+        stop = None
+        depth = 0
+        while i < len(braces):
+            # Member keywords before this brace are at the current depth
+            while k < len(members) and members[k] < braces[i] and depth != 1:
+                k += 1
+            if k < len(members) and members[k] < braces[i]:
+                stop = members[k]
+                break
+            depth += 1 if code[braces[i]] == "{" else -1
+            i += 1
+            if depth == 0:
+                break
+        if stop is None:
+            stop = members[k] if depth == 1 and k < len(members) else len(code)
+        if depth == 0:
+            last = braces[i - 1] + 1
+            spans.append((start, last))
+        else:
+            spans.append((start, _previous_char_end(code, stop)))
+            last = stop
+        type_from = last
+    return spans
+
+
+def _word_start(code, i):
+    return i == 0 or not (code[i - 1].isalnum() or code[i - 1] in "_$")
+
+
+def _previous_char_end(code, i):
+    while i > 0 and code[i - 1].isspace():
+        i -= 1
+    return i
+
+
+def _previous_char(code, i):
+    i = _previous_char_end(code, i)
+    return code[i - 1] if i > 0 else ""
+
+
+def _tokens(code):
+    # Member-level tokens; each block from _blocks is a single "{}" token
+    toks = []
+    pos = 0
+    for start, end in _blocks(code):
+        toks.extend((m.group(), m.start(), m.end()) for m in TOKEN.finditer(code, pos, start))
+        toks.append(("{}", start, end))
+        pos = end
+    toks.extend((m.group(), m.start(), m.end()) for m in TOKEN.finditer(code, pos))
+    return toks
+
+
+def _calls(code, decl_names):
+    calls = []
+    ends = _group_ends(code)
+    for m in NEW.finditer(code):
+        # new X(...), new X<>(...); arrays as "new X["
+        target = NEW_TYPE.match(code, m.end())
+        if target is not None and _word_start(code, m.start()):
+            opening = "[" if ARRAY_TAIL.match(code, target.end()) else "("
+            calls.append((m.start(), "new " + "".join(target.group().split()) + opening))
+    for m in PAREN.finditer(code):
+        end = _previous_char_end(code, m.start())
+        start = _word_begin(code, end)
+        name = code[start:end]
+        if not name or name[0].isdigit() or name in NOT_CALLS or start in decl_names:
+            continue
+        if _declaration(code, m.start(), ends):
+            # Declaration the parser didn't visit (anonymous class member)
+            continue
+        # Qualifiers: "a.b.name(", or ".name(" after a call or index
+        parts = [name]
+        while True:
+            j = _previous_char_end(code, start)
+            if code[j - 1:j] != ".":
+                break
+            k = _previous_char_end(code, j - 1)
+            q = _word_begin(code, k)
+            if q < k and code[q].isdigit() and k == j - 1 and j == start:
+                # "1.name(": part of a number literal, not a call
+                parts = None
+                break
+            if q == k or code[q].isdigit():
+                parts.append(".")
+                break
+            parts.append(".")
+            parts.append(code[q:k])
+            start = q
+        if parts is None:
+            continue
+        j = _previous_char_end(code, start)
+        if parts[-1] != "." and code[j - 3:j] == "new" and _word_start(code, j - 3):
+            continue
+        if code[j - 1:j] == "@":
+            # Annotation arguments: @SuppressWarnings("unused")
+            continue
+        calls.append((start, "".join(reversed(parts)) + "("))
+    calls.sort()
+    return [call for _, call in calls]
+
+
+def _word_begin(code, end):
+    # Start of the identifier that ends at end (end itself if there is none)
+    i = end
+    while i > 0 and (code[i - 1].isalnum() or code[i - 1] in "_$"):
+        i -= 1
+    return i
+
+
+def _group_ends(code):
+    # Where the group each "(" opens is closed, for every paren at once: a
+    # scan per paren would run to the end of the file on every unclosed one.
+    # A closer that doesn't match ends every group still open, unclosed.
+    ends = {}
+    stack = []
+    for m in BRACKETS.finditer(code):
+        t = m.group()
+        if t in CLOSING:
+            stack.append((CLOSING[t], m.start()))
+        elif stack and t == stack[-1][0]:
+            closer, start = stack.pop()
+            if closer == ")":
+                ends[start] = m.end()
+        else:
+            stack.clear()
+    return ends
+
+
+def _declaration(code, paren, ends):
+    # Whether the group opened at paren is followed by a body or "throws"
+    end = ends.get(paren)
+    return end is not None and DECLARATION_TAIL.match(code, end) is not None
+
+
+def _strip(m):
+    text = m.group()
+    if text[0] == "/":
+        # Keep line breaks so positions in code still map to lines
+        return "\n" * text.count("\n") or " "
+    return "''" if text[0] == "'" else '""'
+
+
+def _is_ident(text):
+    return text[0].isalpha() or text[0] in "_$"
+
+
+def strip(text):
+    # The code without comments, string/char literals emptied
+    return STRIP.sub(_strip, text)
+
+
+@functools.lru_cache(maxsize=16)
+def lex(text):
+    code = strip(text)
+    source = JavaSource(code)
+    parser = _Parser(source, _tokens(code))
+    parser.parse()
+    source.calls = _calls(code, parser.decl_names)
+    return source
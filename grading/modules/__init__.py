@@ -0,0 +1,3 @@
+# Grading modules, one per Modul: where the graded files live in a
+# submission and which rubric scores them. grading/cli.py lists them by file
+# name and imports only the one selected with --module.
@@ -0,0 +1,104 @@
+import os
+
+from grading import profile
+from grading.index import read_source
+from grading.lexer import lex
+from grading.rubrics.modul1 import JUNIT_CLASS, JUNIT_SOURCE, JUNIT_TESTS, MAIN_INPUT, OUTPUT_CHECKS, EMBEDDED, RUBRIC
+
+# Modul 1: Vehicle & Customer Service
+
+TITLE = "Modul 1: Vehicle & Customer Service"
+PASS_NOTE = None
+
+def find_source_root(student_path, index):
+    # Strategy 1: Find Vehicle.java to locate the heart of the project
+    vehicle_path = index.find_file("Vehicle.java")
+    if vehicle_path:
+        # If found, check if it's in a package (e.g. Model)
+        # If path is .../src/Model/Vehicle.java, we want .../src
+        # If path is .../src/Vehicle.java, we want .../src
+        
+        dir_path = os.path.dirname(vehicle_path)
+        parent_dir = os.path.basename(dir_path)
+        
+        if parent_dir.lower() == "model":
+            return os.path.dirname(dir_path) # Go up one level from Model
+        else:
+            return dir_path # Assume default package or root of src
+            
+    # Strategy 2: Look for 'src' folder
+    src_path = index.find_dir("src")
+    if src_path:
+        return src_path
+                
+    # Strategy 3: Just use the student path
+    return student_path
+
+def evaluate_student(student_path, index, extra_facts=None):
+    return RUBRIC.grade(*read_inputs(student_path, index, extra_facts))
+
+def read_inputs(student_path, index, extra_facts=None):
+    # (contents, facts) for the rubric: all of the module's file system work
+    with profile.phase("discovery"):
+        vehicle_file, vehicle_type_file, customer_file, main_file = locate_files(student_path, index)
+
+    # Read Content
+    with profile.phase("read"):
+        vehicle_content = read_source(index, vehicle_file) if vehicle_file else ""
+        vehicle_type_content = read_source(index, vehicle_type_file) if vehicle_type_file else ""
+        customer_content = read_source(index, customer_file) if customer_file else ""
+        main_content = read_source(index, main_file) if main_file else ""
+
+    contents = {
+        "vehicle": vehicle_content,
+        "vehicle_type": vehicle_type_content,
+        "customer": customer_content,
+        "main": main_content,
+    }
+    facts = {}
+
+    # Fallback for single-file submission (Main.java). Searched in the lexed
+    # code, so a commented-out class doesn't count
+    with profile.phase("lex"):
+        main_code = lex(main_content).code
+    for target, pattern in EMBEDDED.items():
+        embedded = bool(main_content) and not contents[target] and pattern.search(main_code) is not None
+        if embedded:
+            contents[target] = main_content
+        facts[target + "_embedded"] = embedded
+
+    facts.update({
+        "vehicle_file": bool(vehicle_file),
+        "vehicle_type_file": bool(vehicle_type_file),
+        "customer_file": bool(customer_file),
+        "main_file": bool(main_file),
+        "customer_typo": bool(customer_file) and "Costumer.java" in customer_file,
+        "vehicle_in_main": contents["vehicle"] == main_content,
+        "vehicle_type_in_main": contents["vehicle_type"] == main_content,
+        "customer_in_main": contents["customer"] == main_content,
+    })
+
+    if extra_facts:
+        facts.update(extra_facts)
+    return contents, facts
+
+def locate_files(student_path, index):
+    # 1. Find Source Root
+    src_path = find_source_root(student_path, index)
+
+    # 2. Locate Files (Recursive search from src_path)
+    # If src_path is wrong, we might miss files. 
+    # So we search in src_path first. If not found, we search in student_path (fallback).
+    
+    def get_file(name):
+        f = index.find_file(name, under=src_path)
+        if not f:
+            f = index.find_file(name)
+        return f
+
+    # Support for English (IP) and Indonesian (Regular) naming
+    vehicle_file = get_file("Vehicle.java") or get_file("Kendaraan.java")
+    vehicle_type_file = get_file("VehicleType.java") or get_file("JenisKendaraan.java")
+    customer_file = get_file("Customer.java") or get_file("Costumer.java") or get_file("Pelanggan.java")
+    main_file = get_file("Main.java")
+    return vehicle_file, vehicle_type_file, customer_file, main_file
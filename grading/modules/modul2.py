@@ -0,0 +1,72 @@
+import os
+
+from grading import profile
+from grading.index import read_source
+from grading.rubrics.modul2 import JUNIT_CLASS, JUNIT_SOURCE, JUNIT_TESTS, MAIN_INPUT, OUTPUT_CHECKS, RUBRIC
+
+# Modul 2: Player & Score
+
+TITLE = "Modul 2: Player & Score"
+# Printed under the report once a student reaches 60 points
+PASS_NOTE = "Catatan: Sudah mengerjakan sebagian besar instruksi, tinggal lengkapi beberapa bagian agar lebih sempurna!"
+
+def find_source_root(student_path, index):
+    src_path = index.child(student_path, "src", look_for_dir=True)
+    if not src_path:
+        # Try to find src deeper
+        src_path = index.find_dir("src")
+
+    # If still not found, allow grading from root (no src)
+    return src_path or student_path
+
+def evaluate_student(student_path, index, extra_facts=None):
+    return RUBRIC.grade(*read_inputs(student_path, index, extra_facts))
+
+def read_inputs(student_path, index, extra_facts=None):
+    # (contents, facts) for the rubric: all of the module's file system work
+    with profile.phase("discovery"):
+        player_file, score_file, showdetail_file, main_file, model_path = locate_files(student_path, index)
+
+    with profile.phase("read"):
+        contents = {
+            "player": read_source(index, player_file),
+            "score": read_source(index, score_file),
+            "showdetail": read_source(index, showdetail_file),
+            "main": read_source(index, main_file),
+        }
+    facts = {
+        "model_exists": index.is_dir(model_path),
+        "model_dir_name": os.path.basename(model_path),
+    }
+    if extra_facts:
+        facts.update(extra_facts)
+    return contents, facts
+
+def locate_files(student_path, index):
+    src_path = find_source_root(student_path, index)
+
+    model_path = index.child(src_path, "Model", look_for_dir=True)
+    if not model_path:
+        # Fallback: maybe they didn't use a package folder, or named it differently?
+        # Let's try to find Player.java to locate the model folder
+        player_path = index.find_file("Player.java", under=src_path)
+        if player_path:
+            model_path = os.path.dirname(player_path)
+
+    if not model_path:
+        model_path = os.path.join(src_path, "Model") # Default for error reporting
+
+    # Files
+    player_file = index.child(model_path, "Player.java", look_for_dir=False) or os.path.join(model_path, "Player.java")
+    score_file = index.child(model_path, "Score.java", look_for_dir=False) or os.path.join(model_path, "Score.java")
+    showdetail_file = index.child(model_path, "ShowDetail.java", look_for_dir=False) or os.path.join(model_path, "ShowDetail.java")
+    
+    # Main usually in src or src/Main
+    main_file = index.find_file("Main.java", under=src_path)
+    # If still not found, try parent of src_path (for cases like grading Model/ directly).
+    # Never look above the submission itself, that would pick up another student's Main.java
+    if not main_file and src_path != student_path:
+        main_file = index.find_file("Main.java", under=os.path.dirname(src_path))
+    if not main_file:
+        main_file = os.path.join(src_path, "Main.java")
+    return player_file, score_file, showdetail_file, main_file, model_path
@@ -0,0 +1,85 @@
+import csv
+import sys
+import json
+
+# Machine-readable results, one record per student, written and flushed as
+# soon as that student is graded so partial results are usable (and can be
+# tailed into the LMS import) while a large cohort is still running.
+
+FORMATS = ("jsonl", "csv")
+
+
+class JsonlWriter:
+    # outcomes=True adds the raw outcomes (checkpoints keep them for --rescore)
+    def __init__(self, stream, rubric, outcomes=False):
+        self.stream = stream
+        self.rubric = rubric
+        self.outcomes = outcomes
+
+    def write(self, student, path, result, error=None):
+        record = {
+            "student": student,
+            "path": path,
+            "module": self.rubric.name,
+            "score": None if result is None else round(result.total, 2),
+            "sections": None if result is None else result.sections,
+            "criteria": None if result is None else result.criteria,
+            "details": [] if result is None else result.details,
+            "error": error,
+        }
+        if self.outcomes:
+            record["outcomes"] = None if result is None else result.outcomes
+        self.stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.stream.flush()
+
+    def flush(self):
+        self.stream.flush()
+
+
+class CsvWriter:
+    # One column per section and per criterion (points awarded), in rubric order
+    def __init__(self, stream, rubric):
+        self.stream = stream
+        self.sections = [s.key for s in rubric.sections]
+        self.criteria = [c.key for s in rubric.sections for c in s.criteria]
+        self.writer = csv.writer(stream)
+        self.writer.writerow(["student", "score"] + self.sections + self.criteria + ["details", "error"])
+        self.stream.flush()
+
+    def write(self, student, path, result, error=None):
+        if result is None:
+            row = [student, ""] + [""] * (len(self.sections) + len(self.criteria)) + ["", error or ""]
+        else:
+            row = [student, f"{result.total:.2f}"]
+            row += [result.sections.get(key, "") for key in self.sections]
+            row += [result.criteria.get(key, "") for key in self.criteria]
+            row += [" | ".join(result.details), error or ""]
+        self.writer.writerow(row)
+        self.stream.flush()
+
+    def flush(self):
+        self.stream.flush()
+
+
+class TeeWriter:
+    # The same records to several outputs (--format, the checkpoint, --db)
+    def __init__(self, *writers):
+        self.writers = [w for w in writers if w is not None]
+
+    def write(self, student, path, result, error=None):
+        for writer in self.writers:
+            writer.write(student, path, result, error)
+
+    def flush(self):
+        for writer in self.writers:
+            writer.flush()
+
+
+def open_writer(fmt, output, rubric):
+    # Returns (writer, stream). output "-" or None means stdout.
+    if output in (None, "-"):
+        stream = sys.stdout
+    else:
+        stream = open(output, "w", encoding="utf-8", newline="")
+    cls = JsonlWriter if fmt == "jsonl" else CsvWriter
+    return cls(stream, rubric), stream
@@ -0,0 +1,80 @@
+import queue
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Pipelined grading (--pipeline N) for submissions on a network share, where
+# every listdir/stat/open is a round trip and a sequential walk spends most of
+# its time waiting.
+#
+# Grading a student is split in two (grading/cli.py):
+#   load    folder walk, cache lookup, locating and reading the sources
+#   finish  rubric evaluation and the report, pure CPU
+# An asyncio loop in a background thread keeps up to `inflight` loads running
+# at once on a thread pool, and hands finished loads, in student order, to the
+# calling thread through a bounded queue. The caller evaluates the rubric
+# while the next loads are still on the wire. A load counts as in flight
+# until the evaluator has taken it, so at most 2 * inflight submissions are
+# held in memory.
+
+DEFAULT_INFLIGHT = 16
+
+
+async def _load_all(load, paths, inflight, ready):
+    loop = asyncio.get_running_loop()
+    slots = asyncio.Semaphore(inflight)
+    started = asyncio.Queue()
+
+    async def start():
+        for path in paths:
+            await slots.acquire()
+            started.put_nowait((path, loop.run_in_executor(pool, load, path)))
+        started.put_nowait(None)
+
+    with ThreadPoolExecutor(max_workers=inflight) as pool:
+        starter = asyncio.create_task(start())
+        while True:
+            item = await started.get()
+            if item is None:
+                break
+            path, future = item
+            try:
+                loaded, error = await future, None
+            except Exception as e:
+                loaded, error = None, f"{type(e).__name__}: {e}"
+            # Blocks (off the loop) while the evaluator is behind
+            await loop.run_in_executor(None, ready.put, (path, loaded, error))
+            slots.release()
+        await starter
+    ready.put(None)
+
+def _run(load, paths, inflight, ready):
+    try:
+        asyncio.run(_load_all(load, paths, inflight, ready))
+    except BaseException as e:
+        ready.put(e)
+
+def grade_pipelined(load, finish, student_paths, inflight=DEFAULT_INFLIGHT):
+    # Yields (student_path, result, output, error) in the order of student_paths,
+    # like grading/runner.py grade_many. load(path) runs on the I/O threads,
+    # finish(path, loaded) in the calling thread. student_paths may be a
+    # generator (--stream); the loader thread consumes it.
+    inflight = max(1, inflight)
+    ready = queue.Queue(maxsize=inflight)
+    loader = threading.Thread(target=_run, args=(load, student_paths, inflight, ready), daemon=True)
+    loader.start()
+    while True:
+        item = ready.get()
+        if item is None:
+            break
+        if isinstance(item, BaseException):
+            raise item
+        path, loaded, error = item
+        if error is not None:
+            yield path, None, "", error
+            continue
+        try:
+            yield path, finish(path, loaded), "", None
+        except Exception as e:
+            yield path, None, "", f"{type(e).__name__}: {e}"
+    loader.join()
@@ -0,0 +1,114 @@
+import json
+import time
+import threading
+import contextlib
+
+# Opt-in timing for --profile.
+#
+# Three tables of (count, total seconds, slowest single sample):
+#   phases    discovery (folder index, file lookups), read, lex, checks,
+#             scoring, cache, junit ...
+#   rules     every check of the rubric ("check player_random_uuid") and
+#             every criterion it scores ("criterion coins_logic")
+#   students  wall time of grade_student per submission
+#
+# Nothing is measured unless enable() was called: hooks look up active()
+# and skip the clock entirely when it is None. Pool workers collect into
+# their own Profiler and hand the samples back with each result (see
+# grading/runner.py), so the tables cover --jobs runs as well. Under
+# --pipeline the phases overlap, so their totals add up to more than the
+# wall time.
+
+TABLES = (
+    ("phases", "Fase"),
+    ("rules", "Rule"),
+    ("students", "Mahasiswa"),
+)
+DEFAULT_TOP = 10
+
+
+class Profiler:
+    def __init__(self):
+        self.tables = {table: {} for table, _ in TABLES}
+        # --pipeline records discovery and reads from its I/O threads
+        self._lock = threading.Lock()
+
+    def add(self, table, name, seconds):
+        with self._lock:
+            entry = self.tables[table].get(name)
+            if entry is None:
+                self.tables[table][name] = [1, seconds, seconds]
+            else:
+                entry[0] += 1
+                entry[1] += seconds
+                if seconds > entry[2]:
+                    entry[2] = seconds
+
+    def take(self):
+        # The samples so far, leaving this profiler empty
+        tables = self.tables
+        self.tables = {table: {} for table, _ in TABLES}
+        return tables
+
+    def merge(self, tables):
+        for table, entries in tables.items():
+            for name, (count, total, worst) in entries.items():
+                entry = self.tables[table].get(name)
+                if entry is None:
+                    self.tables[table][name] = [count, total, worst]
+                else:
+                    entry[0] += count
+                    entry[1] += total
+                    entry[2] = max(entry[2], worst)
+
+    def rows(self, table, top=None):
+        # Slowest first, by total time
+        rows = sorted(self.tables[table].items(), key=lambda item: item[1][1], reverse=True)
+        return rows if top is None else rows[:top]
+
+    def report(self, top=DEFAULT_TOP):
+        for table, title in TABLES:
+            rows = self.rows(table, top)
+            if not rows:
+                continue
+            print(f"\n{title + ' paling lambat':<44} {'n':>7} {'total s':>10} {'rata2 ms':>10} {'maks ms':>10}")
+            print("-" * 85)
+            for name, (count, total, worst) in rows:
+                print(f"{name[:44]:<44} {count:>7} {total:>10.3f} {total / count * 1000:>10.2f} {worst * 1000:>10.2f}")
+
+    def to_dict(self):
+        return {
+            table: [
+                {"name": name, "count": count, "total_s": total, "avg_ms": total / count * 1000, "max_ms": worst * 1000}
+                for name, (count, total, worst) in self.rows(table)
+            ]
+            for table, _ in TABLES
+        }
+
+    def dump(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+
+
+_active = None
+
+
+def enable():
+    global _active
+    _active = Profiler()
+    return _active
+
+def active():
+    return _active
+
+@contextlib.contextmanager
+def phase(name):
+    profiler = _active
+    if profiler is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        profiler.add("phases", name, time.perf_counter() - start)
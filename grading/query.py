@@ -0,0 +1,171 @@
+import os
+import sys
+import time
+import argparse
+import functools
+
+from grading.store import DEFAULT_DB, ResultStore, StoreError
+
+# Questions about past runs, answered from the results database (--db) without
+# grading anything:
+#
+#   python -m grading.query runs
+#   python -m grading.query summary --module modul1
+#   python -m grading.query criteria
+#   python -m grading.query missing player_implements
+#   python -m grading.query diff                       # latest vs the run before
+#   python -m grading.query details Budi_123 --run 4
+#   python -m grading.query history Budi_123
+#
+# Without --run the latest run (of --module, if given) is used.
+
+
+def _when(timestamp):
+    return "-" if timestamp is None else time.strftime("%Y-%m-%d %H:%M", time.localtime(timestamp))
+
+def _score(score):
+    return "ERROR" if score is None else f"{score:.2f}"
+
+def _points(points):
+    return f"{points:g}"
+
+def pick_run(store, args):
+    run = args.run if args.run is not None else store.latest_run(args.module)
+    if run is None:
+        raise StoreError(f"Belum ada run{' ' + args.module if args.module else ''} di {store.path}.")
+    info = store.run_info(run)
+    print(f"Run {info['id']} ({info['module']}, {_when(info['started'])})")
+    return run
+
+def show_runs(store, args):
+    rows = store.runs(args.module)
+    if not rows:
+        print(f"Belum ada run di {store.path}.")
+    for run, module, rubric, root, shard, stages, started, finished, count, errors, average in rows:
+        extra = "".join(f", {label} {value}" for label, value in (("shard", shard), ("tahap", stages)) if value)
+        print(f"{run:>4}  {_when(started)}  {module:<8} {count:>5} mahasiswa, {errors} error, "
+              f"rata-rata {'-' if average is None else f'{average:.2f}'}  [{rubric}{extra}] {root or ''}")
+
+def show_summary(store, args):
+    scores = store.scores(pick_run(store, args))
+    for student, (score, error) in scores.items():
+        print(f"{student}: {_score(score)}")
+    graded = [score for score, _ in scores.values() if score is not None]
+    if graded:
+        print(f"\n{len(graded)} dinilai, {len(scores) - len(graded)} error, rata-rata {sum(graded) / len(graded):.2f}, "
+              f">= 60: {sum(score >= 60 for score in graded)}")
+
+def show_criteria(store, args):
+    for key, (count, zero, best) in store.criterion_keys(pick_run(store, args)).items():
+        print(f"{key:<32} {count - zero:>5}/{count} dapat poin (maks {_points(best)})")
+
+def show_missing(store, args):
+    rows = store.missing(pick_run(store, args), args.criterion, args.max_points)
+    for student, points in rows:
+        print(f"{student}: {_points(points)}")
+    print(f"\n{len(rows)} mahasiswa dengan {args.criterion} <= {_points(args.max_points)} poin.")
+
+def show_diff(store, args):
+    new = pick_run(store, args)
+    old = args.base if args.base is not None else store.latest_run(store.run_info(new)["module"], before=new)
+    if old is None:
+        raise StoreError(f"Tidak ada run sebelum run {new} untuk dibandingkan.")
+    print(f"dibandingkan dengan run {old} ({_when(store.run_info(old)['started'])})")
+    before, after = store.scores(old), store.scores(new)
+    old_criteria = new_criteria = None
+    changed = 0
+    for student in sorted(set(before) | set(after)):
+        a = before.get(student, (None, None))[0]
+        b = after.get(student, (None, None))[0]
+        if student not in before:
+            print(f"+ {student}: {_score(b)} (baru)")
+        elif student not in after:
+            print(f"- {student}: {_score(a)} (tidak ada lagi)")
+        elif a is None or b is None:
+            if a is b:
+                continue
+            print(f"~ {student}: {_score(a)} -> {_score(b)}")
+        elif abs(b - a) >= 0.005:
+            print(f"~ {student}: {a:.2f} -> {b:.2f} ({b - a:+.2f})")
+        else:
+            continue
+        changed += 1
+        if args.criteria and student in before and student in after:
+            if old_criteria is None:
+                old_criteria, new_criteria = store.criteria(old), store.criteria(new)
+            x, y = old_criteria.get(student, {}), new_criteria.get(student, {})
+            for key in sorted(set(x) | set(y)):
+                if x.get(key) != y.get(key):
+                    print(f"    {key}: {_points(x[key]) if key in x else '-'} -> {_points(y[key]) if key in y else '-'}")
+    print(f"\n{changed} mahasiswa berubah dari {len(set(before) | set(after))}.")
+
+def show_details(store, args):
+    run = pick_run(store, args)
+    score = store.scores(run).get(args.student)
+    if score is None:
+        raise StoreError(f"{args.student} tidak ada di run {run}.")
+    for line in store.details(run, args.student):
+        print(line)
+    print(f"TOTAL SCORE: {_score(score[0])} / 100" + (f" ({score[1]})" if score[1] else ""))
+
+def show_history(store, args):
+    rows = store.history(args.student, args.module)
+    if not rows:
+        print(f"{args.student} belum pernah dinilai.")
+    for run, module, started, score, error in rows:
+        print(f"{run:>4}  {_when(started)}  {module:<8} {_score(score)}" + (f"  ({error})" if error else ""))
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m grading.query")
+    parser.add_argument("--db", default=DEFAULT_DB, help=f"Database hasil (default: {DEFAULT_DB})")
+    parser.add_argument("--module", help="Hanya run modul ini")
+    parser.add_argument("--run", type=int, help="ID run (default: run terakhir)")
+    # The same options after the command ("details Budi_123 --run 4"); they
+    # only override what was given before it
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--db", default=argparse.SUPPRESS, help=argparse.SUPPRESS)
+    common.add_argument("--module", default=argparse.SUPPRESS, help=argparse.SUPPRESS)
+    common.add_argument("--run", type=int, default=argparse.SUPPRESS, help=argparse.SUPPRESS)
+    commands = parser.add_subparsers(dest="command", required=True)
+    add = functools.partial(commands.add_parser, parents=[common])
+    add("runs", help="Daftar run").set_defaults(fn=show_runs)
+    add("summary", help="Nilai semua mahasiswa di satu run").set_defaults(fn=show_summary)
+    add("criteria", help="Nama kriteria dan berapa mahasiswa yang dapat poin").set_defaults(fn=show_criteria)
+    missing = add("missing", help="Mahasiswa yang tidak dapat poin untuk satu kriteria")
+    missing.add_argument("criterion")
+    missing.add_argument("--max-points", type=float, default=0, help="Termasuk yang poinnya paling banyak sekian (default: 0)")
+    missing.set_defaults(fn=show_missing)
+    diff = add("diff", help="Perubahan nilai dibanding run sebelumnya")
+    diff.add_argument("--base", type=int, help="ID run pembanding (default: run sebelumnya dari modul yang sama)")
+    diff.add_argument("--criteria", action="store_true", help="Tampilkan juga kriteria yang berubah")
+    diff.set_defaults(fn=show_diff)
+    details = add("details", help="Laporan satu mahasiswa")
+    details.add_argument("student")
+    details.set_defaults(fn=show_details)
+    history = add("history", help="Nilai satu mahasiswa di semua run")
+    history.add_argument("student")
+    history.set_defaults(fn=show_history)
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if not os.path.exists(args.db):
+        print(f"Error: {args.db} belum ada. Nilai dulu dengan --db.")
+        return 1
+    try:
+        store = ResultStore(args.db, readonly=True)
+    except (StoreError, OSError) as e:
+        print(f"Error: {e}")
+        return 1
+    try:
+        args.fn(store, args)
+    except StoreError as e:
+        print(f"Error: {e}")
+        return 1
+    finally:
+        store.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
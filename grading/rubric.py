@@ -0,0 +1,324 @@
+import re
+import time
+import hashlib
+from collections import ChainMap
+
+from grading import profile
+from grading.keywords import KeywordScanner, required_literals
+from grading.lexer import lex
+
+
+# Declarative rubric engine shared by every module.
+#
+# A rubric is split in two halves:
+#   - Checks: raw probes against one target file ("player", "main", ...).
+#     Every pattern is compiled once, when the rubric module is imported.
+#     Each file is lexed once (grading/lexer.py) and checks query the result:
+#     the code without comments/strings, or one of its declaration lists.
+#     Evaluating all checks yields a flat dict of outcomes (bools / counts).
+#     A keyword scan of the raw file comes first (grading/keywords.py): checks
+#     whose required literals don't occur are settled without running, and a
+#     file none of the checks can match is never lexed.
+#   - Sections of Criteria: turn outcomes into points and feedback lines.
+#     Scoring never looks at file contents, so outcomes kept with a result
+#     can be scored again after weights or points change (--rescore).
+#
+# Conditions, points and derived values are plain callables that receive the
+# outcome mapping. Section raw scores are visible in that mapping under the
+# section key (e.g. o["interface"]) as soon as the section has started.
+
+
+class Check:
+    # kind: "search" -> bool(re.search), "count" -> len(re.findall),
+    #       "contains" -> plain substring test (pattern is used literally)
+    # scope: "code" (the whole file, comments and string contents removed) or
+    #       one declaration list of the lexed file: "types", "fields",
+    #       "methods", "constructors", "calls". search/contains hold if any
+    #       entry matches; count adds up the matches over all entries.
+    def __init__(self, name, target, pattern, flags=0, kind="search", scope="code"):
+        self.name = name
+        self.target = target
+        self.kind = kind
+        self.scope = scope
+        self.pattern = pattern
+        if kind == "contains":
+            self.regex = None
+        else:
+            self.regex = re.compile(pattern, flags)
+        # (literals, ignore_case) one of which any match contains, or None
+        self.literals = required_literals(pattern, flags, literal=kind == "contains")
+
+    def miss(self):
+        # The outcome when the check can't match
+        return 0 if self.kind == "count" else False
+
+    def run(self, source):
+        if self.scope == "code":
+            return self._run_one(source.code)
+        entries = getattr(source, self.scope)
+        if self.kind == "contains":
+            return any(self.pattern in text for text in entries)
+        if self.kind == "count":
+            return sum(len(self.regex.findall(text)) for text in entries)
+        return any(self.regex.search(text) is not None for text in entries)
+
+    def _run_one(self, content):
+        if self.kind == "contains":
+            return self.pattern in content
+        if self.kind == "count":
+            return len(self.regex.findall(content))
+        return self.regex.search(content) is not None
+
+
+class Tier:
+    # points may be a number or callable(o); when may be a check name or callable(o)
+    def __init__(self, points, when, message):
+        self.points = points
+        self.when = when
+        self.message = message
+
+
+class Criterion:
+    # Tiers are tried in order, the first one that holds is awarded.
+    # If none holds, `miss` (if any) is reported and no points are given.
+    # `only_if` skips the criterion entirely (no points, no message).
+    def __init__(self, key, tiers, miss=None, only_if=None):
+        self.key = key
+        self.tiers = tiers
+        self.miss = miss
+        self.only_if = only_if
+
+
+class Section:
+    # Contributes (raw / max_points) * weights[weight] to the total.
+    # Without a weight the raw points are added as-is (bonus, info lines).
+    # `guard` names an outcome that must be truthy for the section to be scored.
+    # An `optional` section whose guard fails is left out entirely; when it is
+    # scored, the total is rescaled so the maximum stays the same.
+    def __init__(self, key, criteria, max_points=None, weight=None, guard=None, optional=False):
+        self.key = key
+        self.criteria = criteria
+        self.max_points = max_points
+        self.weight = weight
+        self.guard = guard
+        self.optional = optional
+
+
+class ScoreResult:
+    __slots__ = ("total", "details", "sections", "criteria", "outcomes")
+
+    def __init__(self, total, details, sections, criteria, outcomes=None):
+        self.total = total
+        self.details = details
+        self.sections = sections      # section key -> raw points
+        self.criteria = criteria      # criterion key -> points awarded
+        self.outcomes = outcomes      # raw outcomes it was scored from (--rescore)
+
+
+# Report line when the checks ran out of time (Rubric.evaluate's deadline)
+TIMEOUT_NOTE = "[!] Warning: Pengecekan kode melewati batas waktu, pengecekan yang tersisa tidak dinilai."
+
+
+def _holds(when, o):
+    if callable(when):
+        return bool(when(o))
+    return bool(o[when])
+
+
+class Rubric:
+    def __init__(self, name, checks, sections, weights, derived=None, version="1"):
+        self.name = name
+        self.version = version
+        self.checks = checks
+        self.sections = sections
+        self.weights = weights
+        self.derived = derived or {}
+        # Group checks per target so each file is visited once
+        self._by_target = {}
+        for check in checks:
+            self._by_target.setdefault(check.target, []).append(check)
+        self._scanners = {}
+        for target, target_checks in self._by_target.items():
+            keywords = [word for check in target_checks if check.literals for word in check.literals[0]]
+            self._scanners[target] = KeywordScanner(keywords)
+        # Criteria every graded student has points for: not part of an
+        # optional section and not skipped by only_if
+        self.required_criteria = {criterion.key for section in sections if not section.optional
+                                  for criterion in section.criteria if criterion.only_if is None}
+        self.fingerprint = self._fingerprint()
+        self.checks_fingerprint = self._checks_fingerprint()
+
+    def _checks_fingerprint(self):
+        # What the raw outcomes depend on. Weights, points and messages can
+        # change without it, outcomes stored under it can then be rescored.
+        h = hashlib.sha256(self.name.encode())
+        for c in self.checks:
+            h.update(repr((c.name, c.target, c.pattern, c.kind, c.scope, c.regex.flags if c.regex else 0)).encode())
+        return h.hexdigest()[:16]
+
+    def _fingerprint(self):
+        # Changes whenever a pattern, weight, point value or message changes.
+        # Logic inside callables can't be hashed: bump `version` when editing it.
+        h = hashlib.sha256()
+        h.update(f"{self.name}:{self.version}".encode())
+        for c in self.checks:
+            h.update(repr((c.name, c.target, c.pattern, c.kind, c.scope, c.regex.flags if c.regex else 0)).encode())
+        for key in sorted(self.weights):
+            h.update(repr((key, self.weights[key])).encode())
+        for section in self.sections:
+            h.update(repr((section.key, section.max_points, section.weight, section.guard, section.optional)).encode())
+            for criterion in section.criteria:
+                h.update(repr((criterion.key, criterion.miss)).encode())
+                for tier in criterion.tiers:
+                    points = None if callable(tier.points) else tier.points
+                    when = None if callable(tier.when) else tier.when
+                    h.update(repr((points, when, tier.message)).encode())
+        return h.hexdigest()[:16]
+
+    @property
+    def targets(self):
+        return list(self._by_target)
+
+    def _prefilter(self, target, content, outcomes):
+        # Settles the checks whose literals are missing, returns the others
+        hits = self._scanners[target].scan(content)
+        runnable = []
+        for check in self._by_target[target]:
+            if check.literals is None or hits.any(check.literals):
+                runnable.append(check)
+            else:
+                outcomes[check.name] = check.miss()
+        return runnable
+
+    def _expired(self, deadline, outcomes):
+        # Past the deadline every remaining check counts as a miss; noted once
+        if deadline is None or time.monotonic() <= deadline:
+            return False
+        if not outcomes.get("timed_out"):
+            outcomes["timed_out"] = True
+            outcomes["notes"] = list(outcomes.get("notes") or []) + [TIMEOUT_NOTE]
+        return True
+
+    def evaluate(self, contents, facts=None, deadline=None):
+        # contents: target -> file text. facts: extra raw outcomes computed by
+        # the module's discovery step (file found, folder names, ...).
+        # deadline: time.monotonic() after which no file is lexed and no
+        # check is run any more.
+        profiler = profile.active()
+        outcomes = dict(facts or {})
+        for target, checks in self._by_target.items():
+            content = contents.get(target) or ""
+            outcomes["has_" + target] = bool(content)
+            if profiler is None:
+                runnable = self._prefilter(target, content, outcomes)
+                if runnable and not self._expired(deadline, outcomes):
+                    source = lex(content)
+                    for check in runnable:
+                        outcomes[check.name] = check.miss() if self._expired(deadline, outcomes) else check.run(source)
+                else:
+                    for check in runnable:
+                        outcomes[check.name] = check.miss()
+                continue
+            start = time.perf_counter()
+            runnable = self._prefilter(target, content, outcomes)
+            scanned = time.perf_counter()
+            profiler.add("phases", "scan", scanned - start)
+            if not runnable:
+                continue
+            if self._expired(deadline, outcomes):
+                for check in runnable:
+                    outcomes[check.name] = check.miss()
+                continue
+            source = lex(content)
+            lexed = time.perf_counter()
+            profiler.add("phases", "lex", lexed - scanned)
+            for check in runnable:
+                if self._expired(deadline, outcomes):
+                    outcomes[check.name] = check.miss()
+                    continue
+                start = time.perf_counter()
+                outcomes[check.name] = check.run(source)
+                profiler.add("rules", "check " + check.name, time.perf_counter() - start)
+            profiler.add("phases", "checks", time.perf_counter() - lexed)
+        return outcomes
+
+    def score(self, outcomes, weights=None):
+        profiler = profile.active()
+        weights = dict(self.weights, **(weights or {}))
+        section_scores = {}
+        o = ChainMap(section_scores, outcomes)
+        for key, fn in self.derived.items():
+            section_scores[key] = fn(o)
+
+        total = 0
+        details = []
+        awarded = {}
+        base = possible = 0
+        for section in self.sections:
+            section_scores[section.key] = 0
+            active = section.guard is None or o.get(section.guard)
+            if section.weight is not None and not section.optional:
+                base += weights[section.weight]
+            if section.optional and not active:
+                del section_scores[section.key]
+                continue
+            if not active:
+                # The section's file is missing: its criteria are still
+                # scored (0 points), so queries over the criteria see them
+                for criterion in section.criteria:
+                    if criterion.only_if is None:
+                        awarded[criterion.key] = 0
+            else:
+                for criterion in section.criteria:
+                    if profiler is not None:
+                        start = time.perf_counter()
+                    if criterion.only_if is not None and not criterion.only_if(o):
+                        continue
+                    points = 0
+                    for tier in criterion.tiers:
+                        if _holds(tier.when, o):
+                            points = tier.points(o) if callable(tier.points) else tier.points
+                            if tier.message:
+                                details.append(tier.message.format_map(o))
+                            break
+                    else:
+                        if criterion.miss:
+                            details.append(criterion.miss.format_map(o))
+                    awarded[criterion.key] = points
+                    section_scores[section.key] += points
+                    if profiler is not None:
+                        profiler.add("rules", "criterion " + criterion.key, time.perf_counter() - start)
+
+            raw = section_scores[section.key]
+            if section.weight is None:
+                total += raw
+            else:
+                total += (raw / section.max_points) * weights[section.weight]
+                possible += weights[section.weight]
+
+        if possible != base:
+            total = total * base / possible
+
+        # Lines the discovery step wants under the report (folders it skipped)
+        details.extend(outcomes.get("notes") or [])
+
+        sections = {section.key: section_scores[section.key] for section in self.sections if section.key in section_scores}
+        return ScoreResult(total, details, sections, awarded)
+
+    def grade(self, contents, facts=None, weights=None, deadline=None):
+        outcomes = self.evaluate(contents, facts, deadline)
+        with profile.phase("scoring"):
+            result = self.score(outcomes, weights)
+        result.outcomes = outcomes
+        return result
+
+
+def junit_section(tests, weight="W_BEHAVIOUR"):
+    # Optional section fed by the JUnit stage (grading/junit.py): one point per
+    # passing test. Skipped entirely when the stage did not run.
+    criteria = []
+    for method, label in tests.items():
+        criteria.append(Criterion("junit_" + method, [
+            Tier(1, "junit_" + method, f"[OK] JUnit: {label} lulus. (+1)"),
+        ], miss=f"[X] JUnit: {label} gagal ({{junit_msg_{method}}})"))
+    return Section("behaviour", criteria, max_points=len(tests), weight=weight, guard="junit_ran", optional=True)
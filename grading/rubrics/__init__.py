@@ -0,0 +1 @@
+# Rubric definitions, one module per Modul.
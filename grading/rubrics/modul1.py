@@ -0,0 +1,191 @@
+import re
+
+from grading.rubric import Check, Criterion, Rubric, Section, Tier, junit_section
+
+# Modul 1: Vehicle & Customer Service
+
+# Weights (Total 100)
+W_STRUCTURE = 20
+W_VEHICLE_TYPE = 10
+W_VEHICLE = 30
+W_CUSTOMER = 30
+W_MAIN = 10
+# Only counts when the JUnit stage ran (--junit); the total is rescaled to 100
+W_BEHAVIOUR = 20
+
+WEIGHTS = {
+    "W_STRUCTURE": W_STRUCTURE,
+    "W_VEHICLE_TYPE": W_VEHICLE_TYPE,
+    "W_VEHICLE": W_VEHICLE,
+    "W_CUSTOMER": W_CUSTOMER,
+    "W_MAIN": W_MAIN,
+    "W_BEHAVIOUR": W_BEHAVIOUR,
+}
+
+# Dynamic tests, run by grading/junit.py. Method name -> report label
+JUNIT_SOURCE = "GradingTestModul1.java"
+JUNIT_CLASS = "GradingTestModul1"
+JUNIT_TESTS = {
+    "testVehicleTypeEnum": "1. Test VehicleType Enum",
+    "testVehicleClass": "2. Test Vehicle Class Structure & Constructor",
+    "testCustomerClass": "3. Test Customer Class & Logic",
+}
+
+# Support for English (IP) and Indonesian (Regular) naming
+VEHICLE = r"(Vehicle|Kendaraan)"
+VEHICLE_TYPE = r"(VehicleType|JenisKendaraan)"
+CUSTOMER = r"(C(u|o)st(o|u)mer|Pelanggan)"
+
+# Fallback for single-file submissions: classes declared inside Main.java
+EMBEDDED = {
+    "vehicle": re.compile(r"class\s+" + VEHICLE, re.IGNORECASE),
+    "vehicle_type": re.compile(r"enum\s+" + VEHICLE_TYPE, re.IGNORECASE),
+    "customer": re.compile(r"class\s+" + CUSTOMER, re.IGNORECASE),
+}
+
+I = re.IGNORECASE
+
+# Execution stage (--run, grading/execute.py): Main reads customer names with
+# a Scanner, then its output should show the customer and vehicle details
+MAIN_INPUT = "Budi\nSiti\nAgus\n"
+OUTPUT_CHECKS = {
+    "run_vehicle_detail": re.compile(r"brand|merk|price|harga", I),
+    "run_customer_detail": re.compile(r"customer|pelanggan|total", I),
+}
+
+# Comments and string contents never match (see grading/lexer.py); checks with
+# a scope only look at that kind of declaration.
+CHECKS = [
+    # VehicleType.java
+    Check("vt_enum", "vehicle_type", r"\benum\s+" + VEHICLE_TYPE, I, scope="types"),
+    Check("vt_car", "vehicle_type", r"Car|Mobil", I),
+    Check("vt_motorcycle", "vehicle_type", r"Motorcycle|Motor", I),
+    Check("vt_truck", "vehicle_type", r"Truck|Truk", I),
+    # Vehicle.java
+    Check("vehicle_brand", "vehicle", r"\bString\s+(brand|merk)\b", I, scope="fields"),
+    Check("vehicle_year", "vehicle", r"\bint\s+(year|tahun)\b", I, scope="fields"),
+    Check("vehicle_type_field", "vehicle", VEHICLE_TYPE + r"\s+(type|tipe|jenis)\b", I, scope="fields"),
+    Check("vehicle_price", "vehicle", r"\b(double|float|int|long)\s+(price|harga)\b", I, scope="fields"),
+    Check("vehicle_constructor", "vehicle", VEHICLE + r"\s*\(\s*String", I, scope="constructors"),
+    Check("vehicle_show_detail", "vehicle", r"void\s+showDetail", I, scope="methods"),
+    # Customer.java
+    Check("customer_name", "customer", r"\bString\s+(name|nama)\b", I, scope="fields"),
+    Check("customer_vehicle", "customer", VEHICLE + r"\s+(vehicle|kendaraan)\b", I, scope="fields"),
+    Check("customer_constructor", "customer", CUSTOMER + r"\s*\(\s*String", I, scope="constructors"),
+    Check("customer_total_price", "customer", r"(double|float|int|long)\s+(getTotalPrice|getTotalHarga)\(", I, scope="methods"),
+    Check("customer_return_price", "customer", r"return\s+.*(price|harga)", I),
+    Check("customer_show_detail", "customer", r"void\s+showDetail", I, scope="methods"),
+    # Main.java
+    Check("main_new_vehicle", "main", r"^new\s+(\w+\.)*" + VEHICLE, I, scope="calls"),
+    Check("main_new_customer", "main", r"^new\s+(\w+\.)*" + CUSTOMER, I, scope="calls"),
+    Check("main_show_detail", "main", r"\.showDetail(s)?\s*\(", I, scope="calls"),
+]
+
+def _ran(o):
+    # Main was executed (--run); its output decides the showDetail criterion
+    return o.get("run_ran", False)
+
+DERIVED = {
+    "vehicle_fields": lambda o: o["vehicle_brand"] + o["vehicle_year"] + o["vehicle_type_field"] + o["vehicle_price"],
+}
+
+SECTIONS = [
+    # Info lines from the single-file fallback
+    Section("info", criteria=[
+        Criterion("vehicle_embedded", [Tier(0, "vehicle_embedded", "[!] Info: Class Vehicle ditemukan di Main.java.")]),
+        Criterion("vehicle_type_embedded", [Tier(0, "vehicle_type_embedded", "[!] Info: Enum VehicleType ditemukan di Main.java.")]),
+        Criterion("customer_embedded", [Tier(0, "customer_embedded", "[!] Info: Class Customer ditemukan di Main.java.")]),
+    ]),
+    # 1. Structure (20%)
+    Section("structure", max_points=20, weight="W_STRUCTURE", criteria=[
+        Criterion("vehicle_file", [
+            Tier(5, "vehicle_file", None),
+            Tier(2.5, "vehicle_in_main", "[-] Vehicle.java tidak ditemukan (ada di Main)."),
+        ], miss="[-] Vehicle.java / Kendaraan.java tidak ditemukan."),
+        Criterion("vehicle_type_file", [
+            Tier(5, "vehicle_type_file", None),
+            Tier(2.5, "vehicle_type_in_main", "[-] VehicleType.java tidak ditemukan (ada di Main)."),
+        ], miss="[-] VehicleType.java tidak ditemukan."),
+        Criterion("customer_file", [
+            Tier(5, lambda o: o["customer_file"] and o["customer_typo"], "[!] Warning: Typo nama file 'Costumer.java'."),
+            Tier(5, "customer_file", None),
+            Tier(2.5, "customer_in_main", "[-] Customer.java tidak ditemukan (ada di Main)."),
+        ], miss="[-] Customer.java tidak ditemukan."),
+        Criterion("main_file", [
+            Tier(5, "main_file", None),
+        ], miss="[-] Main.java tidak ditemukan."),
+        Criterion("structure_complete", [
+            Tier(0, lambda o: o["structure"] == 20, "[+] Struktur file lengkap (+20)."),
+        ]),
+    ]),
+    # 2. VehicleType (10%)
+    Section("vehicle_type", max_points=10, weight="W_VEHICLE_TYPE", guard="has_vehicle_type", criteria=[
+        Criterion("vt_enum", [Tier(2.5, "vt_enum", "[+] VehicleType didefinisikan sebagai enum.")], miss="[-] VehicleType bukan enum."),
+        Criterion("vt_car", [Tier(2.5, "vt_car", None)], miss="[-] Enum Car/Mobil tidak ditemukan."),
+        Criterion("vt_motorcycle", [Tier(2.5, "vt_motorcycle", None)], miss="[-] Enum Motorcycle/Motor tidak ditemukan."),
+        Criterion("vt_truck", [Tier(2.5, "vt_truck", None)], miss="[-] Enum Truck/Truk tidak ditemukan."),
+    ]),
+    # 3. Vehicle Class (30%)
+    Section("vehicle", max_points=25, weight="W_VEHICLE", guard="has_vehicle", criteria=[
+        # Fields (10 pts)
+        Criterion("vehicle_fields", [
+            Tier(10, lambda o: o["vehicle_fields"] == 4, "[+] Vehicle: Atribut lengkap."),
+            Tier(lambda o: (o["vehicle_fields"] / 4) * 10, lambda o: True, "[-] Vehicle: Atribut tidak lengkap ({vehicle_fields}/4 ditemukan)."),
+        ]),
+        # Constructor (10 pts)
+        Criterion("vehicle_constructor", [
+            Tier(10, "vehicle_constructor", "[+] Vehicle: Constructor ditemukan."),
+        ], miss="[-] Vehicle: Constructor tidak ditemukan."),
+        # showDetail (5 pts)
+        Criterion("vehicle_show_detail", [
+            Tier(5, "vehicle_show_detail", "[+] Vehicle: Method showDetail ditemukan."),
+        ], miss="[-] Vehicle: Method showDetail tidak ditemukan."),
+    ]),
+    # 4. Customer Class (30%)
+    Section("customer", max_points=25, weight="W_CUSTOMER", guard="has_customer", criteria=[
+        # Fields (5 pts)
+        Criterion("customer_fields", [
+            Tier(5, lambda o: o["customer_name"] and o["customer_vehicle"], "[+] Customer: Atribut lengkap."),
+        ], miss="[-] Customer: Atribut kurang (name/nama, vehicle/kendaraan)."),
+        # Constructor (5 pts)
+        Criterion("customer_constructor", [
+            Tier(5, "customer_constructor", "[+] Customer: Constructor ditemukan."),
+        ], miss="[-] Customer: Constructor tidak ditemukan."),
+        # getTotalPrice (10 pts)
+        Criterion("customer_total_price", [
+            Tier(10, lambda o: o["customer_total_price"] and o["customer_return_price"], "[+] Customer: getTotalPrice logika tampak benar."),
+            Tier(5, "customer_total_price", "[-] Customer: getTotalPrice ada tapi logika return mungkin salah."),
+        ], miss="[-] Customer: Method getTotalPrice tidak ditemukan."),
+        # showDetail (5 pts)
+        Criterion("customer_show_detail", [
+            Tier(5, "customer_show_detail", "[+] Customer: Method showDetail ditemukan."),
+        ], miss="[-] Customer: Method showDetail tidak ditemukan."),
+    ]),
+    # 5. Main Class (10%)
+    Section("main", max_points=20, weight="W_MAIN", guard="has_main", criteria=[
+        Criterion("main_run", [
+            Tier(0, lambda o: _ran(o) and o["run_ok"], "[+] Main: Program berhasil dijalankan."),
+            Tier(0, _ran, "[!] Main: Program gagal dijalankan ({run_msg})."),
+        ]),
+        # Instantiation Vehicle (5 pts)
+        Criterion("main_new_vehicle", [
+            Tier(5, "main_new_vehicle", "[+] Main: Instansiasi Vehicle ditemukan."),
+        ], miss="[-] Main: Tidak ada instansiasi Vehicle."),
+        # Instantiation Customer (5 pts)
+        Criterion("main_new_customer", [
+            Tier(5, "main_new_customer", "[+] Main: Instansiasi Customer ditemukan."),
+        ], miss="[-] Main: Tidak ada instansiasi Customer."),
+        # Output / showDetail calls (10 pts)
+        Criterion("main_show_detail", [
+            Tier(10, lambda o: _ran(o) and o["run_vehicle_detail"] and o["run_customer_detail"], "[+] Main: Program dijalankan, detail Customer dan Vehicle tercetak."),
+            Tier(5, lambda o: _ran(o) and (o["run_vehicle_detail"] or o["run_customer_detail"] or o["main_show_detail"]), "[-] Main: showDetail dipanggil, tapi output detail belum lengkap saat program dijalankan."),
+            Tier(10, lambda o: not _ran(o) and o["main_show_detail"], "[+] Main: Pemanggilan showDetail ditemukan."),
+        ], miss="[-] Main: Tidak ada pemanggilan showDetail."),
+    ]),
+    junit_section(JUNIT_TESTS),
+]
+
+# Bump when scoring logic inside a lambda changes (invalidates cached results)
+VERSION = "4"
+
+RUBRIC = Rubric("modul1", CHECKS, SECTIONS, WEIGHTS, derived=DERIVED, version=VERSION)
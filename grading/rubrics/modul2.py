@@ -0,0 +1,218 @@
+import re
+
+from grading.rubric import Check, Criterion, Rubric, Section, Tier, junit_section
+
+# Modul 2: Player & Score
+
+# Weights
+W_STRUCTURE = 20
+W_INTERFACE = 15
+W_CONSTRUCTOR = 20
+W_METHOD = 30
+W_MAIN = 15
+# Only counts when the JUnit stage ran (--junit); the total is rescaled to 100
+W_BEHAVIOUR = 20
+
+WEIGHTS = {
+    "W_STRUCTURE": W_STRUCTURE,
+    "W_INTERFACE": W_INTERFACE,
+    "W_CONSTRUCTOR": W_CONSTRUCTOR,
+    "W_METHOD": W_METHOD,
+    "W_MAIN": W_MAIN,
+    "W_BEHAVIOUR": W_BEHAVIOUR,
+}
+
+# Dynamic tests, run by grading/junit.py. Method name -> report label
+JUNIT_SOURCE = "GradingTest.java"
+JUNIT_CLASS = "GradingTest"
+JUNIT_TESTS = {
+    "testPlayerCreation": "1. Test Player Creation",
+    "testPlayerUpdateHighScore": "2. Test Player Update High Score",
+    "testPlayerAddCoinsAndDistance": "3. Test Player Add Coins and Distance",
+    "testScoreCreation": "4. Test Score Creation and Getters",
+}
+
+# Execution stage (--run, grading/execute.py): stdin for Main, and patterns
+# matched against what it printed. Player details show its UUID or scores.
+MAIN_INPUT = ""
+OUTPUT_CHECKS = {
+    "run_player_detail": re.compile(r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}|high\s*score|coins?\b|koin', re.IGNORECASE),
+}
+
+# Raw probes, grouped per target file: player, score, showdetail, main.
+# Comments and string contents never match (see grading/lexer.py); checks with
+# a scope only look at that kind of declaration.
+IMPLEMENTS_SHOWDETAIL = r'implements.*ShowDetail'
+PLUS_ASSIGN = r'\+='
+SUM_ASSIGN = r'\w+\s*=\s*\w+\s*\+\s*\w+'
+NUMERIC = r'(int|long|double|float)'
+
+CHECKS = [
+    # Player.java
+    Check("player_package", "player", r'package\s+[\w\.]*model;', re.IGNORECASE),
+    Check("player_numeric", "player", NUMERIC + r'\s+\w+(?:\s*=\s*[^;]+)?;', kind="count", scope="fields"),
+    Check("player_has_uuid", "player", "UUID", kind="contains"),
+    Check("player_has_localdatetime", "player", "LocalDateTime", kind="contains"),
+    Check("player_implements_showdetail", "player", IMPLEMENTS_SHOWDETAIL, re.IGNORECASE, scope="types"),
+    Check("player_implements", "player", r'implements', re.IGNORECASE, scope="types"),
+    Check("player_random_uuid", "player", r'UUID\.randomUUID\($', scope="calls"),
+    Check("player_now", "player", r'LocalDateTime\.now\($', scope="calls"),
+    Check("player_numeric_field", "player", r'^(private|protected)\s+' + NUMERIC + r'\s+\w+(\s*=\s*0)?\s*;', scope="fields"),
+    Check("player_numeric_any", "player", NUMERIC + r'\s+\w+', scope="fields"),
+    Check("player_add_coins", "player", r'\baddCoins\(', re.IGNORECASE, scope="methods"),
+    Check("player_add_distance", "player", r'\baddDistance\(', re.IGNORECASE, scope="methods"),
+    Check("player_update_high_score", "player", r'\bupdateHighScore\(', re.IGNORECASE, scope="methods"),
+    Check("player_show_detail", "player", r'\bshowDetail\(', re.IGNORECASE, scope="methods"),
+    Check("player_highscore_assign", "player", r'highScore\s*=\s*\w+', re.IGNORECASE),
+    Check("player_highscore_guard", "player", r'if\s*\(\s*\w+\s*>\s*highScore'),
+    Check("player_plus_assign", "player", PLUS_ASSIGN),
+    Check("player_sum_assign", "player", SUM_ASSIGN),
+    Check("player_show_detail_decl", "player", r'void\s+showdetail\(', re.IGNORECASE, scope="methods"),
+    Check("player_println", "player", r'System\.out\.println\(', scope="calls"),
+    # Score.java
+    Check("score_package", "score", r'package\s+[\w\.]*model;', re.IGNORECASE),
+    Check("score_implements_showdetail", "score", IMPLEMENTS_SHOWDETAIL, re.IGNORECASE, scope="types"),
+    Check("score_implements", "score", r'implements', re.IGNORECASE, scope="types"),
+    Check("score_assign", "score", r'(this\.)?\w+\s*=\s*\w+;', kind="count", scope="constructors"),
+    # ShowDetail.java
+    Check("showdetail_interface", "showdetail", r'\binterface\s+ShowDetail\b', scope="types"),
+    Check("showdetail_method", "showdetail", r'(public\s+)?void\s+showDetail\(\)\s*;', scope="methods"),
+    # Main.java
+    Check("main_new_player", "main", r'^new (\w+\.)*Player\(', scope="calls"),
+    Check("main_new_score", "main", r'^new (\w+\.)*Score\(', scope="calls"),
+    Check("main_update_high_score", "main", r'\bupdateHighScore\(', scope="calls"),
+    Check("main_add_coins", "main", r'\baddCoins\(', scope="calls"),
+    Check("main_show_detail", "main", r'\bshowDetail\(', re.IGNORECASE, scope="calls"),
+]
+
+
+def _package_ok(o):
+    return o["player_package"] and o["score_package"]
+
+def _adds(method):
+    return lambda o: (o["player_plus_assign"] or o["player_sum_assign"]) and o[method]
+
+def _ran(o):
+    # Main was executed (--run); its output decides the Main criteria
+    return o.get("run_ran", False)
+
+def _bonus_effort(o):
+    # Bonus effort jika sudah mengerjakan mayoritas bagian (>=60% instruksi)
+    instruksi_terpenuhi = (o["interface"] > 7) + (o["constructor"] > 7) + (o["structure"] > 10) + (o["method_count"] >= 3)
+    return instruksi_terpenuhi >= 3
+
+
+DERIVED = {
+    # Method (lihat addCoins, addDistance, updateHighScore, showDetail)
+    "method_count": lambda o: o["player_add_coins"] + o["player_add_distance"] + o["player_update_high_score"] + o["player_show_detail"],
+}
+
+SECTIONS = [
+    # 1. Verifikasi Struktur & Encapsulation (20%)
+    Section("structure", max_points=20, weight="W_STRUCTURE", criteria=[
+        Criterion("model_package", [
+            Tier(5, "model_exists", "[OK] Model package exists at {model_dir_name} (+5)"),
+        ], miss="[X] Model package missing"),
+        # Allow 'package Model;' or 'package model;' or 'package com.example.model;'
+        Criterion("package_declaration", [
+            Tier(5, _package_ok, "[OK] Package declaration correct (+5)"),
+        ], miss="[X] Package declaration missing/incorrect"),
+        # Numeric fields (Player) - lenient: any int/long/double/float field.
+        # Only counted when the package declaration check failed.
+        Criterion("numeric_fields", [
+            Tier(5, lambda o: o["player_numeric"] >= 3, "[OK] Numeric fields in Player ({player_numeric} found) (+5)"),
+        ], miss="[X] Numeric fields in Player (found {player_numeric})", only_if=lambda o: not _package_ok(o)),
+        Criterion("uml_types", [
+            Tier(5, lambda o: o["player_has_uuid"] and o["player_has_localdatetime"], "[OK] UML Types (UUID, LocalDateTime) used (+5)"),
+        ], miss="[X] UML Types missing (UUID or LocalDateTime)"),
+    ]),
+    # 2. Implementasi Interface (15%)
+    Section("interface", max_points=15, weight="W_INTERFACE", criteria=[
+        Criterion("showdetail_interface", [
+            Tier(5, lambda o: o["showdetail_interface"] and o["showdetail_method"], "[OK] Interface ShowDetail defined correctly (+5)"),
+            Tier(2, "showdetail_interface", "[~] Interface ShowDetail ada, tapi method showDetail() belum sesuai. (+2)"),
+        ], miss="[~] Interface ShowDetail belum ditemukan. Coba pastikan nama dan deklarasi sudah benar."),
+        Criterion("player_implements", [
+            Tier(5, "player_implements_showdetail", "[OK] Player sudah mengimplementasikan ShowDetail. Bagus! (+5)"),
+            Tier(2, "player_implements", "[~] Player mengimplementasikan interface lain, pastikan ShowDetail juga diimplementasikan. (+2)"),
+        ], miss="[~] Player belum mengimplementasikan ShowDetail. Coba pastikan deklarasi: 'implements ShowDetail'."),
+        Criterion("score_implements", [
+            Tier(5, "score_implements_showdetail", "[OK] Score sudah mengimplementasikan ShowDetail. (+5)"),
+            Tier(2, "score_implements", "[~] Score mengimplementasikan interface lain, pastikan ShowDetail juga diimplementasikan. (+2)"),
+        ], miss="[~] Score belum mengimplementasikan ShowDetail. Pastikan deklarasi sudah benar."),
+    ]),
+    # 3. Logika Constructor (20%)
+    Section("constructor", max_points=20, weight="W_CONSTRUCTOR", criteria=[
+        Criterion("player_uuid", [
+            Tier(5, "player_random_uuid", "[OK] Player: UUID.randomUUID() sudah digunakan untuk ID. (+5)"),
+            Tier(2, "player_has_uuid", "[~] Player: UUID sudah digunakan, tapi belum randomUUID(). (+2)"),
+        ], miss="[~] Player: UUID generation belum ditemukan. Coba gunakan UUID.randomUUID() untuk membuat ID unik."),
+        Criterion("player_created_at", [
+            Tier(5, "player_now", "[OK] Player: LocalDateTime.now() sudah digunakan untuk createdAt. (+5)"),
+            Tier(2, "player_has_localdatetime", "[~] Player: LocalDateTime sudah digunakan, tapi belum .now(). (+2)"),
+        ], miss="[~] Player: LocalDateTime.now() belum ditemukan. Pastikan createdAt diisi dengan waktu saat pembuatan objek."),
+        # Allow explicit init to 0 OR just reliance on default values (it's Java)
+        Criterion("player_init", [
+            Tier(5, "player_numeric_field", "[OK] Player: Field numerik sudah ada dan diinisialisasi (default 0 atau eksplisit). (+5)"),
+            Tier(2, "player_numeric_any", "[~] Player: Field numerik ada, tapi belum diinisialisasi 0 atau belum private/protected. (+2)"),
+        ], miss="[~] Player: Field numerik belum ditemukan atau belum diinisialisasi. Pastikan ada highScore, totalCoins, totalDistance."),
+        # Look for 'this.x = x' OR 'x = val' inside constructor
+        Criterion("score_constructor", [
+            Tier(5, lambda o: o["score_assign"] >= 3, "[OK] Score: Constructor assignments found (+5)"),
+            Tier(2, lambda o: o["score_assign"] > 0, "[~] Score: Constructor assignment ditemukan {score_assign} kali, sebaiknya minimal 3. (+2)"),
+        ], miss="[~] Score: Constructor assignments belum ditemukan."),
+    ]),
+    Section("bonus", criteria=[
+        Criterion("bonus_effort", [
+            Tier(5, _bonus_effort, "[+] Bonus effort: Sudah mengerjakan mayoritas instruksi, tetap semangat! (+5)"),
+        ]),
+    ]),
+    # 4. Logika Method (30%)
+    Section("method", max_points=30, weight="W_METHOD", criteria=[
+        # updateHighScore: lenient, accept assignment to highScore
+        Criterion("update_high_score", [
+            Tier(10, "player_highscore_assign", "[OK] updateHighScore sudah ada. (+10)"),
+        ], miss="[~] updateHighScore belum ditemukan. Pastikan ada logika update hanya jika skor baru lebih tinggi dari highScore."),
+        Criterion("update_high_score_guard", [
+            Tier(0, lambda o: o["player_highscore_assign"] and not o["player_highscore_guard"],
+                 "[~] Saran: Tambahkan pengecekan 'if (newScore > highScore)' agar hanya update jika skor baru lebih tinggi."),
+        ]),
+        # addCoins / addDistance: += OR = ... + ...
+        Criterion("add_coins", [
+            Tier(5, _adds("player_add_coins"), "[OK] addCoins sudah benar menambah koin. (+5)"),
+        ], miss="[~] addCoins belum ditemukan atau belum menambah koin dengan benar. Pastikan menggunakan '+=' atau penjumlahan."),
+        Criterion("add_distance", [
+            Tier(5, _adds("player_add_distance"), "[OK] addDistance sudah benar menambah jarak. (+5)"),
+        ], miss="[~] addDistance belum ditemukan atau belum menambah jarak dengan benar. Pastikan menggunakan '+=' atau penjumlahan."),
+        # showDetail (case-insensitive)
+        Criterion("show_detail", [
+            Tier(10, lambda o: o["player_show_detail_decl"] and o["player_println"], "[OK] showDetail implementation found (+10)"),
+            Tier(0, "player_show_detail_decl", "[X] showDetail method found but no output"),
+        ], miss="[X] showDetail implementation missing"),
+    ]),
+    # 5. Eksekusi Main & Output (15%)
+    Section("main", max_points=15, weight="W_MAIN", criteria=[
+        Criterion("main_run", [
+            Tier(0, lambda o: _ran(o) and o["run_ok"], "[OK] Main: Program berhasil dijalankan."),
+            Tier(0, _ran, "[!] Main: Program gagal dijalankan ({run_msg})."),
+        ]),
+        Criterion("main_instantiation", [
+            Tier(5, lambda o: o["main_new_player"] and o["main_new_score"], "[OK] Main: Objects instantiated (+5)"),
+        ], miss="[X] Main: Object instantiation missing"),
+        Criterion("main_state_updates", [
+            Tier(5, lambda o: o["main_update_high_score"] and o["main_add_coins"], "[OK] Main: State updates called (+5)"),
+        ], miss="[X] Main: State updates missing"),
+        # Accept both showDetail() and ShowDetail() calls, case-insensitive
+        Criterion("main_show_detail", [
+            Tier(5, lambda o: _ran(o) and o["run_player_detail"], "[OK] Main: showDetail dijalankan, detail Player tercetak (+5)"),
+            Tier(2, lambda o: _ran(o) and o["main_show_detail"], "[~] Main: showDetail dipanggil, tapi detail Player tidak tercetak saat program dijalankan. (+2)"),
+            Tier(5, lambda o: not _ran(o) and o["main_show_detail"], "[OK] Main: showDetail called (+5)"),
+        ], miss="[X] Main: showDetail missing"),
+    ]),
+    junit_section(JUNIT_TESTS),
+]
+
+# Bump when scoring logic inside a lambda changes (invalidates cached results)
+VERSION = "4"
+
+RUBRIC = Rubric("modul2", CHECKS, SECTIONS, WEIGHTS, derived=DERIVED, version=VERSION)
@@ -0,0 +1,108 @@
+import io
+import os
+import itertools
+import contextlib
+import collections
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from grading import profile
+
+# Students submitted to the pool ahead of the one being reported, per job.
+# Keeps the workers busy without queueing (and holding the reports of) a
+# whole cohort at once.
+WINDOW_PER_JOB = 4
+
+
+def resolve_jobs(jobs):
+    # --jobs 0 (or negative) means "use every core"
+    if jobs is None or jobs < 1:
+        return os.cpu_count() or 1
+    return jobs
+
+def _grade_captured(grade_fn, student_path, kwargs, profiling=False):
+    # Runs inside a worker. The report is captured instead of printed so the
+    # parent can emit reports in student order, not completion order; the
+    # same goes for --profile samples, which the parent merges.
+    profiler = profile.enable() if profiling else None
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        score = grade_fn(student_path, **kwargs)
+    return score, buf.getvalue(), profiler and profiler.take()
+
+def _collect(samples):
+    if samples:
+        profile.active().merge(samples)
+
+def _grade_isolated(grade_fn, student_path, kwargs):
+    # Retry one student in its own single-worker pool, so a student that
+    # kills the interpreter only takes itself down.
+    try:
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            future = pool.submit(_grade_captured, grade_fn, student_path, kwargs, profile.active() is not None)
+            score, output, samples = future.result()
+        _collect(samples)
+        return student_path, score, output, None
+    except BrokenProcessPool:
+        return student_path, None, "", "worker process crashed"
+    except Exception as e:
+        return student_path, None, "", f"{type(e).__name__}: {e}"
+
+def _settle(grade_fn, path, kwargs, future):
+    # (result, pool broken?) of one submitted student; None means the pool
+    # was already broken when it was submitted
+    if future is None:
+        return _grade_isolated(grade_fn, path, kwargs), True
+    try:
+        score, output, samples = future.result()
+        _collect(samples)
+        return (path, score, output, None), False
+    except BrokenProcessPool:
+        # The pool is unusable from here on; finish the remaining
+        # students one by one so the crash stays contained.
+        return _grade_isolated(grade_fn, path, kwargs), True
+    except Exception as e:
+        return (path, None, "", f"{type(e).__name__}: {e}"), False
+
+def grade_many(grade_fn, student_paths, jobs=1, task_kwargs=None):
+    # Yields (student_path, score, output, error) in the order of student_paths.
+    # With jobs == 1 the report is printed directly (output is empty).
+    # student_paths may be a generator (--stream); it is consumed as the
+    # grading goes. task_kwargs(path) gives keyword arguments for that one
+    # call: per-student data goes to its own task only, while grade_fn is
+    # pickled into every task.
+    task_kwargs = task_kwargs or (lambda path: {})
+    student_paths = iter(student_paths)
+    jobs = resolve_jobs(jobs)
+    first = list(itertools.islice(student_paths, jobs if jobs > 1 else 0))
+
+    if len(first) <= 1:
+        for path in itertools.chain(first, student_paths):
+            try:
+                yield path, grade_fn(path, **task_kwargs(path)), "", None
+            except Exception as e:
+                yield path, None, "", f"{type(e).__name__}: {e}"
+        return
+
+    broken = False
+    profiling = profile.active() is not None
+    window = jobs * WINDOW_PER_JOB
+    pending = collections.deque()
+    with ProcessPoolExecutor(max_workers=len(first)) as pool:
+        for path in itertools.chain(first, student_paths):
+            kwargs = task_kwargs(path)
+            future = None
+            if not broken:
+                try:
+                    future = pool.submit(_grade_captured, grade_fn, path, kwargs, profiling)
+                except BrokenProcessPool:
+                    broken = True
+            pending.append((path, kwargs, future))
+            while len(pending) > window or (broken and pending):
+                result, crashed = _settle(grade_fn, *pending.popleft())
+                broken = broken or crashed
+                yield result
+        while pending:
+            result, crashed = _settle(grade_fn, *pending.popleft())
+            broken = broken or crashed
+            yield result
@@ -0,0 +1,336 @@
+import os
+import json
+import time
+import queue
+import shutil
+import signal
+import threading
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from socketserver import ThreadingMixIn, UnixStreamServer
+from urllib.parse import parse_qs, urlsplit
+
+from grading.cache import ResultCache
+from grading.cli import available_modules, finish_student, format_report, is_single_project, load_module, load_student
+from grading.zipsource import forget_archive, zip_listdir
+
+# Grading server (--serve) for graders and the LMS to query interactively:
+# the process stays up with every rubric compiled, the lexer and result
+# caches warm and, with --junit, a BatchCompiler and a BatchRunner JVM per
+# worker already running, so one submission is graded in milliseconds
+# instead of paying interpreter, import and JVM startup per request.
+#
+#   python grade.py .. --serve 127.0.0.1:8765 --jobs 2 --junit
+#   python grade.py .. --serve /tmp/autograde.sock          # Unix socket
+#
+#   curl --data-binary @Budi_123.zip 'http://127.0.0.1:8765/grade?module=modul1&student=Budi_123'
+#   curl 'http://127.0.0.1:8765/grade?student=Budi_123'     # folder under root_dir
+#   curl 'http://127.0.0.1:8765/grade?student=Budi_123&format=text'
+#   curl http://127.0.0.1:8765/health
+#
+# Requests go into a bounded queue served by --jobs worker threads. When the
+# queue is full the server answers 503 with Retry-After at once instead of
+# letting requests pile up behind a slow cohort; /health shows the queue depth.
+# Each worker owns its JVMs, so a submission that hangs or kills its JVM
+# only costs that worker a restart (grading/junit.py, WarmProcess).
+
+MAX_UPLOAD = 32 * 1024 * 1024
+# Seconds a request waits for its result; the job itself still finishes
+# (and lands in the result cache)
+WAIT_TIMEOUT = 120.0
+
+
+class RequestError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class Job:
+    __slots__ = ("name", "path", "module", "junit", "upload", "done", "result", "error", "queued", "started", "finished")
+
+    def __init__(self, name, path, module, junit, upload=None):
+        self.name = name
+        self.path = path
+        self.module = module
+        self.junit = junit
+        self.upload = upload      # folder of an uploaded zip, removed after grading
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.queued = time.perf_counter()
+        self.started = self.finished = None
+
+
+def parse_address(text):
+    # "host:port", ":port" or a socket path (anything with a "/")
+    if "/" in text:
+        return text
+    host, _, port = text.rpartition(":")
+    try:
+        return host or "127.0.0.1", int(port)
+    except ValueError:
+        raise ValueError(f"alamat --serve harus host:port atau path socket, bukan {text!r}")
+
+
+class GradingServer:
+    def __init__(self, root_dir, args):
+        from grading.junit import DEFAULT_BUILD_DIR, java_available
+        self.root_dir = os.path.abspath(root_dir)
+        self.default_module = args.module
+        # Importing a module compiles its rubric
+        self.modules = {name: load_module(name) for name in available_modules()}
+        self.cache = None if args.no_cache else ResultCache(args.cache_dir)
+        self.build_dir = os.path.abspath(DEFAULT_BUILD_DIR)
+        self.upload_dir = os.path.join(self.build_dir, "uploads")
+        self.junit = args.junit and java_available()
+        if args.junit and not self.junit:
+            print("[!] java/javac tidak ditemukan, tahap JUnit dilewati.")
+        self.workers = max(1, args.jobs or os.cpu_count() or 1)
+        self.queue = queue.Queue(args.queue)
+        self.lock = threading.Lock()
+        self.busy = self.graded = self.rejected = 0
+        self.stages = []
+
+    def start(self):
+        for _ in range(self.workers):
+            threading.Thread(target=self._work, daemon=True).start()
+
+    def stop(self):
+        with self.lock:
+            for stage in self.stages:
+                stage.close()
+
+    def health(self):
+        return {
+            "status": "ok",
+            "modules": list(self.modules),
+            "junit": self.junit,
+            "workers": self.workers,
+            "busy": self.busy,
+            "queue": self.queue.qsize(),
+            "capacity": self.queue.maxsize,
+            "graded": self.graded,
+            "rejected": self.rejected,
+        }
+
+    def job(self, params, body):
+        module = params.get("module", self.default_module)
+        if module not in self.modules:
+            raise RequestError(400, f"modul tidak dikenal: {module}")
+        junit = self.junit and params.get("junit", "1") != "0"
+        name = params.get("student")
+        if body is None:
+            # A student folder (or zip) under root_dir
+            if not name:
+                raise RequestError(400, "parameter student atau isi zip diperlukan")
+            path = os.path.abspath(os.path.join(self.root_dir, name))
+            if os.path.dirname(path) != self.root_dir or not (os.path.exists(path) or zip_listdir(path) is not None):
+                raise RequestError(404, f"mahasiswa tidak ditemukan: {name}")
+            return Job(os.path.basename(path), path, module, junit)
+        name = os.path.basename(name or "") or "upload"
+        if name.lower().endswith(".zip"):
+            name = name[:-4]
+        upload = os.path.join(self.upload_dir, uuid.uuid4().hex)
+        os.makedirs(upload)
+        path = os.path.join(upload, name + ".zip")
+        with open(path, "wb") as f:
+            f.write(body)
+        listing = zip_listdir(path)
+        if listing is not None and not is_single_project(path, listing) and len(listing[0]) == 1:
+            # Zipped together with its project folder
+            path = os.path.join(path, listing[0][0])
+            name = os.path.basename(params.get("student") or "") or listing[0][0]
+            listing = zip_listdir(path)
+        if listing is None or not is_single_project(path, listing):
+            self.discard(upload)
+            raise RequestError(400, "isi request harus zip berisi satu project (src/ atau file .java)")
+        return Job(name, path, module, junit, upload)
+
+    def discard(self, upload):
+        forget_archive(os.path.join(upload, os.listdir(upload)[0]))
+        shutil.rmtree(upload, ignore_errors=True)
+
+    def submit(self, job):
+        # Raises queue.Full when the server is saturated
+        try:
+            self.queue.put_nowait(job)
+        except queue.Full:
+            with self.lock:
+                self.rejected += 1
+            if job.upload:
+                self.discard(job.upload)
+            raise
+
+    def _work(self):
+        stages = {}     # module -> this worker's warm JUnitStage
+        if self.junit:
+            self._stage(stages, self.default_module).start_warm()
+        while True:
+            job = self.queue.get()
+            with self.lock:
+                self.busy += 1
+            job.started = time.perf_counter()
+            try:
+                job.result = self._grade(job, stages)
+            except Exception as e:
+                job.error = f"{type(e).__name__}: {e}"
+            finally:
+                if job.upload:
+                    self.discard(job.upload)
+                job.finished = time.perf_counter()
+                with self.lock:
+                    self.busy -= 1
+                    self.graded += 1
+                job.done.set()
+
+    def _stage(self, stages, module):
+        stage = stages.get(module)
+        if stage is None:
+            from grading.junit import REPO_ROOT, JUnitStage
+            grader = self.modules[module]
+            stage = stages[module] = JUnitStage(os.path.join(REPO_ROOT, grader.JUNIT_SOURCE), grader.JUNIT_CLASS,
+                                                list(grader.JUNIT_TESTS), self.build_dir)
+            with self.lock:
+                self.stages.append(stage)
+        return stage
+
+    def _grade(self, job, stages):
+        extra_facts = None
+        if job.junit:
+            from grading.junit import collect_sources
+            grader = self.modules[job.module]
+            (_, sources), = collect_sources([job.path], grader.find_source_root, self.build_dir)
+            extra_facts = self._stage(stages, job.module).grade_one(job.path, sources)
+        loaded = load_student(job.path, job.module, self.cache, extra_facts)
+        return finish_student(job.path, loaded, job.module, self.cache, report=False)
+
+    def response(self, job, fmt):
+        # (content type, body) of a finished job
+        result = job.result
+        if fmt == "text":
+            text = format_report(job.name, result, self.modules[job.module].PASS_NOTE) if result else f"ERROR: {job.error}\n"
+            return "text/plain; charset=utf-8", text
+        record = {
+            "student": job.name,
+            "module": job.module,
+            "score": None if result is None else round(result.total, 2),
+            "sections": None if result is None else result.sections,
+            "criteria": None if result is None else result.criteria,
+            "details": [] if result is None else result.details,
+            "error": job.error,
+            "queue_ms": round((job.started - job.queued) * 1000, 1),
+            "grade_ms": round((job.finished - job.started) * 1000, 1),
+        }
+        return "application/json", json.dumps(record, ensure_ascii=False)
+
+
+class Handler(BaseHTTPRequestHandler):
+    server_version = "AutoGrade"
+    protocol_version = "HTTP/1.1"
+
+    def address_string(self):
+        # Unix socket clients have no address
+        return self.client_address[0] if isinstance(self.client_address, tuple) else "unix"
+
+    def _send(self, status, content_type, text, headers=()):
+        data = text.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _error(self, status, message, headers=()):
+        self._send(status, "application/json", json.dumps({"error": message}), headers)
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        if url.path == "/health":
+            self._send(200, "application/json", json.dumps(self.server.grading.health()))
+        elif url.path == "/grade":
+            self._grade(url, None)
+        else:
+            self._error(404, "endpoint: /grade, /health")
+
+    def do_POST(self):
+        url = urlsplit(self.path)
+        if url.path != "/grade":
+            self._error(404, "endpoint: /grade, /health")
+            return
+        length = self.headers.get("Content-Length")
+        if length is None or not length.isdigit():
+            self.close_connection = True
+            self._error(411, "Content-Length diperlukan")
+            return
+        if int(length) > MAX_UPLOAD:
+            self.close_connection = True
+            self._error(413, f"zip lebih dari {MAX_UPLOAD // (1024 * 1024)} MB")
+            return
+        self._grade(url, self.rfile.read(int(length)))
+
+    def _grade(self, url, body):
+        grading = self.server.grading
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        try:
+            job = grading.job(params, body)
+        except RequestError as e:
+            self._error(e.status, str(e))
+            return
+        try:
+            grading.submit(job)
+        except queue.Full:
+            self._error(503, "antrian penuh, coba lagi", [("Retry-After", "1")])
+            return
+        if not job.done.wait(WAIT_TIMEOUT):
+            self._error(504, f"belum selesai dalam {WAIT_TIMEOUT:g} detik")
+            return
+        self._send(200, *grading.response(job, params.get("format")))
+
+
+class UnixHTTPServer(ThreadingMixIn, UnixStreamServer):
+    daemon_threads = True
+
+    def server_bind(self):
+        # A socket file left behind by a previous server
+        if os.path.exists(self.server_address):
+            os.remove(self.server_address)
+        super().server_bind()
+
+
+def _terminate(signum, frame):
+    raise KeyboardInterrupt
+
+def serve(args):
+    try:
+        address = parse_address(args.serve)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return
+    grading = GradingServer(args.root_dir, args)
+    try:
+        if isinstance(address, str):
+            httpd = UnixHTTPServer(address, Handler)
+        else:
+            httpd = ThreadingHTTPServer(address, Handler)
+    except OSError as e:
+        print(f"Error: {args.serve} tidak bisa dipakai: {e}")
+        return
+    httpd.grading = grading
+    grading.start()
+    where = address if isinstance(address, str) else f"http://{address[0]}:{address[1]}"
+    print(f"Server penilaian di {where} ({grading.workers} worker, antrian {grading.queue.maxsize}"
+          f"{', JUnit' if grading.junit else ''}). Ctrl+C untuk berhenti.")
+    # systemd and docker stop with SIGTERM; shut down the JVMs the same way
+    signal.signal(signal.SIGTERM, _terminate)
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        print("\nServer berhenti.")
+    finally:
+        httpd.server_close()
+        grading.stop()
+        if isinstance(address, str) and os.path.exists(address):
+            os.remove(address)
@@ -0,0 +1,228 @@
+import os
+import json
+import hashlib
+import tempfile
+import functools
+
+from grading import profile
+from grading.index import open_index
+from grading.lexer import TOKEN, strip
+from grading.runner import grade_many
+
+# Near-duplicate detection across a cohort (--similarity).
+#
+# Every .java file is reduced to a normalized token stream: comments and
+# literal contents dropped, every identifier and number collapsed to one
+# symbol, keywords and punctuation kept. Renaming variables or reformatting
+# a copied file therefore changes nothing. The stream is cut into shingles of
+# SHINGLE tokens and fingerprinted with one-permutation MinHash: each shingle
+# is hashed once, the hash picks one of BINS bins and each bin keeps its
+# smallest value. The share of equal bins between two fingerprints estimates
+# the Jaccard similarity of their shingle sets.
+#
+# A submission's fingerprint is the bin-wise minimum over its files (the
+# fingerprint of the union of their shingles), so per-file fingerprints are
+# stored by content hash and reused by later runs; only edited files are
+# hashed again.
+#
+# Candidates come from LSH banding: the BINS values are split into BANDS
+# bands of ROWS, and two submissions become a candidate pair only if they
+# agree on a whole band. Only candidates are compared, and single-linkage
+# over pairs at or above the threshold forms the clusters.
+
+SHINGLE = 5
+BANDS = 16
+ROWS = 4
+BINS = BANDS * ROWS
+DEFAULT_THRESHOLD = 0.8
+FINGERPRINT_VERSION = f"oph-{SHINGLE}-{BINS}-1"
+# Offset between densified bins, larger than any bin value (hash // BINS)
+DENSIFY_STEP = 1 << 64
+
+KEYWORDS = {
+    "abstract", "assert", "boolean", "break", "byte", "case", "catch", "char",
+    "class", "const", "continue", "default", "do", "double", "else", "enum",
+    "extends", "final", "finally", "float", "for", "goto", "if", "implements",
+    "import", "instanceof", "int", "interface", "long", "native", "new",
+    "package", "private", "protected", "public", "return", "short", "static",
+    "strictfp", "super", "switch", "synchronized", "this", "throw", "throws",
+    "transient", "try", "void", "volatile", "while", "var", "record", "true",
+    "false", "null",
+}
+
+
+def _normalize(token):
+    first = token[0]
+    if first.isdigit():
+        return "0"
+    if first.isalpha() or first in "_$":
+        return token if token in KEYWORDS else "i"
+    return token
+
+def normalized_tokens(text):
+    # A file repeats few distinct tokens, so each is classified once
+    memo = {}
+    return [memo.get(token) or memo.setdefault(token, _normalize(token)) for token in TOKEN.findall(strip(text))]
+
+def file_signature(text):
+    # Bins no shingle fell into stay None until densify()
+    tokens = normalized_tokens(text)
+    signature = [None] * BINS
+    shingles = {" ".join(shingle) for shingle in set(zip(*(tokens[k:] for k in range(SHINGLE))))}
+    for shingle in shingles:
+        h = int.from_bytes(hashlib.blake2b(shingle.encode(), digest_size=8).digest(), "big")
+        b = h % BINS
+        value = h // BINS
+        if signature[b] is None or value < signature[b]:
+            signature[b] = value
+    return signature
+
+def merge(a, b):
+    return [y if x is None else x if y is None else min(x, y) for x, y in zip(a, b)]
+
+def densify(signature):
+    # Empty bins borrow from the next filled bin to the right, offset by the
+    # distance, so two sets agree on an empty bin as often as on a filled one
+    filled = [i for i, value in enumerate(signature) if value is not None]
+    if not filled:
+        return None
+    dense = list(signature)
+    for i, value in enumerate(signature):
+        if value is None:
+            for d in range(1, BINS):
+                j = (i + d) % BINS
+                if signature[j] is not None:
+                    dense[i] = signature[j] + d * DENSIFY_STEP
+                    break
+    return dense
+
+def estimate(a, b):
+    return sum(x == y for x, y in zip(a, b)) / BINS
+
+
+class FingerprintStore:
+    # Per-file signatures on disk, one small JSON file per content hash, next
+    # to the result cache (and pruned with it).
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], key + ".json")
+
+    def get(self, key):
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                signature = json.load(f)
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return signature if isinstance(signature, list) and len(signature) == BINS else None
+
+    def put(self, key, signature):
+        path = self._path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(signature, f)
+            os.replace(tmp, path)
+        except OSError:
+            pass
+
+
+def fingerprint(student_path, store=None):
+    # Densified signature of every .java file in the submission, None if it has
+    # no code to compare
+    index = open_index(student_path)
+    signature = None
+    for path in index.files(suffix=".java"):
+        try:
+            data = index.read_bytes(path)
+        except OSError:
+            continue
+        key = hashlib.sha256(FINGERPRINT_VERSION.encode() + b"\0" + data).hexdigest()
+        file_sig = store.get(key) if store is not None else None
+        if file_sig is None:
+            file_sig = file_signature(data.decode("utf-8", "ignore"))
+            if store is not None:
+                store.put(key, file_sig)
+        signature = file_sig if signature is None else merge(signature, file_sig)
+    return None if signature is None else densify(signature)
+
+
+class Cluster:
+    __slots__ = ("members", "pairs")
+
+    def __init__(self, members, pairs):
+        self.members = members    # student names, sorted
+        self.pairs = pairs        # (student, student, similarity) that linked them
+
+
+def find_clusters(fingerprints, threshold=DEFAULT_THRESHOLD):
+    # fingerprints: student -> densified signature (None entries are skipped).
+    # Identical signatures are merged first, so a cohort full of exact copies
+    # doesn't turn one LSH bucket into a quadratic comparison.
+    groups = {}
+    for student, signature in sorted(fingerprints.items()):
+        if signature is not None:
+            groups.setdefault(tuple(signature), []).append(student)
+    signatures = list(groups)
+    parent = list(range(len(signatures)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    buckets = {}
+    for i, signature in enumerate(signatures):
+        for band in range(BANDS):
+            buckets.setdefault((band, signature[band * ROWS:(band + 1) * ROWS]), []).append(i)
+
+    edges = []
+    for members in buckets.values():
+        for n, a in enumerate(members):
+            for b in members[n + 1:]:
+                root_a, root_b = find(a), find(b)
+                if root_a == root_b:
+                    continue
+                similarity = estimate(signatures[a], signatures[b])
+                if similarity >= threshold:
+                    parent[root_a] = root_b
+                    edges.append((a, b, similarity))
+
+    clusters = {}
+    for i, signature in enumerate(signatures):
+        students = groups[signature]
+        cluster = clusters.setdefault(find(i), ([], []))
+        cluster[0].extend(students)
+        cluster[1].extend((students[0], other, 1.0) for other in students[1:])
+    for a, b, similarity in edges:
+        clusters[find(a)][1].append((groups[signatures[a]][0], groups[signatures[b]][0], similarity))
+
+    result = [Cluster(sorted(members), sorted(pairs, key=lambda p: -p[2])) for members, pairs in clusters.values() if len(members) > 1]
+    result.sort(key=lambda c: (-len(c.members), -c.pairs[0][2], c.members))
+    return result
+
+def cohort_clusters(paths, threshold=DEFAULT_THRESHOLD, store=None, jobs=1):
+    # Fingerprints are computed in the same process pool as grading (--jobs);
+    # a submission that can't be fingerprinted is left out of the comparison
+    fingerprints = {}
+    with profile.phase("similarity: fingerprint"):
+        for path, signature, output, error in grade_many(functools.partial(fingerprint, store=store), paths, jobs):
+            fingerprints[os.path.basename(path)] = signature
+    with profile.phase("similarity: lsh"):
+        return find_clusters(fingerprints, threshold)
+
+def print_clusters(clusters, threshold):
+    print(f"\nKemiripan Kode (MinHash/LSH, ambang {threshold:.2f}):")
+    if not clusters:
+        print("Tidak ada submission yang mirip.")
+        return
+    for n, cluster in enumerate(clusters, 1):
+        print(f"Klaster {n}: {len(cluster.members)} mahasiswa - {', '.join(cluster.members)}")
+        for a, b, similarity in cluster.pairs:
+            print(f"  {a} ~ {b}: {similarity:.2f}")
@@ -0,0 +1,284 @@
+import os
+import json
+import time
+import sqlite3
+from urllib.request import pathname2url
+
+# Local results database (--db), kept across semesters and rubric versions.
+#
+#   runs      one row per grading run: module, rubric and checks
+#             fingerprints, root folder, shard, dynamic stages, start and last
+#             write time
+#   students  folder names, shared by all runs
+#   results   score or error of a student in a run, and the raw outcomes it
+#             was scored from (JSON) for --rescore
+#   criteria  points per criterion, sections  raw points per section,
+#   details   the report lines, in order
+#
+# Results are buffered and written in one transaction per BATCH students
+# (and at the end of every cohort pass), so the store costs a few
+# milliseconds per batch instead of a disk sync per student. A student graded
+# again in the same run (--watch) replaces its earlier rows.
+#
+# Queries (python -m grading.query) read straight from the indexes: criteria
+# are keyed by (run, criterion, points), results by run and by student.
+
+DEFAULT_DB = "grades.sqlite"
+BATCH = 200
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    module TEXT NOT NULL,
+    rubric TEXT NOT NULL,
+    checks TEXT,
+    root TEXT,
+    shard TEXT,
+    stages TEXT NOT NULL DEFAULT '',
+    started REAL NOT NULL,
+    finished REAL
+);
+CREATE INDEX IF NOT EXISTS runs_module ON runs(module, id);
+CREATE TABLE IF NOT EXISTS students (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS results (
+    run INTEGER NOT NULL,
+    student INTEGER NOT NULL,
+    path TEXT,
+    score REAL,
+    error TEXT,
+    outcomes TEXT,
+    PRIMARY KEY (run, student)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS results_student ON results(student, run);
+CREATE TABLE IF NOT EXISTS criteria (
+    run INTEGER NOT NULL,
+    student INTEGER NOT NULL,
+    criterion TEXT NOT NULL,
+    points REAL NOT NULL,
+    PRIMARY KEY (run, student, criterion)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS criteria_points ON criteria(run, criterion, points);
+CREATE TABLE IF NOT EXISTS sections (
+    run INTEGER NOT NULL,
+    student INTEGER NOT NULL,
+    section TEXT NOT NULL,
+    points REAL NOT NULL,
+    PRIMARY KEY (run, student, section)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS details (
+    run INTEGER NOT NULL,
+    student INTEGER NOT NULL,
+    line INTEGER NOT NULL,
+    text TEXT NOT NULL,
+    PRIMARY KEY (run, student, line)
+) WITHOUT ROWID;
+"""
+
+
+class StoreError(Exception):
+    pass
+
+
+class ResultStore:
+    def __init__(self, path=DEFAULT_DB, readonly=False):
+        # readonly: for queries, which must not write to the database
+        self.path = path
+        try:
+            if readonly:
+                self.db = sqlite3.connect(f"file:{pathname2url(os.path.abspath(path))}?mode=ro", uri=True)
+            else:
+                os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+                self.db = sqlite3.connect(path)
+            version = self.db.execute("PRAGMA user_version").fetchone()[0]
+            if version > SCHEMA_VERSION:
+                self.db.close()
+                raise StoreError(f"{path} dibuat oleh versi grader yang lebih baru (skema {version}).")
+            if readonly:
+                if version == 0:
+                    self.db.close()
+                    raise StoreError(f"{path} bukan database hasil penilaian.")
+            else:
+                # Readers (queries) don't block a run that is writing
+                self.db.execute("PRAGMA journal_mode=WAL")
+                self.db.execute("PRAGMA synchronous=NORMAL")
+                self.db.executescript(SCHEMA)
+                self.db.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+        except (sqlite3.Error, OSError) as e:
+            raise StoreError(f"database {path} tidak bisa dibuka: {e}")
+        self._students = {}
+
+    def student_id(self, name):
+        sid = self._students.get(name)
+        if sid is None:
+            self.db.execute("INSERT OR IGNORE INTO students(name) VALUES (?)", (name,))
+            sid = self.db.execute("SELECT id FROM students WHERE name = ?", (name,)).fetchone()[0]
+            self._students[name] = sid
+        return sid
+
+    def start_run(self, rubric, root=None, shard=None, stages=()):
+        # The run row is added with the first batch, so a run that grades
+        # nobody leaves nothing behind
+        run = (rubric.name, rubric.fingerprint, rubric.checks_fingerprint, root and os.path.abspath(root),
+               None if shard is None else f"{shard[0]}/{shard[1]}", ",".join(sorted(stages)), time.time())
+        return RunWriter(self, run)
+
+    def close(self):
+        self.db.close()
+
+    # Queries. `run` is a run id; latest_run() picks the default one.
+
+    def latest_run(self, module=None, before=None):
+        sql = "SELECT id FROM runs WHERE 1 = 1"
+        params = []
+        if module:
+            sql += " AND module = ?"
+            params.append(module)
+        if before is not None:
+            sql += " AND id < ?"
+            params.append(before)
+        row = self.db.execute(sql + " ORDER BY id DESC LIMIT 1", params).fetchone()
+        return None if row is None else row[0]
+
+    def run_info(self, run):
+        fields = ("id", "module", "rubric", "checks", "root", "shard", "stages", "started", "finished")
+        row = self.db.execute(f"SELECT {', '.join(fields)} FROM runs WHERE id = ?", (run,)).fetchone()
+        if row is None:
+            raise StoreError(f"Run {run} tidak ada di {self.path}.")
+        return dict(zip(fields, row))
+
+    def runs(self, module=None):
+        # (run info, students graded, errors, average score), oldest first
+        sql = """
+            SELECT r.id, r.module, r.rubric, r.root, r.shard, r.stages, r.started, r.finished,
+                   count(x.student), count(x.error), avg(x.score)
+            FROM runs r LEFT JOIN results x ON x.run = r.id
+        """
+        params = []
+        if module:
+            sql += " WHERE r.module = ?"
+            params.append(module)
+        sql += " GROUP BY r.id ORDER BY r.id"
+        return self.db.execute(sql, params).fetchall()
+
+    def scores(self, run):
+        # student -> (score or None, error or None)
+        rows = self.db.execute("""
+            SELECT s.name, x.score, x.error FROM results x JOIN students s ON s.id = x.student
+            WHERE x.run = ? ORDER BY s.name
+        """, (run,))
+        return {name: (score, error) for name, score, error in rows}
+
+    def outcomes(self, run):
+        # student -> (path, error, raw outcomes or None), for --rescore
+        rows = self.db.execute("""
+            SELECT s.name, x.path, x.error, x.outcomes FROM results x JOIN students s ON s.id = x.student
+            WHERE x.run = ? ORDER BY s.name
+        """, (run,))
+        return {name: (path, error, None if outcomes is None else json.loads(outcomes)) for name, path, error, outcomes in rows}
+
+    def criterion_keys(self, run):
+        # criterion -> (students scored, students with 0 points, best points)
+        rows = self.db.execute("""
+            SELECT criterion, count(*), sum(points <= 0), max(points) FROM criteria
+            WHERE run = ? GROUP BY criterion ORDER BY criterion
+        """, (run,))
+        return {key: (count, zero, best) for key, count, zero, best in rows}
+
+    def missing(self, run, criterion, max_points=0):
+        # Students whose points for the criterion are at most max_points
+        rows = self.db.execute("""
+            SELECT s.name, c.points FROM criteria c JOIN students s ON s.id = c.student
+            WHERE c.run = ? AND c.criterion = ? AND c.points <= ? ORDER BY s.name
+        """, (run, criterion, max_points))
+        return rows.fetchall()
+
+    def criterion_points(self, run):
+        # (student, criterion, points) rows of a run, for grading/analytics.py
+        return self.db.execute("""
+            SELECT s.name, c.criterion, c.points FROM criteria c JOIN students s ON s.id = c.student
+            WHERE c.run = ?
+        """, (run,)).fetchall()
+
+    def criteria(self, run):
+        # student -> {criterion: points}
+        found = {}
+        for name, key, points in self.criterion_points(run):
+            found.setdefault(name, {})[key] = points
+        return found
+
+    def details(self, run, student):
+        rows = self.db.execute("""
+            SELECT d.text FROM details d JOIN students s ON s.id = d.student
+            WHERE d.run = ? AND s.name = ? ORDER BY d.line
+        """, (run, student))
+        return [text for text, in rows]
+
+    def history(self, student, module=None):
+        # (run, module, started, score, error) of one student, oldest first
+        sql = """
+            SELECT r.id, r.module, r.started, x.score, x.error
+            FROM results x JOIN runs r ON r.id = x.run JOIN students s ON s.id = x.student
+            WHERE s.name = ?
+        """
+        params = [student]
+        if module:
+            sql += " AND r.module = ?"
+            params.append(module)
+        return self.db.execute(sql + " ORDER BY r.id", params).fetchall()
+
+
+class RunWriter:
+    # Writer for one run, with the same write() as grading/output.py writers
+    def __init__(self, store, info):
+        self.store = store
+        self.info = info
+        self.run = None
+        self.pending = {}
+        self.written = set()
+
+    def write(self, student, path, result, error=None):
+        # The last write of a student wins, also within one batch
+        self.pending.pop(student, None)
+        self.pending[student] = (path, result, error)
+        if len(self.pending) >= BATCH:
+            self.flush()
+
+    def flush(self):
+        if not self.pending:
+            return
+        store = self.store
+        results, criteria, sections, details, replaced = [], [], [], [], []
+        with store.db:
+            if self.run is None:
+                self.run = store.db.execute(
+                    "INSERT INTO runs(module, rubric, checks, root, shard, stages, started) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    self.info).lastrowid
+            run = self.run
+            for student, (path, result, error) in self.pending.items():
+                sid = store.student_id(student)
+                if sid in self.written:
+                    replaced.append((run, sid))
+                self.written.add(sid)
+                outcomes = None if result is None or result.outcomes is None else json.dumps(result.outcomes)
+                results.append((run, sid, path, None if result is None else round(result.total, 2), error, outcomes))
+                if result is None:
+                    continue
+                criteria.extend((run, sid, key, points) for key, points in result.criteria.items())
+                sections.extend((run, sid, key, points) for key, points in result.sections.items())
+                details.extend((run, sid, line, text) for line, text in enumerate(result.details))
+            for table in ("criteria", "sections", "details"):
+                store.db.executemany(f"DELETE FROM {table} WHERE run = ? AND student = ?", replaced)
+            store.db.executemany("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?)", results)
+            store.db.executemany("INSERT INTO criteria VALUES (?, ?, ?, ?)", criteria)
+            store.db.executemany("INSERT INTO sections VALUES (?, ?, ?, ?)", sections)
+            store.db.executemany("INSERT INTO details VALUES (?, ?, ?, ?)", details)
+            store.db.execute("UPDATE runs SET finished = ? WHERE id = ?", (time.time(), run))
+        self.pending = {}
+
+    def close(self):
+        self.flush()
+        self.store.close()
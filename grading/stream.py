@@ -0,0 +1,71 @@
+import os
+import math
+import itertools
+from array import array
+
+from grading.checkpoint import shard_of
+from grading.zipsource import zip_listdir
+
+# Streaming mode (--stream) for very large cohorts, e.g. every class of
+# several years in one run. The regular run lists and sorts all student
+# folders first and keeps a dict of results; here folders are read from the
+# directory as the grading goes, each student is graded, printed and written
+# to --format/--db/the checkpoint as soon as it is found, and all that stays
+# behind is its name and total in a ScoreBoard. The compiled-class, lexer and
+# result caches are bounded already, so peak memory no longer grows with the
+# cohort (the summary's name list aside).
+#
+# Students come in directory order instead of sorted. Dynamic stages
+# (--junit, --run) run per CHUNK students, so their JVM batches stay large
+# while the facts of only one chunk are held.
+
+CHUNK = 500
+
+
+def iter_student_folders(root_dir, shard=None):
+    # find_student_folders() without the list: names as the directory yields them
+    listing = zip_listdir(root_dir)
+    if listing is not None:
+        names = iter(listing[0])
+    else:
+        names = (entry.name for entry in _scan(root_dir) if entry.is_dir())
+    for name in names:
+        if name == "GradingSystem" or name.startswith("."):
+            continue
+        if shard is not None and shard_of(name, shard[1]) != shard[0]:
+            continue
+        yield name
+
+def _scan(root_dir):
+    with os.scandir(root_dir) as entries:
+        yield from entries
+
+def chunked(items, size=CHUNK):
+    items = iter(items)
+    while True:
+        chunk = list(itertools.islice(items, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class ScoreBoard:
+    # What a streamed run keeps per student: the name and the total (NaN for
+    # an error) in two flat arrays. items() matches a {student: score} dict,
+    # for print_summary.
+    __slots__ = ("names", "totals")
+
+    def __init__(self):
+        self.names = []
+        self.totals = array("d")
+
+    def add(self, student, total):
+        self.names.append(student)
+        self.totals.append(math.nan if total is None else total)
+
+    def __len__(self):
+        return len(self.names)
+
+    def items(self):
+        for name, total in zip(self.names, self.totals):
+            yield name, None if math.isnan(total) else total
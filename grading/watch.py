@@ -0,0 +1,196 @@
+import os
+import sys
+import time
+import errno
+import select
+import struct
+import ctypes
+import ctypes.util
+
+from grading.index import SubmissionIndex, ignored_dir
+
+# Live regrading for lab sessions. A watcher reports which top-level folders
+# under root_dir (i.e. which students) had a .java file change; only those are
+# regraded. inotify is used on Linux, anything else falls back to polling
+# file mtimes.
+
+POLL_INTERVAL = 0.5
+# Editors save in bursts (write temp file, rename, touch); wait this long for
+# the burst to finish before regrading
+DEBOUNCE = 0.15
+
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF
+_EVENT = struct.Struct("iIII")
+
+
+def _top_level(root_dir, path):
+    rel = os.path.relpath(path, root_dir)
+    if rel == "." or rel.startswith(".."):
+        return None
+    return rel.split(os.sep, 1)[0]
+
+def _is_relevant(name, is_dir):
+    return is_dir or name.lower().endswith(".java")
+
+
+class PollingWatcher:
+    def __init__(self, root_dir):
+        self.root_dir = root_dir
+        self._snapshot = self._scan()
+
+    def _scan(self):
+        snapshot = {}
+        try:
+            entries = os.listdir(self.root_dir)
+        except OSError:
+            return snapshot
+        for name in entries:
+            path = os.path.join(self.root_dir, name)
+            if os.path.isdir(path):
+                index = SubmissionIndex(path)
+                state = [("d", os.path.relpath(d, path)) for d in index.dirs()]
+                for f in index.files(suffix=".java"):
+                    try:
+                        st = os.stat(f)
+                    except OSError:
+                        continue
+                    state.append((os.path.relpath(f, path), st.st_mtime_ns, st.st_size))
+                snapshot[name] = state
+            elif _is_relevant(name, False):
+                try:
+                    st = os.stat(path)
+                    snapshot[name] = (st.st_mtime_ns, st.st_size)
+                except OSError:
+                    pass
+        return snapshot
+
+    def wait(self, timeout):
+        time.sleep(timeout)
+        snapshot = self._scan()
+        changed = {name for name in snapshot.keys() | self._snapshot.keys()
+                   if snapshot.get(name) != self._snapshot.get(name)}
+        self._snapshot = snapshot
+        return changed
+
+    def close(self):
+        pass
+
+
+class InotifyWatcher:
+    def __init__(self, root_dir):
+        self.root_dir = root_dir
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._paths = {}
+        try:
+            self._add_tree(root_dir)
+        except OSError:
+            self.close()
+            raise
+
+    def _add(self, path):
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), WATCH_MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            if err in (errno.ENOENT, errno.ENOTDIR, errno.EACCES):
+                return
+            # ENOSPC: fs.inotify.max_user_watches reached
+            raise OSError(err, f"inotify_add_watch failed for {path}")
+        self._paths[wd] = path
+
+    def _add_tree(self, top):
+        self._add(top)
+        for root, dirs, files in os.walk(top):
+            # Build output, VCS and IDE folders change a lot and hold no sources
+            dirs[:] = [d for d in dirs if not ignored_dir(d)]
+            for d in dirs:
+                self._add(os.path.join(root, d))
+
+    def _read(self, timeout):
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return b""
+        try:
+            return os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return b""
+
+    def wait(self, timeout):
+        changed = set()
+        data = self._read(timeout)
+        while data:
+            offset = 0
+            while offset < len(data):
+                wd, mask, cookie, length = _EVENT.unpack_from(data, offset)
+                offset += _EVENT.size
+                name = os.fsdecode(data[offset:offset + length].rstrip(b"\0"))
+                offset += length
+                if mask & IN_Q_OVERFLOW:
+                    # Lost events: regrade everyone
+                    changed.update(n for n in os.listdir(self.root_dir))
+                    continue
+                if mask & IN_IGNORED:
+                    self._paths.pop(wd, None)
+                    continue
+                parent = self._paths.get(wd)
+                if parent is None:
+                    continue
+                is_dir = bool(mask & IN_ISDIR)
+                path = os.path.join(parent, name) if name else parent
+                if is_dir and mask & (IN_CREATE | IN_MOVED_TO) and not ignored_dir(name):
+                    self._add_tree(path)
+                if name and not _is_relevant(name, is_dir):
+                    continue
+                student = _top_level(self.root_dir, path)
+                if student:
+                    changed.add(student)
+            data = self._read(0)
+        return changed
+
+    def close(self):
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def make_watcher(root_dir):
+    if sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(root_dir)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(root_dir)
+
+def watch(root_dir, regrade, interval=POLL_INTERVAL):
+    # Calls regrade(sorted student folder names) whenever their sources change.
+    # Runs until interrupted with Ctrl+C.
+    watcher = make_watcher(root_dir)
+    mode = "inotify" if isinstance(watcher, InotifyWatcher) else "polling"
+    print(f"Watching {root_dir} for changes ({mode}). Tekan Ctrl+C untuk berhenti.")
+    try:
+        while True:
+            changed = watcher.wait(interval)
+            if not changed:
+                continue
+            if isinstance(watcher, InotifyWatcher):
+                changed |= watcher.wait(DEBOUNCE)
+            regrade(sorted(changed))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
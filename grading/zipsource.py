@@ -0,0 +1,200 @@
+import io
+import os
+import zlib
+import zipfile
+
+from grading.index import SubmissionIndex
+
+# Zip input: grade the LMS download directly, without extracting it.
+#
+# A path such as "downloads/cohort.zip/Alice_123" points inside the archive.
+# The folder tree is built from the member names in the central directory
+# only; a member's bytes are read when a grader actually asks for that file.
+# A zip inside the archive (the usual "one zip per student" upload) shows up
+# as a folder named after it and is opened in memory the first time that
+# folder is visited.
+
+MAX_NESTED_BYTES = 64 * 1024 * 1024     # a nested zip loaded into memory
+MAX_NESTING = 3
+IGNORED = ("__macosx",)                 # resource forks added by macOS Archive Utility
+
+_READ_ERRORS = (zipfile.BadZipFile, zlib.error, RuntimeError, NotImplementedError, EOFError)
+
+
+class _Node:
+    __slots__ = ("dirs", "files", "nested")
+
+    def __init__(self):
+        self.dirs = {}       # name -> _Node
+        self.files = {}      # name -> (archive, ZipInfo)
+        self.nested = []     # (archive, ZipInfo) of zips that expand into this folder
+
+
+class _Archive:
+    def __init__(self, source, depth=0):
+        self.zf = zipfile.ZipFile(source)
+        self.depth = depth
+        self.tree = _Node()
+        for info in self.zf.infolist():
+            self._add(info)
+
+    def _add(self, info):
+        parts = [p for p in info.filename.replace("\\", "/").split("/") if p not in ("", ".", "..")]
+        if not parts or parts[0].lower() in IGNORED:
+            return
+        node = self.tree
+        for part in parts[:-1]:
+            node = node.dirs.setdefault(part, _Node())
+        name = parts[-1]
+        if info.is_dir():
+            node.dirs.setdefault(name, _Node())
+        elif name.lower().endswith(".zip") and self.depth < MAX_NESTING:
+            node.dirs.setdefault(name[:-4], _Node()).nested.append((self, info))
+        else:
+            node.files.setdefault(name, (self, info))
+
+    def read(self, info, limit):
+        try:
+            with self.zf.open(info) as f:
+                return f.read(limit)
+        except _READ_ERRORS as e:
+            raise OSError(f"{info.filename}: {e}") from e
+
+
+_archives = {}
+
+
+def open_archive(zip_path):
+    # Central directories are parsed once per process. The pid is part of the
+    # stamp: a forked pool worker must not share the parent's file offset.
+    key = os.path.abspath(zip_path)
+    st = os.stat(key)
+    stamp = (os.getpid(), st.st_mtime_ns, st.st_size)
+    cached = _archives.get(key)
+    if cached is None or cached[0] != stamp:
+        cached = _archives[key] = (stamp, _Archive(key))
+    return cached[1]
+
+def forget_archive(zip_path):
+    # Drops a parsed archive, e.g. an upload the grading server is done with
+    cached = _archives.pop(os.path.abspath(zip_path), None)
+    if cached is not None:
+        cached[1].zf.close()
+
+def split_zip_path(path):
+    # "cohort.zip/Alice/src" -> ("cohort.zip", ["Alice", "src"]);
+    # None if no component of the path is a zip file on disk
+    parts = os.path.normpath(path).split(os.sep)
+    for i in range(1, len(parts) + 1):
+        head = os.sep.join(parts[:i]) or os.sep
+        if head.lower().endswith(".zip") and os.path.isfile(head):
+            return head, parts[i:]
+    return None
+
+def _expand(node):
+    # The folder as seen after opening the zips that expand into it. Builds a
+    # new node, so the shared tree never holds nested archive bytes.
+    if not node.nested:
+        return node
+    merged = _Node()
+    merged.dirs.update(node.dirs)
+    merged.files.update(node.files)
+    for archive, info in node.nested:
+        if info.file_size > MAX_NESTED_BYTES:
+            continue
+        try:
+            data = archive.read(info, MAX_NESTED_BYTES + 1)
+            if len(data) > MAX_NESTED_BYTES:
+                continue
+            inner = _Archive(io.BytesIO(data), archive.depth + 1).tree
+        except (OSError, zipfile.BadZipFile):
+            continue
+        merged = _merge(merged, inner)
+    return merged
+
+def _merge(a, b):
+    node = _Node()
+    node.dirs.update(a.dirs)
+    node.files.update(a.files)
+    node.nested = a.nested + b.nested
+    for name, child in b.dirs.items():
+        node.dirs[name] = _merge(node.dirs[name], child) if name in node.dirs else child
+    for name, member in b.files.items():
+        node.files.setdefault(name, member)
+    return node
+
+def _resolve(path):
+    split = split_zip_path(path)
+    if split is None:
+        return None
+    zip_path, parts = split
+    try:
+        node = open_archive(zip_path).tree
+    except (OSError, zipfile.BadZipFile):
+        return None
+    for part in parts:
+        node = _expand(node).dirs.get(part)
+        if node is None:
+            return None
+    return _expand(node)
+
+def zip_listdir(path):
+    # (folder names, file names) of a folder inside a zip; None if the path
+    # is not inside a zip or does not exist there
+    node = _resolve(path)
+    if node is None:
+        return None
+    return list(node.dirs), list(node.files)
+
+
+class ZipIndex(SubmissionIndex):
+    # SubmissionIndex over a folder inside a zip. Same lookups, same walk
+    # order (archive order within a folder), same limits; file contents are
+    # read from the archive instead of open().
+
+    def __init__(self, root):
+        self._nodes = {}
+        self._members = {}
+        super().__init__(root)
+
+    def _exists(self, root):
+        node = _resolve(root)
+        if node is None:
+            return False
+        self._nodes[root] = node
+        return True
+
+    def _list(self, path):
+        node = _expand(self._nodes.pop(path))
+        entries = []
+        for name, child in node.dirs.items():
+            full_path = os.path.join(path, name)
+            self._nodes[full_path] = child
+            entries.append((name, full_path, True, True))
+        for name, member in node.files.items():
+            full_path = os.path.join(path, name)
+            self._members[full_path] = member
+            entries.append((name, full_path, False, False))
+        return entries
+
+    def _read(self, path, limit):
+        member = self._members.get(path)
+        if member is None:
+            raise FileNotFoundError(path)
+        archive, info = member
+        return archive.read(info, limit)
+
+    def local_files(self, paths, scratch_dir):
+        # javac needs real files: write just these members under scratch_dir
+        local = []
+        for path in paths:
+            target = os.path.join(scratch_dir, os.path.relpath(path, self.root))
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            try:
+                data = self.read_bytes(path)
+            except OSError:
+                continue
+            with open(target, "wb") as f:
+                f.write(data)
+            local.append(target)
+        return local
@@ -0,0 +1,7 @@
+package Model;
+public class Costumer {
+  private String name; private Vehicle vehicle;
+  public Costumer(String name, Vehicle vehicle) { this.name = name; }
+  public double getTotalPrice() { return vehicle.getPrice(); }
+  public void showDetail() { vehicle.showDetail(); }
+}
@@ -0,0 +1,7 @@
+package Model;
+public class Vehicle {
+  private String brand; private int year; private VehicleType type; private double price;
+  public Vehicle(String brand, int year, VehicleType type, double price) { this.brand = brand; }
+  public double getPrice() { return price; }
+  public void showDetail() { System.out.println(brand); }
+}
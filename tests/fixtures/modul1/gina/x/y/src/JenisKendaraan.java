@@ -0,0 +1 @@
+enum JenisKendaraan { MOBIL, MOTOR, TRUK }
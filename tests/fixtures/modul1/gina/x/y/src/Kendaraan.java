@@ -0,0 +1,2 @@
+public class Kendaraan { String merk; int tahun; JenisKendaraan jenis; long harga;
+ Kendaraan(String m) {} void showDetail() {} }
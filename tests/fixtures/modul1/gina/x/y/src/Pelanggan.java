@@ -0,0 +1,2 @@
+public class Pelanggan { String nama; Kendaraan kendaraan; Pelanggan(String n){} int getTotalHarga(){ return harga; } }
+// caf
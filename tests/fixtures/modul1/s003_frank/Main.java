@@ -0,0 +1,69 @@
+public class Main {
+
+    enum VehicleType {
+        CAR,
+        MOTORCYCLE,
+        TRUCK
+    }
+
+
+        private int year;
+        private VehicleType type;
+        private double price;
+            this.year = year;
+        public String getBrand() {
+            return brand;
+        }
+
+        public int getYear() {
+            return year;
+        }
+
+
+            return price;
+
+        public void showDetails() {
+            System.out.println("Brand: " + brand);
+            System.out.println("Year: " + year);
+            System.out.println("Price: $" + price);
+        }
+    }
+
+
+
+            this.name = name;
+            this.vehicle = vehicle;
+
+        public double getTotalPrice() {
+            return vehicle.getPrice();
+        }
+
+            vehicle.showDetails();
+        }
+
+
+        Vehicle vehicleSupraBapak = new Vehicle("Honda Supra", 1998, VehicleType.MOTORCYCLE, 3000.0);
+        Vehicle vehicleKalcer = new Vehicle("VW Beetle", 1998, VehicleType.CAR, 200000.0);
+        Vehicle vehicleGuede = new Vehicle("Isuzu Giga", 2011, VehicleType.TRUCK, 300000.0);
+
+
+
+        System.out.println("Enter customer names:");
+        System.out.print("Enter customer 1 name: ");
+        String name1 = scanner.nextLine();
+        System.out.print("Enter customer 2 name: ");
+        String name2 = scanner.nextLine();
+        System.out.print("Enter customer 3 name: ");
+        String name3 = scanner.nextLine();
+
+
+        Customer customer1 = new Customer(name1, vehicleSupraBapak);
+
+        System.out.println("\n====== Customer Service ======");
+        System.out.println("Customer 1:");
+        System.out.println("Customer 2:");
+        customer2.showDetails();
+        customer3.showDetails();
+        scanner.close();
+    }
+}
@@ -0,0 +1,5 @@
+package Model;
+public class Costumer {
+  private String name; private Vehicle vehicle;
+  public double getTotalPrice() { return vehicle.getPrice(); }
+}
@@ -0,0 +1,4 @@
+public class Vehicle {
+  private String brand; private int year; private VehicleType type; private double price;
+  public Vehicle(String brand, int year, VehicleType type, double price) { this.brand = brand; }
+  public void showDetail() { System.out.println(brand); }
@@ -0,0 +1,5 @@
+public class Costumer {
+  private String name; private Vehicle vehicle;
+  public Costumer(String name, Vehicle vehicle) { this.name = name; }
+  public double getTotalPrice() { return vehicle.getPrice(); }
+}
@@ -0,0 +1 @@
+public enum VehicleType { CAR, MOTORCYCLE, TRUCK }
@@ -0,0 +1 @@
+public class Main { public static void main(String[] a) { Vehicle v = new Vehicle("x", 1, VehicleType.CAR, 2.0); Costumer c = new Costumer("n", v); c.showDetail(); } }
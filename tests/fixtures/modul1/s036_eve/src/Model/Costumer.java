@@ -0,0 +1,4 @@
+package Model;
+public class Costumer {
+  private String name; private Vehicle vehicle;
+  public void showDetail() { vehicle.showDetail(); }
@@ -0,0 +1,5 @@
+package Model;
+public class Vehicle {
+  public double getPrice() { return price; }
+  public void showDetail() { System.out.println(brand); }
+}
@@ -0,0 +1,5 @@
+package Model;
+public class Costumer {
+  public double getTotalPrice() { return vehicle.getPrice(); }
+  public void showDetail() { vehicle.showDetail(); }
+}
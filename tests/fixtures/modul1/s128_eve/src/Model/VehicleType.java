@@ -0,0 +1,2 @@
+package Model;
+public enum VehicleType { CAR, MOTORCYCLE, TRUCK }
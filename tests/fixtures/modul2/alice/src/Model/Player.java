@@ -0,0 +1,24 @@
+package Model;
+import java.util.UUID;
+import java.time.LocalDateTime;
+public class Player implements ShowDetail {
+    private UUID playerId;
+    private String username;
+    private int highScore;
+    private int totalCoins;
+    private int totalDistance;
+    private LocalDateTime createdAt;
+    public Player(String username) {
+        this.playerId = UUID.randomUUID();
+        this.username = username;
+        this.createdAt = LocalDateTime.now();
+        this.highScore = 0;
+    }
+    public void updateHighScore(int newScore) {
+        if (newScore > highScore) { highScore = newScore; }
+    }
+    public void addCoins(int coins) { totalCoins += coins; }
+    public void addDistance(int d) { totalDistance += d; }
+    @Override
+    public void showDetail() { System.out.println("Player " + username); }
+}
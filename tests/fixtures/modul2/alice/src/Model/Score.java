@@ -0,0 +1,12 @@
+package Model;
+import java.util.UUID;
+public class Score implements ShowDetail {
+    private UUID scoreId; private UUID playerId; private int value; private int coinsCollected;
+    public Score(UUID playerId, int value, int coinsCollected) {
+        this.scoreId = UUID.randomUUID();
+        this.playerId = playerId;
+        this.value = value;
+        this.coinsCollected = coinsCollected;
+    }
+    public void showDetail() { System.out.println(value); }
+}
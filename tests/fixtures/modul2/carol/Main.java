@@ -0,0 +1,2 @@
+class Player { private int highScore; }
+public class Main { public static void main(String[] a) { new Player(); new Score(); ShowDetail(); } }
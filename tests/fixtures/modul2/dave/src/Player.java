@@ -0,0 +1,4 @@
+public class Player {
+  private int a = 0; private int b; private float c;
+  void showdetail() { System.out.println("x"); }
+}
@@ -0,0 +1,6 @@
+import java.util.UUID;
+    private UUID scoreId; private UUID playerId; private int value; private int coinsCollected;
+    public Score(UUID playerId, int value, int coinsCollected) {
+        this.playerId = playerId;
+    }
+    public void showDetail() { System.out.println(value); }
@@ -0,0 +1,17 @@
+import java.util.UUID;
+import java.time.LocalDateTime;
+public class Player implements ShowDetail {
+    private UUID playerId;
+    private String username;
+    private int highScore;
+    private int totalDistance;
+    private LocalDateTime createdAt;
+        this.playerId = UUID.randomUUID();
+        this.username = username;
+        this.highScore = 0;
+    }
+        if (newScore > highScore) { highScore = newScore; }
+    }
+    public void addDistance(int d) { totalDistance += d; }
+    public void showDetail() { System.out.println("Player " + username); }
+}
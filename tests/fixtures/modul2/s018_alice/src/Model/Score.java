@@ -0,0 +1,9 @@
+package Model;
+public class Score implements ShowDetail {
+    public Score(UUID playerId, int value, int coinsCollected) {
+        this.scoreId = UUID.randomUUID();
+        this.playerId = playerId;
+        this.value = value;
+        this.coinsCollected = coinsCollected;
+    }
+}
@@ -0,0 +1,5 @@
+import Model.*;
+  Player p1 = new Player("a"); Player p2 = new Player("b");
+  Score s1 = new Score(p1.getId(), 10, 2);
+  p1.updateHighScore(10); p1.addCoins(3); p1.showDetail();
+}}
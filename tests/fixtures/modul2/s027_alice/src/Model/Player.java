@@ -0,0 +1,18 @@
+package Model;
+import java.time.LocalDateTime;
+public class Player implements ShowDetail {
+    private String username;
+    private int highScore;
+    private int totalCoins;
+    private int totalDistance;
+    private LocalDateTime createdAt;
+        this.playerId = UUID.randomUUID();
+        this.createdAt = LocalDateTime.now();
+        this.highScore = 0;
+    public void updateHighScore(int newScore) {
+        if (newScore > highScore) { highScore = newScore; }
+    }
+    public void addCoins(int coins) { totalCoins += coins; }
+    @Override
+    public void showDetail() { System.out.println("Player " + username); }
+}
@@ -0,0 +1,7 @@
+public class Score implements ShowDetail {
+    private UUID scoreId; private UUID playerId; private int value; private int coinsCollected;
+    public Score(UUID playerId, int value, int coinsCollected) {
+        this.scoreId = UUID.randomUUID();
+        this.coinsCollected = coinsCollected;
+    public void showDetail() { System.out.println(value); }
+}
@@ -0,0 +1,4 @@
+import Model.*;
+public class Main { public static void main(String[] a) {
+  Player p1 = new Player("a"); Player p2 = new Player("b");
+}}
@@ -0,0 +1,16 @@
+package Model;
+import java.util.UUID;
+public class Player implements ShowDetail {
+    private String username;
+    private int highScore;
+    private int totalCoins;
+    private int totalDistance;
+    private LocalDateTime createdAt;
+        this.playerId = UUID.randomUUID();
+        this.username = username;
+        this.createdAt = LocalDateTime.now();
+        this.highScore = 0;
+    public void updateHighScore(int newScore) {
+        if (newScore > highScore) { highScore = newScore; }
+    }
+}
@@ -0,0 +1,9 @@
+package Model;
+import java.util.UUID;
+    private UUID scoreId; private UUID playerId; private int value; private int coinsCollected;
+    public Score(UUID playerId, int value, int coinsCollected) {
+        this.value = value;
+        this.coinsCollected = coinsCollected;
+    }
+    public void showDetail() { System.out.println(value); }
+}
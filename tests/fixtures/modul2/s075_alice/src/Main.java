@@ -0,0 +1,3 @@
+import Model.*;
+  p1.updateHighScore(10); p1.addCoins(3); p1.showDetail();
+}}
@@ -0,0 +1,8 @@
+package Model;
+import java.util.UUID;
+public class Score implements ShowDetail {
+    public Score(UUID playerId, int value, int coinsCollected) {
+        this.playerId = playerId;
+        this.value = value;
+    public void showDetail() { System.out.println(value); }
+}
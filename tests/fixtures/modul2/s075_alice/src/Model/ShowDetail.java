@@ -0,0 +1 @@
+public interface ShowDetail { void showDetail(); }
@@ -0,0 +1,4 @@
+import Model.*;
+public class Main { public static void main(String[] a) {
+  Score s1 = new Score(p1.getId(), 10, 2);
+  p1.updateHighScore(10); p1.addCoins(3); p1.showDetail();
@@ -0,0 +1,20 @@
+package Model;
+import java.time.LocalDateTime;
+public class Player implements ShowDetail {
+    private UUID playerId;
+    private int highScore;
+    private int totalCoins;
+    private int totalDistance;
+    private LocalDateTime createdAt;
+    public Player(String username) {
+        this.playerId = UUID.randomUUID();
+        this.username = username;
+        this.highScore = 0;
+    }
+    public void updateHighScore(int newScore) {
+    }
+    public void addCoins(int coins) { totalCoins += coins; }
+    public void addDistance(int d) { totalDistance += d; }
+    @Override
+    public void showDetail() { System.out.println("Player " + username); }
+}
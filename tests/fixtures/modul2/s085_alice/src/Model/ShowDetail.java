@@ -0,0 +1,2 @@
+package Model;
+public interface ShowDetail { void showDetail(); }
@@ -0,0 +1,3 @@
+package model;
+    int highscore; long coins; double dist;
+    String id = UUID.toString();
@@ -0,0 +1,24 @@
+import os
+import csv
+
+import pytest
+
+from grading.cli import main
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+def students(path):
+    with open(path, encoding="utf-8", newline="") as f:
+        return sorted(row["student"] for row in csv.DictReader(f))
+
+
+@pytest.mark.parametrize("mode", [[], ["--stream"]])
+def test_resumed_students_in_format_output(tmp_path, mode, capsys):
+    root = os.path.join(FIXTURES, "modul2")
+    checkpoint = str(tmp_path / "run.jsonl")
+    common = [root, "--no-cache", "--no-report", "--checkpoint", checkpoint, "--format", "csv"] + mode
+    main(common + ["--output", str(tmp_path / "first.csv")])
+    # Resume with everyone already graded: the output still lists them all
+    main(common + ["--output", str(tmp_path / "resumed.csv")])
+    assert students(tmp_path / "resumed.csv") == students(tmp_path / "first.csv") == sorted(os.listdir(root))
@@ -0,0 +1,37 @@
+import os
+
+from grading import index
+from grading.index import SubmissionIndex
+
+
+def make_tree(root, folders, files_per_folder):
+    for folder in folders:
+        os.makedirs(os.path.join(root, folder), exist_ok=True)
+        for i in range(files_per_folder):
+            open(os.path.join(root, folder, f"F{i}.java"), "w").close()
+
+
+def test_limit_reached_exactly_then_folders_left(tmp_path, monkeypatch):
+    # "a" and its three entries make exactly the limit; "a/b" is skipped
+    monkeypatch.setattr(index, "MAX_ENTRIES", 4)
+    make_tree(tmp_path, ["a"], 2)
+    make_tree(tmp_path, ["a/b"], 1)
+    found = SubmissionIndex(str(tmp_path))
+    assert found.find_file("F0.java", under=str(tmp_path / "a" / "b")) is None
+    assert found.notes == ["[!] Warning: Submission berisi lebih dari 4 file/folder, sisanya tidak dinilai."]
+
+
+def test_limit_reached_exactly_nothing_left(tmp_path, monkeypatch):
+    monkeypatch.setattr(index, "MAX_ENTRIES", 4)
+    make_tree(tmp_path, ["a"], 3)
+    found = SubmissionIndex(str(tmp_path))
+    assert len(list(found.files())) == 3
+    assert found.notes == []
+
+
+def test_limit_exceeded_noted_once(tmp_path, monkeypatch):
+    monkeypatch.setattr(index, "MAX_ENTRIES", 4)
+    make_tree(tmp_path, ["a", "b", "a/c"], 3)
+    found = SubmissionIndex(str(tmp_path))
+    assert len(list(found.files())) < 9
+    assert found.notes == ["[!] Warning: Submission berisi lebih dari 4 file/folder, sisanya tidak dinilai."]
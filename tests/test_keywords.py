@@ -0,0 +1,88 @@
+import os
+import re
+
+import pytest
+
+from grading.cli import load_module
+from grading.index import open_index
+from grading.keywords import KeywordScanner, required_literals
+from grading.lexer import lex
+from grading.rubric import Check, Rubric
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+RUBRICS = [load_module(name).RUBRIC for name in ("modul1", "modul2")]
+
+
+def java_texts():
+    texts = []
+    for root, _, files in os.walk(FIXTURES):
+        for name in sorted(files):
+            if name.endswith(".java"):
+                with open(os.path.join(root, name), encoding="utf-8", errors="replace") as f:
+                    texts.append(f.read())
+    return texts
+
+def variants(text):
+    # Case changes, and the non-ASCII letters an IGNORECASE regex folds
+    return [text, text.upper(), text.lower(), text.replace("i", "ı").replace("s", "ſ"),
+            text.replace("I", "İ")]
+
+def runnable(check, text):
+    if check.literals is None:
+        return True
+    return KeywordScanner(check.literals[0]).scan(text).any(check.literals)
+
+
+@pytest.mark.parametrize("pattern,flags,expected", [
+    (r'\baddCoins\(', 0, ({"addCoins"}, False)),
+    (r'(int|long|double|float)\s+\w+', 0, ({"int", "long", "double", "float"}, False)),
+    (r'(public\s+)?void\s+run', 0, ({"void"}, False)),
+    (r'a{0,3}bc', 0, ({"bc"}, False)),
+    (r'(foo|\w+)bar', 0, ({"bar"}, False)),
+    (r'uuid', re.IGNORECASE, ({"uuid"}, True)),
+    (r'(?i:uuid)\.random', 0, ({"random"}, True)),
+    (r'[A-Z]\w*', 0, None),
+    (r'(x|\d)+', 0, None),
+])
+def test_required_literals(pattern, flags, expected):
+    found = required_literals(pattern, flags)
+    if expected is None:
+        assert found is None
+    else:
+        assert found == (frozenset(expected[0]), expected[1])
+
+def test_contains_uses_longest_word():
+    assert required_literals("this.highScore", literal=True) == (frozenset(["highScore"]), False)
+    assert required_literals("+=", literal=True) is None
+
+
+@pytest.mark.parametrize("rubric", RUBRICS, ids=lambda r: r.name)
+def test_prefilter_never_skips_a_match(rubric):
+    for text in java_texts():
+        for variant in variants(text):
+            source = None
+            for check in rubric.checks:
+                if runnable(check, variant):
+                    continue
+                if source is None:
+                    source = lex(variant)
+                assert check.run(source) == check.miss(), (check.name, variant[:200])
+
+def test_ignorecase_folded_letters():
+    check = Check("c", "t", r'\bclass\s+\w+', re.IGNORECASE)
+    assert runnable(check, "publıc claſſ Player {}")
+    assert runnable(check, "PUBLİC CLASS PLAYER {}")
+    assert not runnable(Check("c", "t", r"\bclass\b"), "claſſ Player {}")
+
+
+@pytest.mark.parametrize("module", ["modul1", "modul2"])
+def test_outcomes_match_unfiltered_run(module, monkeypatch):
+    grader = load_module(module)
+    root = os.path.join(FIXTURES, module)
+    inputs = []
+    for name in sorted(os.listdir(root)):
+        path = os.path.join(root, name)
+        inputs.append(grader.read_inputs(path, open_index(path)))
+    filtered = [grader.RUBRIC.evaluate(contents, facts) for contents, facts in inputs]
+    monkeypatch.setattr(Rubric, "_prefilter", lambda self, target, content, outcomes: self._by_target[target])
+    assert [grader.RUBRIC.evaluate(contents, facts) for contents, facts in inputs] == filtered
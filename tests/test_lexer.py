@@ -0,0 +1,159 @@
+import time
+
+import pytest
+
+from grading.lexer import lex, strip
+
+
+PLAYER = """
+package Model;
+
+import java.util.UUID;
+
+public class Player implements ShowDetail {
+    private UUID id = UUID.randomUUID();
+    private int highScore = 0, coins;
+    private String name;
+
+    public Player(String name) {
+        this.name = name;
+    }
+
+    public void addCoins(int amount) {
+        coins += amount;
+        System.out.println("coins: " + coins);
+    }
+
+    public abstract int total();
+}
+"""
+
+
+def test_declarations():
+    source = lex(PLAYER)
+    assert source.types == ["public class Player implements ShowDetail"]
+    assert source.fields == [
+        "private UUID id = UUID.randomUUID();",
+        "private int highScore = 0;",
+        "private int coins;",
+        "private String name;",
+    ]
+    assert source.methods == ["public void addCoins(int amount)", "public abstract int total();"]
+    assert source.constructors == ["public Player(String name) { this.name = name; }"]
+    assert source.calls == ["UUID.randomUUID(", "System.out.println("]
+
+
+def test_comments_and_strings_are_stripped():
+    source = lex('class A {\n    // int commented;\n    /* void hidden() {} */\n    String s = "int fake;";\n}\n')
+    assert source.fields == ['String s = "";']
+    assert source.methods == []
+    assert strip('a = "x // y"; // z\nb = 1;') == 'a = "";  \nb = 1;'
+
+
+def test_anonymous_class_in_method_body():
+    source = lex("""
+class A {
+    private int x;
+    public void go() {
+        int local = 1;
+        Runnable r = new Runnable() {
+            public void run() { helper(); }
+        };
+        String after = "";
+        r.run();
+    }
+    public void other() {}
+}
+""")
+    # The method body is one block: its locals are not fields
+    assert source.fields == ["private int x;"]
+    assert source.methods == ["public void go()", "public void other()"]
+    assert source.calls == ["new Runnable(", "helper(", "r.run("]
+
+
+def test_local_class_in_method_body():
+    source = lex("""
+class A {
+    void go() {
+        class Local { public int value() { return 1; } }
+        int count = new Local().value();
+    }
+}
+""")
+    assert source.fields == []
+    assert source.methods == ["void go()"]
+
+
+def test_missing_closing_brace_recovers_at_next_member():
+    source = lex("""
+public class Player {
+    private int highScore;
+    public void updateHighScore(int score) {
+        if (score > highScore) { highScore = score; }
+    public void addCoins(int coins) { total += coins; }
+    private int total;
+}
+""")
+    assert source.methods == ["public void updateHighScore(int score)", "public void addCoins(int coins)"]
+    assert source.fields == ["private int highScore;", "private int total;"]
+
+
+def test_missing_class_header():
+    source = lex("""
+package Model;
+    private String username;
+    public void showDetail() { System.out.println(username); }
+}
+""")
+    assert source.fields == ["private String username;"]
+    assert source.methods == ["public void showDetail()"]
+
+
+def test_annotations_are_not_calls():
+    source = lex("""
+class A {
+    @SuppressWarnings("unused")
+    @org.junit.jupiter.api.DisplayName("x")
+    public void run() { go(); }
+}
+""")
+    assert source.calls == ["go("]
+    assert source.methods == ["public void run()"]
+
+
+def test_enum_constant_arguments_are_not_calls():
+    source = lex("""
+public enum VehicleType {
+    CAR("Mobil", 4), TRUCK("Truk", 6);
+    VehicleType(String label, int wheels) { this.label = label; }
+    private final String label;
+}
+""")
+    assert source.calls == []
+    assert source.types == ["public enum VehicleType"]
+    assert source.fields == ["private final String label;"]
+    assert source.constructors == ["VehicleType(String label, int wheels) { this.label = label; }"]
+
+
+def test_new_array_and_generic_instances():
+    source = lex("""
+class A {
+    void go() {
+        int[] slots = new int[3];
+        Vehicle[] fleet = new Vehicle [2];
+        List<String> names = new ArrayList<>();
+        Model.Player p = new Model.Player("a");
+    }
+}
+""")
+    assert source.calls == ["new int[", "new Vehicle[", "new ArrayList(", "new Model.Player("]
+
+
+@pytest.mark.parametrize("line", ['System.out.println("x" + f(i);\n', "a(", "new int[3]; "])
+def test_unclosed_calls_lex_in_linear_time(line):
+    # Every unclosed paren used to scan to the end of the file
+    text = "class A {\n    void m() {\n" + line * (100000 // len(line)) + "    }\n}\n"
+    start = time.perf_counter()
+    source = lex(text)
+    assert time.perf_counter() - start < 2
+    assert source.methods == ["void m()"]
@@ -0,0 +1,65 @@
+import os
+import json
+
+import pytest
+
+from grading.cli import grade_student, load_module, main
+from grading.store import ResultStore
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+MODULES = ["modul1", "modul2"]
+
+
+def records(path):
+    with open(path, encoding="utf-8") as f:
+        return sorted((json.loads(line) for line in f), key=lambda record: record["student"])
+
+def grade(module, db, output, *extra):
+    main([os.path.join(FIXTURES, module), "--module", module, "--db", db, "--no-cache",
+          "--format", "jsonl", "--output", output, "--no-report", *extra])
+
+def rescore(module, db, output):
+    main(["--module", module, "--db", db, "--rescore", "--format", "jsonl", "--output", output, "--no-report"])
+
+
+@pytest.mark.parametrize("module", MODULES)
+def test_score_from_outcomes_equals_grade(module):
+    rubric = load_module(module).RUBRIC
+    root = os.path.join(FIXTURES, module)
+    for name in sorted(os.listdir(root)):
+        result = grade_student(os.path.join(root, name), module, report=False)
+        again = rubric.score(result.outcomes)
+        assert (again.total, again.details, again.sections, again.criteria) == \
+               (result.total, result.details, result.sections, result.criteria)
+
+
+@pytest.mark.parametrize("module", MODULES)
+def test_rescore_equals_fresh_grade(module, tmp_path, capsys):
+    db = str(tmp_path / "grades.sqlite")
+    grade(module, db, str(tmp_path / "graded.jsonl"))
+    rescore(module, db, str(tmp_path / "rescored.jsonl"))
+    assert records(tmp_path / "rescored.jsonl") == records(tmp_path / "graded.jsonl")
+
+    store = ResultStore(db, readonly=True)
+    assert store.scores(2) == store.scores(1)
+    assert store.criteria(2) == store.criteria(1)
+    for student in store.scores(1):
+        assert store.details(2, student) == store.details(1, student)
+    store.close()
+
+
+@pytest.mark.parametrize("module", MODULES)
+def test_rescore_with_new_weights_equals_fresh_grade(module, tmp_path, monkeypatch, capsys):
+    db = str(tmp_path / "grades.sqlite")
+    grade(module, db, str(tmp_path / "before.jsonl"))
+
+    # Reweighting leaves the checks alone, so the stored outcomes still apply
+    weights = load_module(module).RUBRIC.weights
+    for key in weights:
+        monkeypatch.setitem(weights, key, weights[key] * 2 + 1)
+    rescore(module, db, str(tmp_path / "rescored.jsonl"))
+    grade(module, db, str(tmp_path / "graded.jsonl"))
+
+    rescored = records(tmp_path / "rescored.jsonl")
+    assert rescored == records(tmp_path / "graded.jsonl")
+    assert rescored != records(tmp_path / "before.jsonl")
@@ -0,0 +1,61 @@
+import os
+import re
+import time
+
+import pytest
+
+from grading import cli
+from grading.cache import ResultCache
+from grading.cli import find_student_folders, grade_student, load_module
+from grading.index import open_index
+from grading.rubric import TIMEOUT_NOTE
+
+# Reports of the original grade.py / grade_modul1_v2.py over the fixture
+# submissions; the declarative rubrics have to reproduce them line for line
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+REPORT = re.compile(r"REPORT FOR: (\S+)\n=+\n(.*?)-{40}\nTOTAL SCORE: ([\d.]+)", re.S)
+
+
+def baseline(module):
+    with open(os.path.join(FIXTURES, f"{module}.baseline.txt"), encoding="utf-8") as f:
+        text = f.read()
+    return {m.group(1): (m.group(2).splitlines(), m.group(3)) for m in REPORT.finditer(text)}
+
+def students(module):
+    root = os.path.join(FIXTURES, module)
+    return [(module, os.path.join(root, name)) for name in find_student_folders(root)]
+
+
+@pytest.mark.parametrize("module,student_path", students("modul1") + students("modul2"))
+def test_rubric_matches_baseline(module, student_path):
+    details, total = baseline(module)[os.path.basename(student_path)]
+    result = grade_student(student_path, module, report=False)
+    assert result.details == details
+    assert f"{result.total:.2f}" == total
+
+
+@pytest.mark.parametrize("module", ["modul1", "modul2"])
+def test_every_fixture_has_a_baseline(module):
+    names = [os.path.basename(path) for _, path in students(module)]
+    assert sorted(baseline(module)) == names
+
+
+@pytest.mark.parametrize("module", ["modul1", "modul2"])
+def test_checks_past_deadline_count_as_misses(module):
+    grader = load_module(module)
+    student_path = students(module)[0][1]
+    contents, facts = grader.read_inputs(student_path, open_index(student_path))
+    assert grader.RUBRIC.evaluate(contents, facts, deadline=time.monotonic() + 60) == grader.RUBRIC.evaluate(contents, facts)
+    outcomes = grader.RUBRIC.evaluate(contents, facts, deadline=time.monotonic() - 1)
+    assert outcomes["timed_out"]
+    assert outcomes["notes"] == [TIMEOUT_NOTE]
+    assert all(outcomes[check.name] == check.miss() for check in grader.RUBRIC.checks)
+
+
+def test_timed_out_result_is_reported_and_not_cached(tmp_path, monkeypatch):
+    monkeypatch.setattr(cli, "TIME_BUDGET", -1)
+    cache = ResultCache(str(tmp_path))
+    student_path = students("modul2")[0][1]
+    result = grade_student(student_path, "modul2", cache=cache, report=False)
+    assert result.details[-1] == TIMEOUT_NOTE
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,34 @@
+import types
+
+import pytest
+
+from grading import cli
+from grading.runner import grade_many
+
+
+def shout(path, facts=None):
+    # The worker sees only its own student's facts
+    return (path.upper(), facts)
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_task_kwargs_reach_only_their_task(jobs):
+    facts = {path: {"junit_ran": path} for path in ("a", "b", "c")}
+    results = list(grade_many(shout, ["a", "b", "c"], jobs, lambda path: {"facts": facts[path]}))
+    assert [(path, score, error) for path, score, _, error in results] == [
+        ("a", ("A", {"junit_ran": "a"}), None),
+        ("b", ("B", {"junit_ran": "b"}), None),
+        ("c", ("C", {"junit_ran": "c"}), None),
+    ]
+
+
+def test_pool_tasks_get_their_own_stage_facts(monkeypatch):
+    calls = []
+    monkeypatch.setattr(cli, "grade_many", lambda grade_fn, paths, jobs, task_kwargs: calls.append((grade_fn, task_kwargs)))
+    args = types.SimpleNamespace(module="modul2", pipeline=None, no_report=True, jobs=4)
+    dynamic = {f"s{i}": {"junit_ran": True, "n": i} for i in range(100)}
+    cli.grade_paths(list(dynamic), dynamic, args)
+    (grade_fn, task_kwargs), = calls
+    # Nothing of the cohort is bound into the function pickled with every task
+    assert "extra_facts" not in grade_fn.keywords and "dynamic" not in grade_fn.keywords
+    assert task_kwargs("s7") == {"extra_facts": {"junit_ran": True, "n": 7}}